@@ -6,10 +6,15 @@ from fastapi.responses import JSONResponse
 from src.api.dependencies import exception_handler
 from src.api.routers import auth_router, dashboard_router
 from src.core.common.exceptions import GenericError
+from src.core.repositories.setting_repository import SettingsListener
 from src.core.services.chronos import Chronos
+from src.core.services.edge_server import close_async_client, close_session
+from src.core.services.retention import Retention
 from src.features.auth.auth_service import AuthService
 
 chronos = Chronos()
+retention = Retention()
+settings_listener = SettingsListener()
 
 auth_service = AuthService()
 app = FastAPI()
@@ -19,11 +24,22 @@ scheduler = AsyncIOScheduler()
 @app.on_event("startup")
 async def startup():
     auth_service.create_or_update_user()
+    settings_listener.start()
     scheduler.add_job(chronos.create_update_history, "cron", minute="*")
     scheduler.add_job(chronos.get_data_from_web, "cron", minute="*")
+    scheduler.add_job(retention.run, "cron", minute=30, max_instances=1)
     scheduler.start()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    scheduler.shutdown(wait=False)
+    settings_listener.stop()
+    await dashboard_router.dashboard_stream.stop()
+    close_session()
+    await close_async_client()
+
+
 @app.exception_handler(GenericError)
 async def generic_exception_handler(
     request: Request, exc: GenericError
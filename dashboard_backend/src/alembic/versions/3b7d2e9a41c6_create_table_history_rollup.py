@@ -0,0 +1,92 @@
+"""Create table history_rollup
+
+Revision ID: 3b7d2e9a41c6
+Revises: 8ef3c957fd59
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d2e9a41c6"
+down_revision: Union[str, None] = "8ef3c957fd59"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_FROM_HISTORY = """
+INSERT INTO history_rollup (
+    resolution, bucket_start, mode, count, chiller_on_minutes,
+    water_out_temp_sum, water_out_temp_min, water_out_temp_max,
+    return_temp_sum, return_temp_min, return_temp_max,
+    outside_temp_sum, outside_temp_min, outside_temp_max,
+    effective_setpoint_sum, cascade_fire_rate_sum
+)
+SELECT
+    '15m', date_bin('15 minutes', timestamp, TIMESTAMP '2000-01-01'), mode,
+    count(*),
+    sum(CASE WHEN chiller1_status = 1 OR chiller2_status = 1
+             OR chiller3_status = 1 OR chiller4_status = 1 THEN 1 ELSE 0 END),
+    sum(water_out_temp), min(water_out_temp), max(water_out_temp),
+    sum(return_temp), min(return_temp), max(return_temp),
+    sum(outside_temp), min(outside_temp), max(outside_temp),
+    sum(effective_setpoint), sum(cascade_fire_rate)
+FROM history
+GROUP BY 2, 3
+"""
+
+BACKFILL_FROM_ROLLUP = """
+INSERT INTO history_rollup (
+    resolution, bucket_start, mode, count, chiller_on_minutes,
+    water_out_temp_sum, water_out_temp_min, water_out_temp_max,
+    return_temp_sum, return_temp_min, return_temp_max,
+    outside_temp_sum, outside_temp_min, outside_temp_max,
+    effective_setpoint_sum, cascade_fire_rate_sum
+)
+SELECT
+    '{resolution}', date_trunc('{unit}', bucket_start), mode,
+    sum(count), sum(chiller_on_minutes),
+    sum(water_out_temp_sum), min(water_out_temp_min), max(water_out_temp_max),
+    sum(return_temp_sum), min(return_temp_min), max(return_temp_max),
+    sum(outside_temp_sum), min(outside_temp_min), max(outside_temp_max),
+    sum(effective_setpoint_sum), sum(cascade_fire_rate_sum)
+FROM history_rollup
+WHERE resolution = '{source}'
+GROUP BY 2, 3
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "history_rollup",
+        sa.Column("id", sa.INTEGER(), nullable=False),
+        sa.Column("resolution", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("mode", sa.INTEGER(), nullable=False),
+        sa.Column("count", sa.INTEGER(), nullable=False),
+        sa.Column("chiller_on_minutes", sa.INTEGER(), nullable=False),
+        sa.Column("water_out_temp_sum", sa.Float(), nullable=False),
+        sa.Column("water_out_temp_min", sa.REAL(), nullable=True),
+        sa.Column("water_out_temp_max", sa.REAL(), nullable=True),
+        sa.Column("return_temp_sum", sa.Float(), nullable=False),
+        sa.Column("return_temp_min", sa.REAL(), nullable=True),
+        sa.Column("return_temp_max", sa.REAL(), nullable=True),
+        sa.Column("outside_temp_sum", sa.Float(), nullable=False),
+        sa.Column("outside_temp_min", sa.REAL(), nullable=True),
+        sa.Column("outside_temp_max", sa.REAL(), nullable=True),
+        sa.Column("effective_setpoint_sum", sa.Float(), nullable=False),
+        sa.Column("cascade_fire_rate_sum", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("resolution", "bucket_start", "mode"),
+    )
+    # Build the rollups for the history that is already there
+    op.execute(BACKFILL_FROM_HISTORY)
+    op.execute(BACKFILL_FROM_ROLLUP.format(resolution="1h", unit="hour", source="15m"))
+    op.execute(BACKFILL_FROM_ROLLUP.format(resolution="1d", unit="day", source="1h"))
+
+
+def downgrade() -> None:
+    op.drop_table("history_rollup")
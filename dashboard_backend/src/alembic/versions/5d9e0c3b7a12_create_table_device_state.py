@@ -0,0 +1,117 @@
+"""Create table device_state
+
+Revision ID: 5d9e0c3b7a12
+Revises: a4c81f0d5e27
+Create Date: 2026-10-17 11:26:03.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d9e0c3b7a12"
+down_revision: Union[str, None] = "a4c81f0d5e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Relay number of each per-device table
+DEVICE_TABLES = {
+    "boiler": 0,
+    "chiller1": 1,
+    "chiller2": 2,
+    "chiller3": 3,
+    "chiller4": 4,
+    "winter_valve": 5,
+    "summer_valve": 6,
+}
+VALVE_TABLES = ("winter_valve", "summer_valve")
+BOILER_MEASUREMENTS = (
+    "system_supply_temp",
+    "outlet_temp",
+    "inlet_temp",
+    "flue_temp",
+    "cascade_current_power",
+    "lead_firing_rate",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "device_state",
+        sa.Column("id", sa.INTEGER(), nullable=False),
+        sa.Column("device_id", sa.INTEGER(), nullable=False),
+        sa.Column("backup", sa.BOOLEAN(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("switched_timestamp", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.INTEGER(), nullable=False),
+        sa.Column("manual_override", sa.INTEGER(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("device_id", "backup"),
+    )
+    for table, device_id in DEVICE_TABLES.items():
+        if table in VALVE_TABLES:
+            columns = "now(), NULL, status, 0"
+        else:
+            columns = "timestamp, switched_timestamp, status, manual_override"
+        # The old code read the first row, so keep the lowest id per backup flag
+        op.execute(
+            f"""
+            INSERT INTO device_state (
+                device_id, backup, timestamp, switched_timestamp, status,
+                manual_override
+            )
+            SELECT DISTINCT ON (backup) {device_id}, backup, {columns}
+            FROM {table}
+            ORDER BY backup, id
+            """
+        )
+        op.drop_table(table)
+
+
+def downgrade() -> None:
+    for table, device_id in DEVICE_TABLES.items():
+        if table in VALVE_TABLES:
+            op.create_table(
+                table,
+                sa.Column("id", sa.INTEGER(), nullable=False),
+                sa.Column("backup", sa.BOOLEAN(), nullable=False),
+                sa.Column("status", sa.INTEGER(), nullable=False),
+                sa.PrimaryKeyConstraint("id"),
+            )
+            columns, values = "backup, status", "backup, status"
+        else:
+            measurements = BOILER_MEASUREMENTS if table == "boiler" else ()
+            op.create_table(
+                table,
+                sa.Column("id", sa.INTEGER(), nullable=False),
+                sa.Column("backup", sa.BOOLEAN(), nullable=False),
+                sa.Column("timestamp", sa.DateTime(), nullable=False),
+                sa.Column("switched_timestamp", sa.DateTime(), nullable=False),
+                sa.Column("status", sa.INTEGER(), nullable=False),
+                sa.Column("manual_override", sa.INTEGER(), nullable=False),
+                *(sa.Column(name, sa.REAL(), nullable=False) for name in measurements),
+                sa.PrimaryKeyConstraint("id"),
+            )
+            columns = ", ".join(
+                ("backup, timestamp, switched_timestamp, status, manual_override",)
+                + measurements
+            )
+            values = ", ".join(
+                (
+                    "backup, timestamp, coalesce(switched_timestamp, timestamp), "
+                    "status, manual_override",
+                )
+                + ("0",) * len(measurements)
+            )
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns})
+            SELECT {values} FROM device_state
+            WHERE device_id = {device_id}
+            ORDER BY backup
+            """
+        )
+    op.drop_table("device_state")
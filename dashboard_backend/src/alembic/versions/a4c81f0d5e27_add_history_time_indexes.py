@@ -0,0 +1,52 @@
+"""Add history time indexes
+
+Revision ID: a4c81f0d5e27
+Revises: 3b7d2e9a41c6
+Create Date: 2026-10-17 10:02:17.530912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c81f0d5e27"
+down_revision: Union[str, None] = "3b7d2e9a41c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build concurrently so the minute history insert is not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_history_timestamp",
+            "history",
+            ["timestamp"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_history_mode_timestamp",
+            "history",
+            ["mode", "timestamp"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_history_mode_timestamp",
+            table_name="history",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_history_timestamp",
+            table_name="history",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
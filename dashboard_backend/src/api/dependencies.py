@@ -3,7 +3,11 @@ from typing import Annotated
 from fastapi import Request, Security, status
 from fastapi.responses import JSONResponse
 from src.core.common import exceptions as ex
-from src.features.auth.jwt_handler import UserToken, get_current_user_from_jwt_token
+from src.features.auth.jwt_handler import (
+    UserToken,
+    get_current_user_from_jwt_token,
+    get_current_user_from_query_token,
+)
 
 
 async def exception_handler(_: Request, exc: ex.GenericError) -> JSONResponse:
@@ -28,3 +32,9 @@ async def get_current_user(
     current_user: Annotated[UserToken, Security(get_current_user_from_jwt_token)],
 ) -> UserToken:
     return current_user
+
+
+async def get_current_stream_user(
+    current_user: Annotated[UserToken, Security(get_current_user_from_query_token)],
+) -> UserToken:
+    return current_user
@@ -7,8 +7,8 @@ auth_service = AuthService()
 
 
 @router.post("/login")
-def init_user(data: LoginForm) -> UserLoginResponse:
-    tokens = auth_service.login(
+async def init_user(data: LoginForm) -> UserLoginResponse:
+    tokens = await auth_service.login(
         email=data.email,
         password=data.password,
     )
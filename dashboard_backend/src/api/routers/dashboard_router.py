@@ -1,9 +1,9 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Request, Security
+from fastapi import APIRouter, Query, Request, Security
 from fastapi.responses import JSONResponse, StreamingResponse
-from src.api.dependencies import get_current_user
+from src.api.dependencies import get_current_stream_user, get_current_user
 from src.api.dto.dashboard import (
     SetpointUpdate,
     SwitchSeason,
@@ -11,16 +11,24 @@ from src.api.dto.dashboard import (
     UpdateSettings,
 )
 from src.core.common.exceptions import EdgeServerError
+from src.core.configs.config import settings
+from src.core.configs.database import pool_metrics
 from src.core.services.chronos import Chronos
 from src.core.services.edge_server import EdgeServer
 from src.features.auth.jwt_handler import UserToken
 from src.features.dashboard.dashboard_service import DashboardService
+from src.features.dashboard.dashboard_stream import DashboardStream
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Dashboard"])
 dashboard_service = DashboardService()
 chronos = Chronos()
+dashboard_stream = DashboardStream(
+    dashboard_service.get_data,
+    interval=settings.DASHBOARD_STREAM_INTERVAL,
+    heartbeat=settings.DASHBOARD_STREAM_HEARTBEAT,
+)
 
 
 def get_edge_server():
@@ -32,24 +40,43 @@ def get_dashboard_service():
 
 
 @router.get("/")
-def dashboard_data(
+async def dashboard_data(
     request: Request,
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
     dashboard_service: Annotated[DashboardService, Security(get_dashboard_service)],
 ):
-    data = dashboard_service.get_data()
+    data = await dashboard_service.get_data()
     return JSONResponse(content=data)
 
 
+@router.get("/stream")
+async def dashboard_stream_events(
+    current_user: Annotated[UserToken, Security(get_current_stream_user)],
+):
+    """Stream the dashboard as Server-Sent Events.
+
+    The first event is a "snapshot" with the same body as GET /; later
+    "delta" events are JSON merge patches against the previous event.
+    EventSource cannot send headers, so the access token is passed as the
+    access_token query parameter.
+    """
+    return StreamingResponse(
+        dashboard_stream.frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/update_device_state")
-def update_state(
+async def update_state(
     data: UpdateDeviceState,
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
     dashboard_service: Annotated[DashboardService, Security(get_dashboard_service)],
 ):
-    data = dashboard_service.update_device_state(data)
+    data = await dashboard_service.update_device_state(data)
+    dashboard_stream.poke()
     return JSONResponse(content=data)
 
 
@@ -63,15 +90,27 @@ def download_log(
 
 
 @router.get("/chart_data")
-def chart_data(
+async def chart_data(
     current_user: Annotated[UserToken, Security(get_current_user)],
+    since: Optional[str] = Query(
+        None, description="Only points after this point id or ISO timestamp"
+    ),
+    window: str = Query("1h", description="How far back to look, e.g. 1h, 24h, 7d"),
+    points: Optional[int] = Query(
+        None,
+        ge=10,
+        le=10000,
+        description="Downsample to about this many points (min/max/avg buckets)",
+    ),
 ):
-    data = dashboard_service.get_chart_data()
+    data = await dashboard_service.get_chart_data(
+        since=since, window=window, points=points
+    )
     return JSONResponse(content=data)
 
 
 @router.post("/update_settings")
-async def update_settings(
+def update_settings(
     data: UpdateSettings,
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
@@ -121,6 +160,7 @@ async def update_settings(
             if value is not None:
                 setattr(chronos, key, value)
 
+        dashboard_stream.poke()
         return JSONResponse(content={"message": "Settings updated successfully"})
     except EdgeServerError as e:
         logger.error(f"Error updating settings: {str(e)}", exc_info=True)
@@ -148,7 +188,7 @@ async def update_settings(
 
 
 @router.get("/boiler_stats")
-async def boiler_stats(
+def boiler_stats(
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
 ):
@@ -157,7 +197,7 @@ async def boiler_stats(
 
 
 @router.get("/boiler_status")
-async def boiler_status(
+def boiler_status(
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
 ):
@@ -166,7 +206,7 @@ async def boiler_status(
 
 
 @router.get("/temperature_limits")
-async def temperature_limits(
+def temperature_limits(
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
 ):
@@ -176,21 +216,31 @@ async def temperature_limits(
 
 
 @router.post("/boiler_set_setpoint")
-async def boiler_set_setpoint(
+def boiler_set_setpoint(
     data: SetpointUpdate,
     current_user: Annotated[UserToken, Security(get_current_user)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
 ):
     data = dashboard_service.boiler_set_setpoint(data.temperature)
+    dashboard_stream.poke()
     return JSONResponse(content=data)
 
 
 @router.post("/switch-season")
-async def switch_season(
+def switch_season(
     data: SwitchSeason,
     current_user: Annotated[UserToken, Security(get_current_user)],
     dashboard_service: Annotated[DashboardService, Security(get_dashboard_service)],
     edge_server: Annotated[EdgeServer, Security(get_edge_server)],
 ):
     result = dashboard_service.switch_season_mode(data.season_value)
+    dashboard_stream.poke()
     return JSONResponse(content=result, status_code=200)
+
+
+@router.get("/db_pool")
+async def db_pool(
+    current_user: Annotated[UserToken, Security(get_current_user)],
+):
+    """Connection pool metrics of the sync (jobs) and async (requests) engines."""
+    return JSONResponse(content=pool_metrics())
@@ -1,12 +1,13 @@
 import contextlib
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from src.core.configs.database import async_engine
 
 
 class AsyncSQLRepository:
-    def __init__(self, engine: AsyncEngine) -> None:
-        self._engine = engine
+    def __init__(self, engine: Optional[AsyncEngine] = None) -> None:
+        self._engine = engine or async_engine
         self._sessionmaker = async_sessionmaker(self._engine, expire_on_commit=False)
 
     @contextlib.asynccontextmanager
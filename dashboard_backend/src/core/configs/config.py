@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +18,55 @@ class Settings(BaseSettings):
     # Edge server
     EDGE_SERVER_IP: str
     EDGE_SERVER_PORT: str
+    EDGE_SERVER_CONNECT_TIMEOUT: float = 3.05
+    EDGE_SERVER_READ_TIMEOUT: float = 10
+    # Writes wait for the Modbus write and its read-back on the edge server
+    EDGE_SERVER_WRITE_TIMEOUT: float = 20
+    EDGE_SERVER_DOWNLOAD_TIMEOUT: float = 60
+    EDGE_SERVER_RETRIES: int = 3
+    EDGE_SERVER_RETRY_BACKOFF: float = 0.3
+    EDGE_SERVER_POOL_SIZE: int = 10
+    # Seconds an edge read is served from the backend cache
+    EDGE_CACHE_DATA_TTL: float = 2
+    EDGE_CACHE_SNAPSHOT_TTL: float = 2
+    EDGE_CACHE_BOILER_STATUS_TTL: float = 5
+    EDGE_CACHE_BOILER_STATS_TTL: float = 5
+    EDGE_CACHE_TEMPERATURE_LIMITS_TTL: float = 60
+    # Oldest cached read served, flagged stale, when the edge server fails
+    EDGE_CACHE_MAX_STALE: float = 300
+    # Dashboard fan-out: each edge call and DB read must finish within this
+    DASHBOARD_CALL_DEADLINE: float = 5
+    # Live dashboard stream: seconds between ticks and between keep-alives
+    DASHBOARD_STREAM_INTERVAL: float = 2
+    DASHBOARD_STREAM_HEARTBEAT: float = 15
+    # Settings are cached per process and dropped on change notifications;
+    # the TTL bounds staleness if a notification is missed
+    SETTINGS_CACHE_TTL: float = 300
+    # Seconds before the settings listener reconnects after an error
+    SETTINGS_LISTEN_RETRY: float = 5
+    # Database pools; the sync engine (background jobs) and the async engine
+    # (requests) each get one, so Postgres sees up to twice these numbers
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds a checkout waits for a free connection before failing
+    DB_POOL_TIMEOUT: float = 30
+    # Seconds after which a connection is replaced instead of reused
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Compiled statements cached per engine
+    DB_QUERY_CACHE_SIZE: int = 500
+    # Prepared statements cached per asyncpg connection
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Retention: days of data kept per table, 0 keeps everything
+    RETENTION_HISTORY_DAYS: int = 7
+    RETENTION_ROLLUP_15M_DAYS: int = 90
+    RETENTION_ROLLUP_1H_DAYS: int = 730
+    RETENTION_ROLLUP_1D_DAYS: int = 0
+    RETENTION_BATCH_SIZE: int = 5000
+    # Seconds between delete batches
+    RETENTION_BATCH_PAUSE: float = 0.5
+    # Directory for gzipped CSV copies of deleted rows; unset disables it
+    RETENTION_ARCHIVE_DIR: Optional[str] = None
 
 
 settings = Settings()
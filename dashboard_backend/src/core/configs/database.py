@@ -3,8 +3,15 @@ from contextlib import contextmanager
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
+from src.core.configs import config
 from src.core.configs.root_logger import root_logger as logger
+from src.core.utils.pool_metrics import (
+    MeteredAsyncAdaptedQueuePool,
+    MeteredQueuePool,
+    PoolMetrics,
+)
 
 load_dotenv()
 
@@ -15,14 +22,62 @@ DB_PORT = os.getenv("POSTGRES_PORT")
 # Replace with your own PostgreSQL instance
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/postgres"
 
-engine = create_engine(DATABASE_URL)
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def _engine_options():
+    settings = config.settings
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # Compiled SQL per distinct statement shape, shared by all connections
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+
+
+engine = create_engine(DATABASE_URL, poolclass=MeteredQueuePool, **_engine_options())
 SessionLocal = sessionmaker(bind=engine)
+# One registry for the process; each thread gets its own session from it
+Session = scoped_session(SessionLocal)
+# Used by request handlers through AsyncSQLRepository; background jobs keep
+# using the sync engine
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=MeteredAsyncAdaptedQueuePool,
+    # Server-side prepared statements kept per asyncpg connection
+    connect_args={
+        "prepared_statement_cache_size": (
+            config.settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        )
+    },
+    **_engine_options(),
+)
+
+engine_metrics = PoolMetrics.attach(engine)
+async_engine_metrics = PoolMetrics.attach(async_engine)
+
+
+def pool_metrics():
+    """Return the pool metrics of the sync and async engines."""
+    return {
+        "sync": engine_metrics.snapshot(),
+        "async": async_engine_metrics.snapshot(),
+    }
 
 
 @contextmanager
 def session_scope():
-    "Provide a transactional scope around a series of operations."
-    Session = scoped_session(SessionLocal)
+    """Provide a transactional scope around a series of operations.
+
+    A scope opened inside another one on the same thread joins its session;
+    the outermost scope commits and removes it.
+    """
+    if Session.registry.has():
+        yield Session
+        return
     Session()
     try:
         yield Session
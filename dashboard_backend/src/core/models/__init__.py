@@ -1,21 +1,15 @@
-from .boiler import Boiler
-from .chiller import Chiller1, Chiller2, Chiller3, Chiller4
+from .device_state import DeviceState
 from .history import History
+from .history_rollup import HistoryRollup
 from .set_point_lookup import SetpointLookup
 from .setting import Settings
 from .user import User
-from .value import SummerValve, WinterValve
 
 __all__ = [
-    "Boiler",
-    "Chiller1",
-    "Chiller2",
-    "Chiller3",
-    "Chiller4",
+    "DeviceState",
     "History",
+    "HistoryRollup",
     "SetpointLookup",
     "Settings",
     "User",
-    "SummerValve",
-    "WinterValve",
 ]
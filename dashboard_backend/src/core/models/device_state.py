@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import BOOLEAN, INTEGER, Column, DateTime, UniqueConstraint
+
+from .base import Base
+
+
+class DeviceState(Base):
+    """State of one device, keyed by its relay number (Relay.value).
+
+    Each device has a primary row and, while a season switch is pending, a
+    backup row that the primary is restored from.
+    """
+
+    __tablename__ = "device_state"
+    __table_args__ = (UniqueConstraint("device_id", "backup"),)
+
+    id = Column(INTEGER, primary_key=True)
+    device_id = Column(INTEGER, nullable=False)
+    backup = Column(BOOLEAN, default=False, nullable=False)
+    timestamp = Column(DateTime, default=datetime.now, nullable=False)
+    switched_timestamp = Column(DateTime, nullable=True)
+    status = Column(INTEGER, default=0, nullable=False)
+    manual_override = Column(INTEGER, default=0, nullable=False)
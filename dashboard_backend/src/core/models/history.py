@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import INTEGER, REAL, Column, DateTime
+from sqlalchemy import INTEGER, REAL, Column, DateTime, Index
 
 from .base import Base
 
 
 class History(Base):
     __tablename__ = "history"
+    __table_args__ = (
+        Index("ix_history_timestamp", "timestamp"),
+        Index("ix_history_mode_timestamp", "mode", "timestamp"),
+    )
 
     id = Column(INTEGER, primary_key=True)
     timestamp = Column(DateTime, default=datetime.now, nullable=False)
@@ -0,0 +1,56 @@
+from sqlalchemy import INTEGER, REAL, Column, DateTime, Float, String, UniqueConstraint
+
+from .base import Base
+
+
+class HistoryRollup(Base):
+    """Aggregates of the history rows in one time bucket and mode.
+
+    Sums are stored instead of averages so buckets can be combined exactly;
+    use the *_avg properties to read averages.
+    """
+
+    __tablename__ = "history_rollup"
+    __table_args__ = (UniqueConstraint("resolution", "bucket_start", "mode"),)
+
+    id = Column(INTEGER, primary_key=True)
+    resolution = Column(String(8), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    mode = Column(INTEGER, nullable=False)
+    count = Column(INTEGER, default=0, nullable=False)
+    # Minutes (history rows) with at least one chiller on
+    chiller_on_minutes = Column(INTEGER, default=0, nullable=False)
+    water_out_temp_sum = Column(Float, default=0, nullable=False)
+    water_out_temp_min = Column(REAL, nullable=True)
+    water_out_temp_max = Column(REAL, nullable=True)
+    return_temp_sum = Column(Float, default=0, nullable=False)
+    return_temp_min = Column(REAL, nullable=True)
+    return_temp_max = Column(REAL, nullable=True)
+    outside_temp_sum = Column(Float, default=0, nullable=False)
+    outside_temp_min = Column(REAL, nullable=True)
+    outside_temp_max = Column(REAL, nullable=True)
+    effective_setpoint_sum = Column(Float, default=0, nullable=False)
+    cascade_fire_rate_sum = Column(Float, default=0, nullable=False)
+
+    def _avg(self, total):
+        return total / self.count if self.count else None
+
+    @property
+    def water_out_temp_avg(self):
+        return self._avg(self.water_out_temp_sum)
+
+    @property
+    def return_temp_avg(self):
+        return self._avg(self.return_temp_sum)
+
+    @property
+    def outside_temp_avg(self):
+        return self._avg(self.outside_temp_sum)
+
+    @property
+    def effective_setpoint_avg(self):
+        return self._avg(self.effective_setpoint_sum)
+
+    @property
+    def cascade_fire_rate_avg(self):
+        return self._avg(self.cascade_fire_rate_sum)
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Dict, Iterable
+
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import aliased
+from src.core.common.repositories import AsyncSQLRepository
+from src.core.configs.database import session_scope
+from src.core.models import DeviceState
+from src.core.utils.helpers import to_naive_utc
+
+STATE_COLUMNS = ("status", "manual_override", "switched_timestamp")
+
+
+class DeviceStateRepository(AsyncSQLRepository):
+    """Read and write the state of several devices in one transaction.
+
+    Devices are identified by their relay number (Relay.value).
+    """
+
+    async def get_states(self, backup: bool = False) -> Dict[int, DeviceState]:
+        """Return the primary (or backup) state of every device in one query."""
+        async with self.session() as session:
+            rows = await session.scalars(
+                select(DeviceState).where(DeviceState.backup == backup)
+            )
+            return {row.device_id: row for row in rows}
+
+    def _copy_statement(self, device_ids: Iterable[int], to_backup: bool):
+        source = aliased(DeviceState, name="source")
+        return (
+            update(DeviceState)
+            .where(
+                DeviceState.device_id.in_(list(device_ids)),
+                DeviceState.backup == to_backup,
+                source.device_id == DeviceState.device_id,
+                source.backup == (not to_backup),
+            )
+            .values({column: getattr(source, column) for column in STATE_COLUMNS})
+        )
+
+    def copy_states(self, device_ids: Iterable[int], to_backup: bool = True):
+        """Copy state between the primary and backup rows of each device.
+
+        to_backup=True saves the primary state, False restores it. All
+        devices are copied by one UPDATE ... FROM.
+        """
+        with session_scope() as session:
+            session.execute(self._copy_statement(device_ids, to_backup))
+
+    def set_statuses(self, statuses: Dict[int, int], backup: bool = False):
+        """Set the status of several devices with one UPDATE."""
+        with session_scope() as session:
+            session.execute(
+                update(DeviceState)
+                .where(DeviceState.device_id.in_(list(statuses)))
+                .where(DeviceState.backup == backup)
+                .values(status=case(statuses, value=DeviceState.device_id))
+            )
+
+    async def update_state(self, device_id: int, backup: bool = False, **values):
+        """Set several state columns of one device in a single UPDATE."""
+        values = {
+            column: to_naive_utc(value) if isinstance(value, datetime) else value
+            for column, value in values.items()
+        }
+        async with self.session() as session:
+            await session.execute(
+                update(DeviceState)
+                .where(DeviceState.device_id == device_id)
+                .where(DeviceState.backup == backup)
+                .values(**values)
+            )
+            await session.commit()
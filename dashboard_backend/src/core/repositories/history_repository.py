@@ -1,23 +1,25 @@
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from sqlalchemy.sql import func
+from src.core.common.repositories import AsyncSQLRepository
 from src.core.configs.database import session_scope
 from src.core.models import History, Settings
+from src.core.utils.helpers import to_naive_utc
 
 
-class HistoryRepository:
+class HistoryRepository(AsyncSQLRepository):
     def _get_property_from_db(self, param):
         param = getattr(History, param)
         with session_scope() as session:
             (value,) = session.query(param).first()
         return value
 
-    def get_last_history(self):
-        with session_scope() as session:
-            history = session.query(History).order_by(desc(History.id)).first()
-            session.expunge_all()
-        return history
+    async def get_last_history(self):
+        async with self.session() as session:
+            return await session.scalar(
+                select(History).order_by(desc(History.id)).limit(1)
+            )
 
     def get_last_histories(self, hours=1):
         with session_scope() as session:
@@ -31,6 +33,60 @@ class HistoryRepository:
             session.expunge_all()
         return rows
 
+    def _chart_filters(self, statement, window, since_id, since_time):
+        cutoff = to_naive_utc(datetime.now(UTC) - window)
+        statement = statement.where(History.timestamp > cutoff)
+        if since_id is not None:
+            statement = statement.where(History.id > since_id)
+        if since_time is not None:
+            statement = statement.where(History.timestamp > to_naive_utc(since_time))
+        return statement
+
+    async def get_chart_points(self, window, since_id=None, since_time=None):
+        """Return (id, timestamp, water_out_temp, return_temp) rows, oldest first.
+
+        Args:
+            window (timedelta): Only rows newer than now - window
+            since_id (int): Only rows with a greater id
+            since_time (datetime): Only rows with a later timestamp
+        """
+        statement = select(
+            History.id,
+            History.timestamp,
+            History.water_out_temp,
+            History.return_temp,
+        )
+        statement = self._chart_filters(statement, window, since_id, since_time)
+        async with self.session() as session:
+            result = await session.execute(statement.order_by(History.id))
+            return result.all()
+
+    async def get_chart_buckets(
+        self, window, bucket_seconds, since_id=None, since_time=None
+    ):
+        """Return the chart columns averaged over fixed time buckets, oldest first.
+
+        Buckets are aligned to the Unix epoch, so a bucket keeps its
+        boundaries from one call to the next. Each row has the last id and
+        first timestamp of its bucket plus the avg, min and max of both
+        temperatures.
+        """
+        bucket = func.floor(func.extract("epoch", History.timestamp) / bucket_seconds)
+        statement = select(
+            func.max(History.id).label("id"),
+            func.min(History.timestamp).label("timestamp"),
+            func.avg(History.water_out_temp).label("water_out_temp"),
+            func.min(History.water_out_temp).label("water_out_temp_min"),
+            func.max(History.water_out_temp).label("water_out_temp_max"),
+            func.avg(History.return_temp).label("return_temp"),
+            func.min(History.return_temp).label("return_temp_min"),
+            func.max(History.return_temp).label("return_temp_max"),
+        )
+        statement = self._chart_filters(statement, window, since_id, since_time)
+        async with self.session() as session:
+            result = await session.execute(statement.group_by(bucket).order_by(bucket))
+            return result.all()
+
     def three_minute_avg_delta(self):
         with session_scope() as session:
             result = (
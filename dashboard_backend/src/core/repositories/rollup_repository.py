@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import case, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from src.core.common.repositories import AsyncSQLRepository
+from src.core.configs.database import session_scope
+from src.core.models import History, HistoryRollup
+from src.core.utils.helpers import to_naive_utc
+
+RESOLUTIONS = {
+    "15m": timedelta(minutes=15),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+# Each resolution is rebuilt from the next finer one, 15m from raw history
+ROLLUP_CHAIN = (("15m", None), ("1h", "15m"), ("1d", "1h"))
+# Columns rolled up with sum, min and max
+MEASURES = ("water_out_temp", "return_temp", "outside_temp")
+# Columns rolled up with sum only
+TOTALS = ("effective_setpoint", "cascade_fire_rate")
+KEY = ("resolution", "bucket_start", "mode")
+VALUES = (
+    "count",
+    "chiller_on_minutes",
+    *(f"{m}_{agg}" for m in MEASURES for agg in ("sum", "min", "max")),
+    *(f"{t}_sum" for t in TOTALS),
+)
+
+
+def bucket_start(at: datetime, resolution: str) -> datetime:
+    """Floor at to its bucket; aware times are converted to naive UTC."""
+    at = to_naive_utc(at)
+    size = RESOLUTIONS[resolution]
+    return datetime.min + (at - datetime.min) // size * size
+
+
+@dataclass(frozen=True)
+class RollupSummary:
+    count: int
+    chiller_on_minutes: int
+    water_out_temp_avg: Optional[float]
+    water_out_temp_min: Optional[float]
+    water_out_temp_max: Optional[float]
+    return_temp_avg: Optional[float]
+    return_temp_min: Optional[float]
+    return_temp_max: Optional[float]
+    outside_temp_avg: Optional[float]
+    outside_temp_min: Optional[float]
+    outside_temp_max: Optional[float]
+    effective_setpoint_avg: Optional[float]
+    cascade_fire_rate_avg: Optional[float]
+
+
+class RollupRepository(AsyncSQLRepository):
+    def _from_history(self, resolution, start, end):
+        chiller_on = or_(
+            History.chiller1_status == 1,
+            History.chiller2_status == 1,
+            History.chiller3_status == 1,
+            History.chiller4_status == 1,
+        )
+        columns = [func.count(), func.sum(case((chiller_on, 1), else_=0))]
+        for name in MEASURES:
+            column = getattr(History, name)
+            columns += [func.sum(column), func.min(column), func.max(column)]
+        columns += [func.sum(getattr(History, name)) for name in TOTALS]
+        return (
+            select(literal(resolution), literal(start), History.mode, *columns)
+            .where(History.timestamp >= start, History.timestamp < end)
+            .group_by(History.mode)
+        )
+
+    def _from_rollups(self, resolution, source, start, end):
+        columns = []
+        for name in VALUES:
+            column = getattr(HistoryRollup, name)
+            if name.endswith("_min"):
+                columns.append(func.min(column))
+            elif name.endswith("_max"):
+                columns.append(func.max(column))
+            else:
+                columns.append(func.sum(column))
+        return (
+            select(literal(resolution), literal(start), HistoryRollup.mode, *columns)
+            .where(
+                HistoryRollup.resolution == source,
+                HistoryRollup.bucket_start >= start,
+                HistoryRollup.bucket_start < end,
+            )
+            .group_by(HistoryRollup.mode)
+        )
+
+    def _upsert(self, query):
+        statement = insert(HistoryRollup).from_select([*KEY, *VALUES], query)
+        return statement.on_conflict_do_update(
+            index_elements=list(KEY),
+            set_={name: statement.excluded[name] for name in VALUES},
+        )
+
+    def refresh(self, at: datetime):
+        """Rebuild the 15m, 1h and 1d buckets that contain at.
+
+        Each bucket is recomputed from at most a few dozen rows, so this is
+        cheap enough to run after every history insert, and idempotent.
+        """
+        with session_scope() as session:
+            for resolution, source in ROLLUP_CHAIN:
+                start = bucket_start(at, resolution)
+                end = start + RESOLUTIONS[resolution]
+                if source is None:
+                    query = self._from_history(resolution, start, end)
+                else:
+                    query = self._from_rollups(resolution, source, start, end)
+                session.execute(self._upsert(query))
+
+    def get_rollups(self, resolution, since, until=None, mode=None):
+        """Return the buckets of a resolution from since on, oldest first."""
+        with session_scope() as session:
+            query = session.query(HistoryRollup).filter(
+                HistoryRollup.resolution == resolution,
+                HistoryRollup.bucket_start >= bucket_start(since, resolution),
+            )
+            if until is not None:
+                query = query.filter(HistoryRollup.bucket_start < until)
+            if mode is not None:
+                query = query.filter(HistoryRollup.mode == mode)
+            rows = query.order_by(HistoryRollup.bucket_start).all()
+            session.expunge_all()
+        return rows
+
+    def _summary_statement(self, since, mode, resolution):
+        columns = [
+            func.coalesce(func.sum(HistoryRollup.count), 0),
+            func.coalesce(func.sum(HistoryRollup.chiller_on_minutes), 0),
+        ]
+        for name in MEASURES:
+            columns += [
+                func.sum(getattr(HistoryRollup, f"{name}_sum")),
+                func.min(getattr(HistoryRollup, f"{name}_min")),
+                func.max(getattr(HistoryRollup, f"{name}_max")),
+            ]
+        columns += [func.sum(getattr(HistoryRollup, f"{name}_sum")) for name in TOTALS]
+        statement = select(*columns).where(
+            HistoryRollup.resolution == resolution,
+            HistoryRollup.bucket_start >= bucket_start(since, resolution),
+        )
+        if mode is not None:
+            statement = statement.where(HistoryRollup.mode == mode)
+        return statement
+
+    def _to_summary(self, row) -> RollupSummary:
+        count, chiller_on_minutes, *rest = row
+
+        def avg(total):
+            return total / count if count and total is not None else None
+
+        values = {}
+        for name in MEASURES:
+            total, low, high, *rest = rest
+            values.update(
+                {f"{name}_avg": avg(total), f"{name}_min": low, f"{name}_max": high}
+            )
+        for name, total in zip(TOTALS, rest):
+            values[f"{name}_avg"] = avg(total)
+        return RollupSummary(
+            count=count, chiller_on_minutes=chiller_on_minutes, **values
+        )
+
+    def summarize(self, since, mode=None, resolution="15m") -> RollupSummary:
+        """Combine every bucket from since on into one summary.
+
+        The window starts at the beginning of the bucket containing since,
+        so it may include up to one bucket of earlier history.
+        """
+        statement = self._summary_statement(since, mode, resolution)
+        with session_scope() as session:
+            row = session.execute(statement).one()
+        return self._to_summary(row)
+
+    async def asummarize(self, since, mode=None, resolution="15m") -> RollupSummary:
+        """Async summarize."""
+        statement = self._summary_statement(since, mode, resolution)
+        async with self.session() as session:
+            row = (await session.execute(statement)).one()
+        return self._to_summary(row)
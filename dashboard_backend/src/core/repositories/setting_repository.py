@@ -1,28 +1,125 @@
-from sqlalchemy import desc
-from src.core.configs.database import session_scope
+import logging
+import select
+import threading
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy import desc, func
+from src.core.common.repositories import AsyncSQLRepository
+from src.core.configs import config
+from src.core.configs.database import engine, session_scope
 from src.core.models import Settings
+from src.core.utils.ttl_cache import TTLCache
 
+logger = logging.getLogger(__name__)
 
-class SettingRepository:
-    def _get_property_from_db(self, param):
-        param = getattr(Settings, param)
-        with session_scope() as session:
-            (value,) = session.query(param).first()
-        return value
+# Postgres channel notified, with the column name, whenever settings change
+SETTINGS_CHANNEL = "settings_changed"
+SETTINGS_KEY = "settings"
 
-    def get_last_settings(self):
+# The settings row changes a few times a day; every process keeps one copy
+# and drops it on a local write or a NOTIFY from another process.
+settings_cache = TTLCache(max_stale=0)
+
+
+class SettingRepository(AsyncSQLRepository):
+    def _load_last_settings(self):
         with session_scope() as session:
             settings = session.query(Settings).order_by(desc(Settings.id)).first()
             session.expunge_all()
         return settings
 
+    async def _aload_last_settings(self):
+        async with self.session() as session:
+            return await session.scalar(
+                sa.select(Settings).order_by(desc(Settings.id)).limit(1)
+            )
+
+    def get_last_settings(self):
+        """Return the settings row from the cache; treat it as read-only."""
+        settings, _ = settings_cache.get(
+            SETTINGS_KEY, config.settings.SETTINGS_CACHE_TTL, self._load_last_settings
+        )
+        return settings
+
+    async def aget_last_settings(self):
+        """Async get_last_settings; both share the same cached row."""
+        settings, _ = await settings_cache.aget(
+            SETTINGS_KEY, config.settings.SETTINGS_CACHE_TTL, self._aload_last_settings
+        )
+        return settings
+
     def _get_property_from_db(self, param):
-        param = getattr(Settings, param)
-        with session_scope() as session:
-            (value,) = session.query(param).first()
-        return value
+        return getattr(self.get_last_settings(), param)
 
     def _update_property_in_db(self, param, value):
         param = getattr(Settings, param)
         with session_scope() as session:
             session.query(Settings).filter(Settings.id == 1).update({param: value})
+            # Delivered to the other processes when the update commits
+            session.execute(func.pg_notify(SETTINGS_CHANNEL, param.key).select())
+        settings_cache.invalidate(SETTINGS_KEY)
+
+
+class SettingsListener:
+    """
+    Drop the cached settings when another process changes them.
+
+    A daemon thread LISTENs on SETTINGS_CHANNEL over its own connection. If
+    the connection drops, the cache is invalidated, since notifications may
+    have been missed, and the thread reconnects after retry seconds.
+
+    Usage:
+        settings_listener = SettingsListener()
+        settings_listener.start()
+        ...
+        settings_listener.stop()
+    """
+
+    def __init__(self, retry: Optional[float] = None):
+        self.retry = config.settings.SETTINGS_LISTEN_RETRY if retry is None else retry
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _listen(self):
+        connection = engine.raw_connection()
+        try:
+            dbapi_connection = connection.dbapi_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {SETTINGS_CHANNEL}")
+            # Anything written before LISTEN took effect is not in the cache
+            settings_cache.invalidate(SETTINGS_KEY)
+            while not self._stop.is_set():
+                readable, _, _ = select.select([dbapi_connection], [], [], 1.0)
+                if not readable:
+                    continue
+                dbapi_connection.poll()
+                if dbapi_connection.notifies:
+                    dbapi_connection.notifies.clear()
+                    settings_cache.invalidate(SETTINGS_KEY)
+        finally:
+            connection.invalidate()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.error(f"Settings listener failed: {e}")
+                settings_cache.invalidate(SETTINGS_KEY)
+                self._stop.wait(self.retry)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="settings-listener", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,9 @@
+from sqlalchemy import select
+from src.core.common.repositories import AsyncSQLRepository
+from src.core.models import User
+
+
+class UserRepository(AsyncSQLRepository):
+    async def get_by_email(self, email: str):
+        async with self.session() as session:
+            return await session.scalar(select(User).where(User.email == email))
@@ -8,7 +8,7 @@ class Boiler(Device):
     TYPE = "boiler"
 
     def __init__(self):
-        super().__init__("Boiler")
+        super().__init__(Relay.BOILER.value)
         self.number = 0
         self.relay_number = Relay.BOILER.value
         self.history_repository = HistoryRepository()
@@ -13,10 +13,9 @@ class Chiller(Device):
 
         self.number = number
         self.relay_number = Relay[f"CHILLER{number}"]
-        self.table_class_name = f"Chiller{number}"
         self.history_repository = HistoryRepository()
         self.setting_repository = SettingRepository()
-        super().__init__(table_class_name=self.table_class_name)
+        super().__init__(device_id=self.relay_number.value)
 
     @property
     def setpoint(self):
@@ -4,11 +4,12 @@ import requests
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy import desc
-from sqlalchemy.sql import func
 from src.core.configs.database import session_scope
 from src.core.configs.root_logger import root_logger as logger
 from src.core.models import History
+from src.core.repositories.device_state_repository import DeviceStateRepository
 from src.core.repositories.history_repository import HistoryRepository
+from src.core.repositories.rollup_repository import RollupRepository
 from src.core.repositories.setting_repository import SettingRepository
 from src.core.services.boiler import Boiler
 from src.core.services.chiller import Chiller
@@ -58,6 +59,8 @@ class Chronos(object):
         self.scheduler.start()
         #
         self.history_repository = HistoryRepository()
+        self.rollup_repository = RollupRepository()
+        self.device_state_repository = DeviceStateRepository()
         self.setting_repository = SettingRepository()
         self.edge_server = EdgeServer()
 
@@ -109,18 +112,9 @@ class Chronos(object):
 
     @property
     def cascade_fire_rate_avg(self):
-        timespan = datetime.now() - timedelta(hours=EFFICIENCY_HOUR)
-        with session_scope() as session:
-            result = (
-                session.query(History.cascade_fire_rate)
-                .order_by(desc(History.id))
-                .filter(History.mode == Mode.WINTER.value, History.timestamp > timespan)
-                .subquery()
-            )
-            (average_cascade_fire_rate,) = session.query(
-                func.avg(result.c.cascade_fire_rate)
-            ).first()
-        return average_cascade_fire_rate or 0
+        timespan = datetime.now(UTC) - timedelta(hours=EFFICIENCY_HOUR)
+        summary = self.rollup_repository.summarize(timespan, mode=Mode.WINTER.value)
+        return summary.cascade_fire_rate_avg or 0
 
     @property
     def mode_switch_lockout_time(self):
@@ -144,18 +138,24 @@ class Chronos(object):
 
     def create_update_history(self):
         edge_server_data = self.edge_server.get_data()
+        if edge_server_data.get("stale"):
+            # The edge server is down and this is its last good reply
+            logger.warning("Edge server data is stale, skipping the history row.")
+            return
         sensors = edge_server_data["sensors"]
         mode = self.mode
         if mode in (Mode.WINTER.value, Mode.SUMMER.value):
+            timestamp = datetime.now(UTC)
             with session_scope() as session:
                 parameters = History(
-                    timestamp=datetime.now(UTC),
+                    timestamp=timestamp,
                     outside_temp=self.outside_temp,
                     water_out_temp=sensors["water_out_temp"],
                     return_temp=sensors["return_temp"],
                     mode=mode,
                 )
                 session.add(parameters)
+            self.rollup_repository.refresh(timestamp)
 
     def _switch_devices(self, is_season_switch=False):
         for device in self.devices:
@@ -173,15 +173,19 @@ class Chronos(object):
         if mode == Mode.SWITCHING_TO_SUMMER.value:
             self.boiler.save_status()
         elif mode == Mode.SWITCHING_TO_WINTER.value:
-            for chiller in self.devices[1:]:
-                chiller.save_status()
+            self.device_state_repository.copy_states(
+                [chiller.device_id for chiller in self.devices[1:]],
+                to_backup=True,
+            )
 
     def _restore_devices_states(self, mode: Mode):
         if mode == Mode.SWITCHING_TO_SUMMER.value:
             self.boiler.restore_status()
         elif mode == Mode.SWITCHING_TO_WINTER.value:
-            for chiller in self.devices[1:]:
-                chiller.restore_status()
+            self.device_state_repository.copy_states(
+                [chiller.device_id for chiller in self.devices[1:]],
+                to_backup=False,
+            )
 
     def turn_off_devices(
         self, with_valves=False, relay_only=False, is_season_switch=False
@@ -195,8 +199,20 @@ class Chronos(object):
             # for device in self.devices:
             #     device.manual_override = MANUAL_OFF
             if with_valves:
-                self.winter_valve.turn_off(is_season_switch=is_season_switch)
-                self.summer_valve.turn_off(is_season_switch=is_season_switch)
+                self._switch_valves(
+                    summer=OFF, winter=OFF, is_season_switch=is_season_switch
+                )
+
+    def _switch_valves(self, summer: int, winter: int, is_season_switch=False):
+        """Switch both valves, then store their states in one transaction."""
+        for valve, state in ((self.summer_valve, summer), (self.winter_valve, winter)):
+            if state == ON:
+                valve.turn_on(is_season_switch=is_season_switch)
+            else:
+                valve.turn_off(is_season_switch=is_season_switch)
+        self.device_state_repository.set_statuses(
+            {self.summer_valve.device_id: summer, self.winter_valve.device_id: winter}
+        )
 
     def _switch_season(self, mode: int):
         if mode == Mode.WAITING_SWITCH_TO_SUMMER.value:
@@ -205,8 +221,7 @@ class Chronos(object):
             self.mode_switch_timestamp = datetime.now()
             self._save_devices_states(mode)
             self.turn_off_devices(is_season_switch=True)
-            self.summer_valve.turn_on(is_season_switch=True)
-            self.winter_valve.turn_off(is_season_switch=True)
+            self._switch_valves(summer=ON, winter=OFF, is_season_switch=True)
 
             self.scheduler.add_job(
                 self._switch_season,
@@ -222,8 +237,7 @@ class Chronos(object):
             self.mode_switch_timestamp = datetime.now()
             self._save_devices_states(mode)
             self.turn_off_devices(is_season_switch=True)
-            self.summer_valve.turn_off(is_season_switch=True)
-            self.winter_valve.turn_on(is_season_switch=True)
+            self._switch_valves(summer=OFF, winter=ON, is_season_switch=True)
 
             self.scheduler.add_job(
                 self._switch_season,
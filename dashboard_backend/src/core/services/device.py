@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
 from src.core.repositories.device_repository import DeviceRepository
+from src.core.repositories.device_state_repository import DeviceStateRepository
 from src.core.services.edge_server import EdgeServer
 from src.core.utils.constant import MANUAL_AUTO, MANUAL_OFF, MANUAL_ON, OFF, ON
 
@@ -8,10 +9,10 @@ from src.core.utils.constant import MANUAL_AUTO, MANUAL_OFF, MANUAL_ON, OFF, ON
 class Device(object):
     TYPE = "device"
 
-    def __init__(self, table_class_name=None):
-        self.device_repository = DeviceRepository(table_class_name)
+    def __init__(self, device_id=None):
+        self.device_repository = DeviceRepository(device_id)
         self.edge_server = EdgeServer()
-        self.table_class_name = table_class_name
+        self.device_id = device_id
 
     def _switch_state(self, command, relay_only=False, is_season_switch=False):
         return self.edge_server._switch_state(command, relay_only, is_season_switch)
@@ -63,23 +64,10 @@ class Device(object):
         return self.device_repository._update_value_in_db(**kwargs)
 
     def save_status(self):
-        self._update_value_in_db(
-            status=self.status,
-            manual_override=self.manual_override,
-            switched_timestamp=self.switched_timestamp,
-            to_backup=True,
-        )
+        DeviceStateRepository().copy_states([self.device_id], to_backup=True)
 
     def restore_status(self):
-        status, manual_override, switched_timestamp = self._get_property_from_db(
-            "status", "manual_override", "switched_timestamp", from_backup=True
-        )
-        self._update_value_in_db(
-            status=status,
-            manual_override=manual_override,
-            switched_timestamp=switched_timestamp,
-            to_backup=False,
-        )
+        DeviceStateRepository().copy_states([self.device_id], to_backup=False)
 
     @property
     def timestamp(self):
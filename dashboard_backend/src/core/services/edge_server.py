@@ -1,34 +1,176 @@
+import asyncio
 import json
 import logging
+import threading
 from functools import wraps
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from src.core.common.exceptions import (
     ConnectToEdgeServerError,
     EdgeServerError,
     ErrorReadDataEdgeServer,
 )
 from src.core.configs.config import settings
+from src.core.utils.ttl_cache import TTLCache
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    """Build a keep-alive session with a bounded pool and retries.
+
+    Only idempotent requests are retried after a read error or a 502/503
+    from the proxy; POSTs are retried only when the connection could not be
+    opened, so a relay or setpoint command is never sent twice.
+    """
+    retry = Retry(
+        total=settings.EDGE_SERVER_RETRIES,
+        backoff_factor=settings.EDGE_SERVER_RETRY_BACKOFF,
+        status_forcelist=(502, 503),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.EDGE_SERVER_POOL_SIZE,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session():
+    """Return the session shared by every EdgeServer."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# Shared by every EdgeServer and AsyncEdgeServer, so edge load does not grow
+# with the number of dashboard viewers
+edge_cache = TTLCache(max_stale=settings.EDGE_CACHE_MAX_STALE)
+
+
+def _cache_ttl(key):
+    return getattr(settings, f"EDGE_CACHE_{key.upper()}_TTL")
+
+
+def _mark_stale(value, stale):
+    """Flag a cached response served because the edge server failed."""
+    if stale and isinstance(value, dict):
+        return {**value, "stale": True}
+    return value
+
+
+def cached(key):
+    """Serve a read from edge_cache under key, with its configured TTL."""
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self):
+                value, stale = await edge_cache.aget(
+                    key, _cache_ttl(key), lambda: func(self)
+                )
+                return _mark_stale(value, stale)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self):
+            value, stale = edge_cache.get(key, _cache_ttl(key), lambda: func(self))
+            return _mark_stale(value, stale)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*keys):
+    """Drop the cached reads a write may have changed, whatever its outcome."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                edge_cache.invalidate(*keys)
+
+        return wrapper
+
+    return decorator
+
+
+def _error_message(response, error):
+    """Build the message of an EdgeServerError from an error response."""
+    if response.status_code == 403 and "read-only mode" in response.text.lower():
+        return "Operation not permitted: system is in read-only mode"
+    if response.status_code == 422:
+        logger.error(f"Validation error response from edge server: {response.text}")
+    return response.json().get("detail", str(error))
+
 
 def catch_connection_error(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             raise ConnectToEdgeServerError()
 
     return wrapper
 
 
 class EdgeServer:
-    def __init__(self):
+    def __init__(self, session=None):
         self.ip_address = settings.EDGE_SERVER_IP
         self.port = settings.EDGE_SERVER_PORT
         self.url = f"{self.ip_address}:{self.port}"
+        self.session = session or get_session()
+        self.read_timeout = (
+            settings.EDGE_SERVER_CONNECT_TIMEOUT,
+            settings.EDGE_SERVER_READ_TIMEOUT,
+        )
+        self.write_timeout = (
+            settings.EDGE_SERVER_CONNECT_TIMEOUT,
+            settings.EDGE_SERVER_WRITE_TIMEOUT,
+        )
+        self.download_timeout = (
+            settings.EDGE_SERVER_CONNECT_TIMEOUT,
+            settings.EDGE_SERVER_DOWNLOAD_TIMEOUT,
+        )
+
+    def _get(self, path, timeout=None, **kwargs):
+        return self.session.get(
+            f"{self.url}{path}", timeout=timeout or self.read_timeout, **kwargs
+        )
+
+    def _post(self, path, timeout=None, **kwargs):
+        return self.session.post(
+            f"{self.url}{path}", timeout=timeout or self.write_timeout, **kwargs
+        )
 
     def _handle_response(self, response):
         """Handle response from edge server."""
@@ -36,87 +178,94 @@ class EdgeServer:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
-            if (
-                response.status_code == 403
-                and "read-only mode" in response.text.lower()
-            ):
-                msg = "Operation not permitted: system is in read-only mode"
-            elif response.status_code == 422:
-                logger.error(
-                    f"Validation error response from edge server: {response.text}"
-                )
-                msg = response.json().get("detail", str(e))
-            else:
-                msg = response.json().get("detail", str(e))
-            raise EdgeServerError(message=msg)
+            raise EdgeServerError(message=_error_message(response, e))
         except Exception:
             raise ErrorReadDataEdgeServer()
 
+    @cached("data")
     @catch_connection_error
     def get_data(self):
         """Get data from edge server."""
-        response = requests.get(f"{self.url}/get_data")
+        response = self._get("/get_data")
+        return self._handle_response(response)
+
+    @cached("snapshot")
+    @catch_connection_error
+    def get_snapshot(self):
+        """Get sensors, relays, boiler stats/status and limits in one call.
+
+        Every section carries data, timestamp and error; a section the edge
+        server could not read has data None and an error message.
+        """
+        response = self._get("/snapshot")
         return self._handle_response(response)
 
     @catch_connection_error
     def device_state(self, device):
-        response = requests.get(f"{self.url}/device_state", params={"device": device})
+        response = self._get("/device_state", params={"device": device})
         return self._handle_response(response)
 
+    @invalidates("data", "snapshot")
     @catch_connection_error
     def update_device_state(self, id: int, state: bool):
         """Update device state."""
         data = {"id": id, "state": state}
-        response = requests.post(f"{self.url}/device_state", data=json.dumps(data))
+        response = self._post("/device_state", data=json.dumps(data))
         return self._handle_response(response)
 
     @catch_connection_error
     def download_log(self):
-        response = requests.get(f"{self.url}/download_log")
+        response = self._get("/download_log", timeout=self.download_timeout)
         return self._handle_response(response)
 
+    @cached("boiler_stats")
     @catch_connection_error
     def get_data_boiler_stats(self):
         """Get boiler statistics."""
-        response = requests.get(f"{self.url}/boiler_stats")
+        response = self._get("/boiler_stats")
         return self._handle_response(response)
 
+    @cached("boiler_status")
     @catch_connection_error
     def get_boiler_status(self):
         """Get boiler status."""
-        response = requests.get(f"{self.url}/boiler_status")
+        response = self._get("/boiler_status")
         return self._handle_response(response)
 
+    @cached("temperature_limits")
     @catch_connection_error
     def get_temperature_limits(self):
         """Get temperature limits."""
-        response = requests.get(f"{self.url}/temperature_limits")
+        response = self._get("/temperature_limits")
         return self._handle_response(response)
 
+    @invalidates("temperature_limits", "snapshot")
     @catch_connection_error
     def set_temperature_limits(self, limits: dict):
         """Set temperature limits."""
-        response = requests.post(f"{self.url}/temperature_limits", json=limits)
+        response = self._post("/temperature_limits", json=limits)
         return self._handle_response(response)
 
+    @invalidates("boiler_status", "boiler_stats", "snapshot")
     @catch_connection_error
     def boiler_set_setpoint(self, temperature: float) -> bool:
         """Set boiler temperature setpoint."""
         logger.info(f"Sending temperature setpoint to edge server: {temperature}")
         data = {"temperature": temperature}
         logger.info(f"Request payload: {data}")
-        response = requests.post(
-            f"{self.url}/boiler_set_setpoint",
+        response = self._post(
+            "/boiler_set_setpoint",
             json=data,  # Use json parameter instead of manually serializing
         )
         logger.info(f"Edge server response status: {response.status_code}")
         logger.info(f"Edge server response body: {response.text}")
         return self._handle_response(response)
 
+    @invalidates("data", "snapshot")
     @catch_connection_error
     def _switch_state(self, command, relay_only=False, is_season_switch=False):
-        response = requests.post(
-            f"{self.url}/switch_state",
+        response = self._post(
+            "/switch_state",
             json={
                 "command": command,
                 "relay_only": relay_only,
@@ -127,5 +276,123 @@ class EdgeServer:
 
     @catch_connection_error
     def get_all_devices_state(self):
-        response = requests.get(f"{self.url}/get_all_devices_state")
+        response = self._get("/get_all_devices_state")
+        return self._handle_response(response)
+
+
+_async_client = None
+
+
+def get_async_client():
+    """Return the httpx client shared by every AsyncEdgeServer.
+
+    The client binds to the event loop it is first used on, so it is created
+    lazily from within the application's loop.
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        limits = httpx.Limits(
+            max_connections=settings.EDGE_SERVER_POOL_SIZE,
+            max_keepalive_connections=settings.EDGE_SERVER_POOL_SIZE,
+        )
+        # httpx only retries failed connection attempts, which is safe for
+        # every method
+        transport = httpx.AsyncHTTPTransport(
+            retries=settings.EDGE_SERVER_RETRIES, limits=limits
+        )
+        _async_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                settings.EDGE_SERVER_READ_TIMEOUT,
+                connect=settings.EDGE_SERVER_CONNECT_TIMEOUT,
+            ),
+        )
+    return _async_client
+
+
+async def close_async_client():
+    """Close the shared httpx client and its pooled connections."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+def catch_async_connection_error(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except httpx.TransportError:
+            raise ConnectToEdgeServerError()
+
+    return wrapper
+
+
+class AsyncEdgeServer:
+    """Non-blocking counterpart of EdgeServer for the read endpoints.
+
+    Usage:
+        edge_server = AsyncEdgeServer()
+        data, stats = await asyncio.gather(
+            edge_server.get_data(), edge_server.get_data_boiler_stats()
+        )
+    """
+
+    def __init__(self, client=None):
+        self.ip_address = settings.EDGE_SERVER_IP
+        self.port = settings.EDGE_SERVER_PORT
+        self.url = f"{self.ip_address}:{self.port}"
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client or get_async_client()
+
+    async def _get(self, path, **kwargs):
+        return await self.client.get(f"{self.url}{path}", **kwargs)
+
+    def _handle_response(self, response):
+        """Handle response from edge server."""
+        try:
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise EdgeServerError(message=_error_message(response, e))
+        except Exception:
+            raise ErrorReadDataEdgeServer()
+
+    @cached("data")
+    @catch_async_connection_error
+    async def get_data(self):
+        """Get data from edge server."""
+        response = await self._get("/get_data")
+        return self._handle_response(response)
+
+    @cached("snapshot")
+    @catch_async_connection_error
+    async def get_snapshot(self):
+        """Get sensors, relays, boiler stats/status and limits in one call."""
+        response = await self._get("/snapshot")
+        return self._handle_response(response)
+
+    @cached("boiler_stats")
+    @catch_async_connection_error
+    async def get_data_boiler_stats(self):
+        """Get boiler statistics."""
+        response = await self._get("/boiler_stats")
+        return self._handle_response(response)
+
+    @cached("boiler_status")
+    @catch_async_connection_error
+    async def get_boiler_status(self):
+        """Get boiler status."""
+        response = await self._get("/boiler_status")
+        return self._handle_response(response)
+
+    @cached("temperature_limits")
+    @catch_async_connection_error
+    async def get_temperature_limits(self):
+        """Get temperature limits."""
+        response = await self._get("/temperature_limits")
         return self._handle_response(response)
@@ -0,0 +1,131 @@
+import csv
+import gzip
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, select
+from src.core.configs import config
+from src.core.configs.database import session_scope
+from src.core.models import History, HistoryRollup
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Delete rows of model whose column is older than days; 0 keeps all."""
+
+    name: str
+    model: type
+    column: str
+    days: int
+    where: Optional[tuple] = None
+
+
+def default_policies() -> List[RetentionPolicy]:
+    settings = config.settings
+    return [
+        RetentionPolicy(
+            "history", History, "timestamp", settings.RETENTION_HISTORY_DAYS
+        ),
+        *(
+            RetentionPolicy(
+                f"history_rollup_{resolution}",
+                HistoryRollup,
+                "bucket_start",
+                getattr(settings, f"RETENTION_ROLLUP_{resolution.upper()}_DAYS"),
+                (HistoryRollup.resolution == resolution,),
+            )
+            for resolution in ("15m", "1h", "1d")
+        ),
+    ]
+
+
+class Retention:
+    """
+    Delete expired rows in small batches, one transaction per batch.
+
+    Each batch deletes at most batch_size of the oldest expired rows, so no
+    run holds a long lock on a live table, and pauses between batches to let
+    the minute history insert through. If archive_dir is set, deleted rows
+    are appended to a gzipped CSV per table and day before the batch commits;
+    a failed write rolls the batch back and stops that table's run.
+
+    Usage:
+        retention = Retention()
+        scheduler.add_job(retention.run, "cron", minute=30)
+    """
+
+    def __init__(
+        self,
+        policies: Optional[List[RetentionPolicy]] = None,
+        batch_size: Optional[int] = None,
+        pause: Optional[float] = None,
+        archive_dir: Optional[str] = None,
+    ):
+        settings = config.settings
+        self.policies = policies if policies is not None else default_policies()
+        self.batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+        self.pause = settings.RETENTION_BATCH_PAUSE if pause is None else pause
+        self.archive_dir = archive_dir or settings.RETENTION_ARCHIVE_DIR
+
+    def _delete_statement(self, policy: RetentionPolicy, cutoff: datetime):
+        table = policy.model.__table__
+        expired = select(table.c.id).where(table.c[policy.column] < cutoff)
+        if policy.where:
+            expired = expired.where(*policy.where)
+        expired = expired.order_by(table.c[policy.column]).limit(self.batch_size)
+        statement = delete(table).where(table.c.id.in_(expired.scalar_subquery()))
+        if self.archive_dir:
+            statement = statement.returning(*table.c)
+        return statement
+
+    def _archive(self, policy: RetentionPolicy, result):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        day = datetime.now(UTC).strftime("%Y%m%d")
+        path = os.path.join(self.archive_dir, f"{policy.name}-{day}.csv.gz")
+        is_new = not os.path.exists(path)
+        rows = result.all()
+        # Appending adds a gzip member; readers see one continuous file
+        with gzip.open(path, "at", newline="") as archive:
+            writer = csv.writer(archive)
+            if is_new:
+                writer.writerow(result.keys())
+            writer.writerows(rows)
+        return len(rows)
+
+    def _delete_batch(self, policy: RetentionPolicy, cutoff: datetime) -> int:
+        deleted = 0
+        with session_scope() as session:
+            result = session.execute(self._delete_statement(policy, cutoff))
+            if self.archive_dir:
+                deleted = self._archive(policy, result)
+            else:
+                deleted = result.rowcount
+        # session_scope rolls back and logs on error, leaving deleted at 0
+        return deleted
+
+    def purge(self, policy: RetentionPolicy) -> int:
+        """Delete every expired row of one policy and return the count."""
+        if policy.days <= 0:
+            return 0
+        now = datetime.now(UTC).replace(tzinfo=None)
+        cutoff = now - timedelta(days=policy.days)
+        total = 0
+        while True:
+            deleted = self._delete_batch(policy, cutoff)
+            total += deleted
+            if deleted < self.batch_size:
+                break
+            time.sleep(self.pause)
+        if total:
+            logger.info(f"Retention removed {total} rows from {policy.name}")
+        return total
+
+    def run(self):
+        for policy in self.policies:
+            self.purge(policy)
@@ -10,8 +10,8 @@ class Valve(Device):
             raise ValueError("Valve must be winter or summer")
         else:
             self.relay_number = Relay["{}_VALVE".format(season.upper())]
-            self.table_class_name = "{}Valve".format(season.capitalize())
-            self.device_repository = DeviceRepository(self.table_class_name)
+            self.device_id = self.relay_number.value
+            self.device_repository = DeviceRepository(self.device_id)
             self.edge_server = EdgeServer()
 
     def __getattr__(self, name):
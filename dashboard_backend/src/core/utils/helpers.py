@@ -1,3 +1,13 @@
+from datetime import UTC, datetime
+
+
 def c_to_f(t):
     # Convert Celsius to Fahrenheit
     return round(((9.0 / 5.0) * t + 32.0), 1)
+
+
+def to_naive_utc(at: datetime) -> datetime:
+    # The timestamp columns are naive UTC; asyncpg rejects aware values for them
+    if at.tzinfo is not None:
+        at = at.astimezone(UTC).replace(tzinfo=None)
+    return at
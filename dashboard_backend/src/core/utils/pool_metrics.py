@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Checkout, wait and overflow counters for one engine's connection pool.
+
+    Checkouts and checkins are counted from pool events. The wait is the time
+    spent getting a connection from the pool, which includes opening a new
+    one when the pool grows into its overflow; it is only measured by the
+    Metered pool classes below.
+
+    Usage:
+        engine = create_engine(url, poolclass=MeteredQueuePool)
+        metrics = PoolMetrics.attach(engine)
+        metrics.snapshot()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.in_use_peak = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @classmethod
+    def attach(cls, engine) -> "PoolMetrics":
+        """Collect metrics for engine, sync or async."""
+        engine = getattr(engine, "sync_engine", engine)
+        metrics = cls()
+        metrics._pool = engine.pool
+        engine.pool.metrics = metrics
+        # Listeners on the engine survive the pool being recreated on dispose
+        event.listen(engine, "checkout", metrics._on_checkout)
+        event.listen(engine, "checkin", metrics._on_checkin)
+        event.listen(engine, "connect", metrics._on_connect)
+        event.listen(engine, "invalidate", metrics._on_invalidate)
+        return metrics
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use_peak = max(self.in_use_peak, self.checkouts - self.checkins)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Return the counters and the pool's current size and overflow."""
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "in_use_peak": self.in_use_peak,
+                "wait_total": round(self.wait_total, 6),
+                "wait_max": round(self.wait_max, 6),
+                "wait_avg": (
+                    round(self.wait_total / self.checkouts, 6)
+                    if self.checkouts
+                    else None
+                ),
+            }
+        pool = self._pool
+        if isinstance(pool, QueuePool):
+            data.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": max(pool.overflow(), 0),
+                    "max_overflow": pool._max_overflow,
+                }
+            )
+        return data
+
+
+class _MeteredPool:
+    """Time each connection request and count the ones that time out."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics._pool = pool
+        return pool
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    pass
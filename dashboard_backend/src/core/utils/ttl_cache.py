@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    timestamp: float
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.timestamp
+
+
+class _Call:
+    """A load in flight that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """
+    A keyed cache with per-call TTL, single-flight loads and stale fallback.
+
+    Concurrent misses on the same key share one load, whether they come from
+    threads (get) or from coroutines (aget). If a load fails, the last value
+    is returned with stale=True as long as it is at most max_stale seconds
+    old; otherwise the error is raised. A value loaded across an invalidate()
+    is handed to the callers that asked for it but not cached.
+
+    Usage:
+        cache = TTLCache(max_stale=300)
+        value, stale = cache.get("boiler_stats", 5, edge_server.read_stats)
+        value, stale = await cache.aget("snapshot", 2, edge_server.read_snapshot)
+        cache.invalidate("boiler_stats", "snapshot")
+    """
+
+    def __init__(self, max_stale: float = 300.0):
+        self.max_stale = max_stale
+        self._entries: Dict[str, CacheEntry] = {}
+        self._generations: Dict[str, int] = {}
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key: str, ttl: float) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.age <= ttl:
+            return entry
+        return None
+
+    def _store(self, key: str, generation: int, value):
+        with self._lock:
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = CacheEntry(value, time.monotonic())
+
+    def _stale_or_raise(self, key: str, error: BaseException) -> Tuple[Any, bool]:
+        entry = self._entries.get(key)
+        if entry is None or entry.age > self.max_stale:
+            raise error
+        return entry.value, True
+
+    def get(self, key: str, ttl: float, load: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return (value, stale), calling load() on a miss."""
+        with self._lock:
+            entry = self._fresh(key, ttl)
+            if entry is not None:
+                return entry.value, False
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                generation = self._generations.get(key, 0)
+
+        if leader:
+            try:
+                call.value = load()
+                self._store(key, generation, call.value)
+            except Exception as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            return self._stale_or_raise(key, call.error)
+        return call.value, False
+
+    async def _aload(self, key: str, load: Callable[[], Awaitable[Any]]):
+        generation = self._generations.get(key, 0)
+        value = await load()
+        self._store(key, generation, value)
+        return value
+
+    async def aget(
+        self, key: str, ttl: float, load: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Return (value, stale), awaiting load() on a miss.
+
+        A caller that is cancelled, e.g. by its own deadline, leaves the
+        shared load running for the others.
+        """
+        entry = self._fresh(key, ttl)
+        if entry is not None:
+            return entry.value, False
+
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._aload(key, load))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        try:
+            return await asyncio.shield(task), False
+        except Exception as e:
+            return self._stale_or_raise(key, e)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter has gone
+            task.exception()
+
+    def invalidate(self, *keys: str):
+        """Drop the given keys, or everything if none are given.
+
+        Loads of those keys already in flight are not cached.
+        """
+        with self._lock:
+            keys = keys or set(self._entries) | set(self._calls) | set(self._tasks)
+            for key in keys:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
@@ -1,3 +1,4 @@
+import logging
 import os
 from datetime import datetime
 
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 from src.core.configs.config import settings
 from src.core.configs.database import session_scope
 from src.core.models import User
+from src.core.repositories.user_repository import UserRepository
 from src.features.auth.jwt_handler import (
     UserToken,
     create_access_token,
@@ -15,6 +17,8 @@ from src.features.auth.jwt_handler import (
 )
 from src.features.auth.password_manager import PasswordManager
 
+logger = logging.getLogger(__name__)
+
 
 class Tokens(BaseModel):
     access: str
@@ -26,6 +30,7 @@ class AuthService:
         self.jwt_secret_key = settings.JWT_SECRET_KEY
         self.jwt_algorithm = settings.JWT_ALGORITHM
         self.password_manager = PasswordManager()
+        self.user_repository = UserRepository()
 
     def create_user(self, email: str, password: str):
         with session_scope() as session:
@@ -44,17 +49,19 @@ class AuthService:
                 session.commit()
                 return new_user
 
-    def authenticate_user(self, email: str, password: str):
-        with session_scope() as session:
-            user = session.query(User).filter(User.email == email).first()
-            session.expunge_all()
-            if user:
-                if self.password_manager.verify_password(password, user.password):
-                    return user
+    async def authenticate_user(self, email: str, password: str):
+        try:
+            user = await self.user_repository.get_by_email(email)
+        except Exception as e:
+            logger.exception(f"Failed during interaction with the db: {e}")
             return None
+        if user:
+            if self.password_manager.verify_password(password, user.password):
+                return user
+        return None
 
-    def login(self, email: str, password: str):
-        user = self.authenticate_user(email, password)
+    async def login(self, email: str, password: str):
+        user = await self.authenticate_user(email, password)
         if not user:
             raise HTTPException(
                 status_code=401,
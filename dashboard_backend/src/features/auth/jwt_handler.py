@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Annotated, TypedDict
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 from jose.exceptions import ExpiredSignatureError, JWTError
@@ -101,11 +101,9 @@ async def revoke_user_tokens(user_id: UUID) -> None:
     return
 
 
-async def get_current_user_from_jwt_token(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(scheme)],
-) -> UserToken:
+def get_user_from_access_token(token: str) -> UserToken:
     try:
-        payload = verify_access_token(token.credentials)
+        payload = verify_access_token(token)
         return UserToken(
             user_id=payload["sub"],
         )
@@ -114,3 +112,16 @@ async def get_current_user_from_jwt_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
+
+
+async def get_current_user_from_jwt_token(
+    token: Annotated[HTTPAuthorizationCredentials, Depends(scheme)],
+) -> UserToken:
+    return get_user_from_access_token(token.credentials)
+
+
+async def get_current_user_from_query_token(
+    access_token: Annotated[str, Query()],
+) -> UserToken:
+    """For clients that cannot set headers, such as the browser's EventSource."""
+    return get_user_from_access_token(access_token)
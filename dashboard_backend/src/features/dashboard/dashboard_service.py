@@ -1,34 +1,152 @@
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import math
+import re
+from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException
-from sqlalchemy import desc, or_
-from sqlalchemy.sql import func
+from sqlalchemy import desc
+from src.core.configs import config
 from src.core.configs.database import session_scope
 from src.core.models import History
-from src.core.repositories.boiler_repository import BoilerRepository
-from src.core.repositories.chiller_repository import ChillerRepository
+from src.core.repositories.device_state_repository import DeviceStateRepository
 from src.core.repositories.history_repository import HistoryRepository
+from src.core.repositories.rollup_repository import RollupRepository
 from src.core.repositories.setting_repository import SettingRepository
 from src.core.services.chronos import Chronos
-from src.core.services.edge_server import EdgeServer
+from src.core.services.edge_server import AsyncEdgeServer, EdgeServer
 from src.core.utils.constant import EFFICIENCY_HOUR, Mode, Relay
 
+logger = logging.getLogger(__name__)
+
+CHART_WINDOW_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+# History is only kept for a week
+MAX_CHART_WINDOW = timedelta(days=7)
+# Seconds between history rows (one per scheduler minute)
+HISTORY_INTERVAL = 60
+# Relays whose state is shown on the dashboard
+DEVICE_RELAYS = (
+    Relay.BOILER,
+    Relay.CHILLER1,
+    Relay.CHILLER2,
+    Relay.CHILLER3,
+    Relay.CHILLER4,
+    Relay.WINTER_VALVE,
+    Relay.SUMMER_VALVE,
+)
+
+
+def parse_chart_window(window: str) -> timedelta:
+    """Parse a chart window such as "90m", "24h" or "7d"."""
+    match = re.fullmatch(r"(\d+)([mhd])", window or "")
+    if not match:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid window: {window!r}, e.g. 1h, 24h or 7d"
+        )
+    amount, unit = match.groups()
+    return min(timedelta(**{CHART_WINDOW_UNITS[unit]: int(amount)}), MAX_CHART_WINDOW)
+
+
+def parse_chart_cursor(since):
+    """Split a since cursor into (id, None) or (None, timestamp)."""
+    if since is None or since == "":
+        return None, None
+    if since.isdigit():
+        return int(since), None
+    try:
+        return None, datetime.fromisoformat(since)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid since: {since!r}, expected a point id or ISO timestamp",
+        )
+
 
 class DashboardService:
     def __init__(self):
         self.chronos = Chronos()
         self.history_repository = HistoryRepository()
         self.setting_repository = SettingRepository()
-        self.boiler_repository = BoilerRepository()
-        self.chiller_repository = ChillerRepository()
+        self.rollup_repository = RollupRepository()
+        self.device_state_repository = DeviceStateRepository()
         self.edge_server = EdgeServer()
+        self.async_edge_server = AsyncEdgeServer()
 
-    def get_data(self):
-        history = self.history_repository.get_last_history()
-        settings = self.setting_repository.get_last_settings()
+    async def _call(self, degraded, name, func, *args, default=None):
+        """Run one dashboard source within the deadline.
+
+        Blocking callables run in a worker thread. On error or timeout the
+        default is returned and the source is recorded as degraded.
+        """
+        try:
+            async with asyncio.timeout(config.settings.DASHBOARD_CALL_DEADLINE):
+                if asyncio.iscoroutinefunction(func):
+                    return await func(*args)
+                return await asyncio.to_thread(func, *args)
+        except Exception as e:
+            logger.error(f"Dashboard source {name} unavailable: {e!r}")
+            degraded.append(name)
+            return default
+
+    async def get_data(self):
+        """Collect the dashboard from the edge server and the database.
+
+        All sources are queried concurrently, so the latency is that of the
+        slowest one (bounded by DASHBOARD_CALL_DEADLINE). Everything from the
+        edge server comes from a single /snapshot call. Sources or snapshot
+        sections that fail are left at their defaults and listed under
+        "degraded".
+        """
+        degraded = []
+        (
+            history,
+            settings,
+            unlock_time,
+            efficiency,
+            cascade_fire_rate_avg,
+            devices,
+            snapshot,
+        ) = await asyncio.gather(
+            self._call(degraded, "history", self.history_repository.get_last_history),
+            self._call(
+                degraded, "settings", self.setting_repository.aget_last_settings
+            ),
+            self._call(degraded, "unlock_time", self.get_unlock_time),
+            self._call(
+                degraded,
+                "efficiency",
+                self.calculate_efficiency,
+                default={
+                    "average_temperature_difference": 0,
+                    "chillers_efficiency": 0,
+                },
+            ),
+            self._call(
+                degraded,
+                "cascade_fire_rate_avg",
+                self.get_cascade_fire_rate_avg,
+                default=0,
+            ),
+            self._call(degraded, "devices", self.get_all_devices_state, default=[]),
+            self._call(
+                degraded, "edge", self.async_edge_server.get_snapshot, default={}
+            ),
+        )
+        if snapshot.get("stale"):
+            degraded.append("edge")
+        sections = {}
+        for name in ("sensors", "boiler_status", "boiler_stats"):
+            section = snapshot.get(name) or {}
+            if section.get("error"):
+                degraded.append(name)
+            sections[name] = section.get("data")
+        edge_server_data = {
+            key: snapshot[key]
+            for key in ("status", "mock_devices", "read_only_mode")
+            if key in snapshot
+        }
+        edge_server_data["sensors"] = sections["sensors"] or {}
 
-        edge_server_data = self.edge_server.get_data()
-        # edge_server_data["devices"][0]["state"] = True
         results = {
             "outside_temp": getattr(history, "outside_temp", 0),
             "baseline_setpoint": getattr(self.chronos, "baseline_setpoint", 0),
@@ -50,41 +168,72 @@ class DashboardService:
                 else 0
             ),
             "wind_chill_avg": getattr(history, "avg_outside_temp", 0),
-            "unlock_time": self.get_unlock_time(),
+            "unlock_time": unlock_time,
         }
 
-        efficiency = self.calculate_efficiency()
-        boiler_status = self.edge_server.get_boiler_status()
-        boiler_stats = self.edge_server.get_data_boiler_stats()
         boiler = {
-            "status": boiler_status,
-            "stats": boiler_stats,
+            "status": sections["boiler_status"],
+            "stats": sections["boiler_stats"],
         }
-        efficiency["cascade_fire_rate_avg"] = round(
-            self.chronos.cascade_fire_rate_avg, 1
-        )
+        efficiency["cascade_fire_rate_avg"] = round(cascade_fire_rate_avg, 1)
         efficiency["hours"] = EFFICIENCY_HOUR
         return {
             **edge_server_data,
             "results": results,
             "efficiency": efficiency,
             "boiler": boiler,
-            "devices": self.get_all_devices_state(),
+            "devices": devices,
+            "degraded": degraded,
         }
 
-    def get_chart_data(self):
-        rows = self.history_repository.get_last_histories()
-        data = [
+    async def get_chart_data(self, since=None, window="1h", points=None):
+        """Return the temperature chart points within window, oldest first.
+
+        Args:
+            since (str): A point id or an ISO timestamp; only newer points
+                are returned, so a client can append to what it has
+            window (str): How far back to look, e.g. "90m", "24h" or "7d"
+            points (int): Target number of points. If the window holds more
+                history rows than that, rows are averaged into time buckets
+                in the database and each point also gets the bucket's min and
+                max as "column-1-min", "column-1-max", etc.
+        """
+        since_id, since_time = parse_chart_cursor(since)
+        window = parse_chart_window(window)
+        bucket_seconds = (
+            math.ceil(window.total_seconds() / points) if points else HISTORY_INTERVAL
+        )
+        if bucket_seconds <= HISTORY_INTERVAL:
+            rows = await self.history_repository.get_chart_points(
+                window, since_id=since_id, since_time=since_time
+            )
+            return [
+                {
+                    "id": row.id,
+                    "column-1": row.water_out_temp,
+                    "column-2": row.return_temp,
+                    "date": row.timestamp.strftime("%Y-%m-%dT%H:%MZ"),
+                }
+                for row in rows
+            ]
+
+        rows = await self.history_repository.get_chart_buckets(
+            window, bucket_seconds, since_id=since_id, since_time=since_time
+        )
+        return [
             {
-                "column-1": row.water_out_temp,
-                "column-2": row.return_temp,
+                "id": row.id,
+                "column-1": round(row.water_out_temp, 1),
+                "column-1-min": row.water_out_temp_min,
+                "column-1-max": row.water_out_temp_max,
+                "column-2": round(row.return_temp, 1),
+                "column-2-min": row.return_temp_min,
+                "column-2-max": row.return_temp_max,
                 "date": row.timestamp.strftime("%Y-%m-%dT%H:%MZ"),
             }
-            for row in reversed(rows)
+            for row in rows
         ]
 
-        return data
-
     def three_minute_avg_delta(self):
         data = self.three_minute_avg_delta()
         return data
@@ -181,41 +330,16 @@ class DashboardService:
             else:
                 stop = True
 
-    def calculate_efficiency(self):
+    async def calculate_efficiency(self):
         hours = EFFICIENCY_HOUR
-        timespan = datetime.now() - timedelta(hours=hours)
-        with session_scope() as session:
-            amount_minutes = (
-                session.query(
-                    History.chiller1_status,
-                    History.chiller2_status,
-                    History.chiller3_status,
-                    History.chiller4_status,
-                )
-                .order_by(desc(History.id))
-                .filter(
-                    History.mode == 1,
-                    History.timestamp > timespan,
-                    or_(
-                        History.chiller1_status == 1,
-                        History.chiller2_status == 1,
-                        History.chiller3_status == 1,
-                        History.chiller4_status == 1,
-                    ),
-                )
-                .count()
-            )
-            rows = (
-                session.query(History.return_temp, History.effective_setpoint)
-                .order_by(desc(History.id))
-                .filter(History.timestamp > timespan)
-                .subquery()
-            )
-            effective_setpoint_avg, inlet_temp_avg = session.query(
-                func.avg(rows.c.effective_setpoint), func.avg(rows.c.return_temp)
-            ).first()
-
-            session.expunge_all()
+        timespan = datetime.now(UTC) - timedelta(hours=hours)
+        overall, summer = await asyncio.gather(
+            self.rollup_repository.asummarize(timespan),
+            self.rollup_repository.asummarize(timespan, mode=Mode.SUMMER.value),
+        )
+        amount_minutes = summer.chiller_on_minutes
+        effective_setpoint_avg = overall.effective_setpoint_avg
+        inlet_temp_avg = overall.return_temp_avg
 
         effective_setpoint_avg = effective_setpoint_avg or 0
         inlet_temp_avg = inlet_temp_avg or 0
@@ -228,14 +352,12 @@ class DashboardService:
             "chillers_efficiency": chiller_efficiency,
         }
 
-    def keep_history_for_last_week(self):
-        with session_scope() as session:
-            old_history = session.query(History).filter(
-                History.timestamp < (datetime.now() - timedelta(days=7))
-            )
-            old_history.delete()
-
-            session.expunge_all()
+    async def get_cascade_fire_rate_avg(self):
+        timespan = datetime.now(UTC) - timedelta(hours=EFFICIENCY_HOUR)
+        summary = await self.rollup_repository.asummarize(
+            timespan, mode=Mode.WINTER.value
+        )
+        return summary.cascade_fire_rate_avg or 0
 
     def get_boiler_stats(self):
         return self.edge_server.get_data_boiler_stats()
@@ -318,54 +440,32 @@ class DashboardService:
             "unlock_time": unlock_time.isoformat(),
         }
 
-    def get_all_devices_state(self):
+    async def get_all_devices_state(self):
         # devices = self.edge_server.get_all_devices_state()
         # for device in devices:
         #     self.update_device_state_in_db(id=device.id, state=device.state)
-        devices = [
-            {
-                "id": Relay.BOILER.value,
-                "state": self.boiler_repository.get_status(),
-                "switched_timestamp": self.boiler_repository.get_unlock_timestamp().isoformat(),
-            },
-            {
-                "id": Relay.CHILLER1.value,
-                "state": self.chiller_repository.get_chiller_status("Chiller1"),
-                "switched_timestamp": self.chiller_repository.get_unlock_timestamp(
-                    "Chiller1"
-                ).isoformat(),
-            },
-            {
-                "id": Relay.CHILLER2.value,
-                "state": self.chiller_repository.get_chiller_status("Chiller2"),
-                "switched_timestamp": self.chiller_repository.get_unlock_timestamp(
-                    "Chiller2"
-                ).isoformat(),
-            },
-            {
-                "id": Relay.CHILLER3.value,
-                "state": self.chiller_repository.get_chiller_status("Chiller3"),
-                "switched_timestamp": self.chiller_repository.get_unlock_timestamp(
-                    "Chiller3"
-                ).isoformat(),
-            },
-            {
-                "id": Relay.CHILLER4.value,
-                "state": self.chiller_repository.get_chiller_status("Chiller4"),
-                "switched_timestamp": self.chiller_repository.get_unlock_timestamp(
-                    "Chiller4"
-                ).isoformat(),
-            },
-        ]
-
+        states = await self.device_state_repository.get_states()
+        devices = []
+        for relay in DEVICE_RELAYS:
+            state = states[relay.value]
+            switched = state.switched_timestamp
+            devices.append(
+                {
+                    "id": relay.value,
+                    "state": state.status,
+                    # Valves have no switch time until written from here
+                    "switched_timestamp": switched and switched.isoformat(),
+                }
+            )
         return devices
 
-    def update_device_state(self, data):
+    async def update_device_state(self, data):
         try:
-            device_state = self.edge_server.update_device_state(
-                id=data.id, state=data.state
+            # The write goes through the sync client, which owns the retry policy
+            device_state = await asyncio.to_thread(
+                self.edge_server.update_device_state, id=data.id, state=data.state
             )
-            self.update_device_state_in_db(id=data.id, state=data.state)
+            await self.update_device_state_in_db(id=data.id, state=data.state)
             return device_state
 
         except Exception as e:
@@ -373,26 +473,18 @@ class DashboardService:
                 status_code=500, detail=f"Failed to update device state: {str(e)}"
             )
 
-    def update_device_state_in_db(self, id: int, state: bool):
-        state = 1 if state else 0
-        if id == Relay.BOILER.value:
-            self.boiler_repository.set_status(state)
-        elif id == Relay.CHILLER1.value:
-            self.chiller_repository.set_chiller_status("Chiller1", state)
-        elif id == Relay.CHILLER2.value:
-            self.chiller_repository.set_chiller_status("Chiller2", state)
-        elif id == Relay.CHILLER3.value:
-            self.chiller_repository.set_chiller_status("Chiller3", state)
-        elif id == Relay.CHILLER4.value:
-            self.chiller_repository.set_chiller_status("Chiller4", state)
-
-    def get_unlock_time(self):
-        mode_switch_timestamp = self.setting_repository._get_property_from_db(
-            "mode_switch_timestamp"
+    async def update_device_state_in_db(self, id: int, state: bool):
+        if id not in {relay.value for relay in DEVICE_RELAYS}:
+            return
+        await self.device_state_repository.update_state(
+            id,
+            status=1 if state else 0,
+            switched_timestamp=datetime.now(UTC),
         )
-        unlock_time = mode_switch_timestamp + timedelta(
-            minutes=self.setting_repository._get_property_from_db(
-                "mode_switch_lockout_time"
-            )
+
+    async def get_unlock_time(self):
+        settings = await self.setting_repository.aget_last_settings()
+        unlock_time = settings.mode_switch_timestamp + timedelta(
+            minutes=settings.mode_switch_lockout_time
         )
         return unlock_time.strftime("%Y-%m-%dT%H:%M:%SZ")
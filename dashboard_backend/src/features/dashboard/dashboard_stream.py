@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def merge_patch(old, new):
+    """Return the JSON merge patch (RFC 7386) that turns old into new.
+
+    Dicts are diffed key by key; any other changed value, lists included,
+    is replaced whole. Removed keys are null. Returns {} if nothing changed.
+    """
+    patch = {}
+    for key in old.keys() - new.keys():
+        patch[key] = None
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested = merge_patch(old[key], value)
+            if nested:
+                patch[key] = nested
+        elif old[key] != value:
+            patch[key] = value
+    return patch
+
+
+def sse_frame(event: str, data, id: Optional[int] = None) -> bytes:
+    lines = [f"event: {event}"]
+    if id is not None:
+        lines.append(f"id: {id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class DashboardStream:
+    """
+    Compute the dashboard once per tick and push it to every subscriber.
+
+    A single producer task runs while at least one client is subscribed. Each
+    tick that changes the dashboard becomes a new version, and its frames are
+    encoded once: a "snapshot" with the full state and a "delta" with the
+    merge patch from the previous version. A client that is one version
+    behind gets the delta. A new or lagging client gets the snapshot, so a
+    slow reader skips intermediate versions instead of queueing them.
+    poke() runs the next tick at once, e.g. after a write.
+
+    Usage:
+        stream = DashboardStream(dashboard_service.get_data, interval=2)
+        async for frame in stream.frames():
+            ...
+    """
+
+    def __init__(
+        self,
+        produce: Callable[[], Awaitable[dict]],
+        interval: float = 2.0,
+        heartbeat: float = 15.0,
+    ):
+        self.produce = produce
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self.version = 0
+        self.state: Optional[dict] = None
+        self._snapshot_frame: Optional[bytes] = None
+        self._delta_frame: Optional[bytes] = None
+        self._changed = asyncio.Event()
+        self._wake = asyncio.Event()
+        self._subscribers = 0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def subscribers(self) -> int:
+        return self._subscribers
+
+    def publish(self, state: dict):
+        """Make state the current version if it differs from the last one."""
+        if self.state is not None:
+            patch = merge_patch(self.state, state)
+            if not patch:
+                return
+            self._delta_frame = sse_frame("delta", patch, self.version + 1)
+        self.version += 1
+        self.state = state
+        self._snapshot_frame = sse_frame("snapshot", state, self.version)
+        # Wake everyone waiting on this version, then arm a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def tick(self):
+        try:
+            self.publish(await self.produce())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Dashboard stream tick failed: {e}")
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            await self.tick()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def poke(self):
+        """Run the next tick now; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake.set()
+        else:
+            loop.call_soon_threadsafe(self._wake.set)
+
+    def start(self):
+        """Start the producer on the running event loop."""
+        if self._task is None or self._task.done():
+            loop = asyncio.get_running_loop()
+            if loop is not self._loop:
+                self._changed = asyncio.Event()
+                self._wake = asyncio.Event()
+                self._loop = loop
+            self._task = loop.create_task(self._run())
+
+    async def stop(self):
+        """Stop the producer and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        """Yield SSE frames for one subscriber until the caller stops."""
+        self._subscribers += 1
+        self.start()
+        seen = 0
+        try:
+            while True:
+                if self.version == seen:
+                    changed = self._changed
+                    try:
+                        await asyncio.wait_for(changed.wait(), self.heartbeat)
+                    except asyncio.TimeoutError:
+                        yield b": keep-alive\n\n"
+                        continue
+                # Pick the frame before yielding; versions may move meanwhile
+                if seen and seen == self.version - 1:
+                    frame = self._delta_frame
+                else:
+                    frame = self._snapshot_frame
+                seen = self.version
+                yield frame
+        finally:
+            self._subscribers -= 1
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
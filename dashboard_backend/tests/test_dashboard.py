@@ -1,13 +1,19 @@
+import asyncio
+import inspect
 import os
 import sys
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
 
+import httpx
 import pytest
+import requests
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import HTTPException
 from src.api.dependencies import get_current_user
@@ -16,12 +22,18 @@ from src.api.routers.dashboard_router import (
     get_edge_server,
     router,
 )
-from src.core.common.exceptions import EdgeServerError
+from src.core.common.exceptions import ConnectToEdgeServerError, EdgeServerError
+from src.core.models import DeviceState
 from src.core.services.chronos import Chronos
 from src.core.services.device import Device
-from src.core.services.edge_server import EdgeServer
+from src.core.services.edge_server import AsyncEdgeServer, EdgeServer, edge_cache
+from src.core.utils.constant import EFFICIENCY_HOUR, Mode, Relay
 from src.features.auth.jwt_handler import UserToken
-from src.features.dashboard.dashboard_service import DashboardService
+from src.features.dashboard.dashboard_service import (
+    DashboardService,
+    parse_chart_cursor,
+    parse_chart_window,
+)
 
 app = FastAPI()
 app.include_router(router, prefix="/api")
@@ -215,6 +227,23 @@ def test_update_settings_validation(client, mock_edge_server):
     assert response.status_code == 422
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/update_settings",
+        "/boiler_stats",
+        "/boiler_status",
+        "/temperature_limits",
+        "/boiler_set_setpoint",
+        "/switch-season",
+    ],
+)
+def test_blocking_handlers_run_in_threadpool(path):
+    # Sync DB and edge server calls must stay off the event loop
+    (route,) = [route for route in router.routes if route.path == path]
+    assert not inspect.iscoroutinefunction(route.endpoint)
+
+
 def test_switch_season_success(client, mock_edge_server, mock_dashboard_service):
     mock_dashboard_service.switch_season_mode.return_value = (
         switch_season_success_response
@@ -232,3 +261,328 @@ def test_switch_season_invalid_season_value(client, mock_dashboard_service):
     response = client.post("/api/switch-season", json={"season_value": 6})
     assert response.status_code == 400
     assert response.json() == {"detail": "Invalid season value: 6"}
+
+
+BOILER_STATUS = {"operating_mode": 3, "current_setpoint": 90.0}
+BOILER_STATS = {"outlet_temp": 158.0, "flame_status": True}
+SNAPSHOT = {
+    "sensors": {
+        "data": {"return_temp": 75.0, "water_out_temp": 85.0},
+        "timestamp": 1.0,
+        "error": None,
+    },
+    "boiler_status": {"data": BOILER_STATUS, "timestamp": 1.0, "error": None},
+    "boiler_stats": {"data": BOILER_STATS, "timestamp": 1.0, "error": None},
+    "status": True,
+    "mock_devices": False,
+    "read_only_mode": False,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_edge_cache():
+    edge_cache.invalidate()
+    yield
+    edge_cache.invalidate()
+
+
+def async_edge_server(delay=0.0, fail=(), snapshot=SNAPSHOT):
+    responses = {
+        "/snapshot": snapshot,
+        "/boiler_status": BOILER_STATUS,
+        "/boiler_stats": BOILER_STATS,
+    }
+
+    async def handler(request):
+        await asyncio.sleep(delay)
+        if request.url.path in fail:
+            return httpx.Response(500, json={"detail": "Modbus read failed"})
+        return httpx.Response(200, json=responses[request.url.path])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncEdgeServer(client=client)
+
+
+def slow(value, delay=0.2):
+    def read():
+        time.sleep(delay)
+        return value
+
+    return read
+
+
+@pytest.fixture
+def dashboard():
+    service = DashboardService()
+    service.history_repository = MagicMock()
+    service.history_repository.get_last_history = slow(None)
+    service.setting_repository = MagicMock()
+    service.setting_repository.aget_last_settings = slow(None)
+    service.chronos = MagicMock(baseline_setpoint=0)
+    service.get_unlock_time = slow("2025-01-01T00:00:00Z")
+    service.get_cascade_fire_rate_avg = slow(50.0)
+    service.calculate_efficiency = slow(
+        {"average_temperature_difference": 1.0, "chillers_efficiency": 0.5}
+    )
+    service.get_all_devices_state = slow([{"id": 0, "state": True}])
+    return service
+
+
+def test_get_data_fans_out_concurrently(dashboard):
+    dashboard.async_edge_server = async_edge_server(delay=0.2)
+
+    start = time.monotonic()
+    result = asyncio.run(dashboard.get_data())
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert result["sensors"] == SNAPSHOT["sensors"]["data"]
+    assert result["status"] is True
+    assert result["boiler"] == {"status": BOILER_STATUS, "stats": BOILER_STATS}
+    assert result["devices"] == [{"id": 0, "state": True}]
+    assert result["efficiency"]["cascade_fire_rate_avg"] == 50.0
+    assert result["results"]["unlock_time"] == "2025-01-01T00:00:00Z"
+    assert result["degraded"] == []
+
+
+def test_get_data_degrades_failed_sources(dashboard):
+    snapshot = {
+        **SNAPSHOT,
+        "boiler_stats": {"data": None, "timestamp": None, "error": "Timed out"},
+    }
+    dashboard.async_edge_server = async_edge_server(snapshot=snapshot)
+
+    def broken():
+        raise RuntimeError("database unavailable")
+
+    dashboard.get_all_devices_state = broken
+
+    result = asyncio.run(dashboard.get_data())
+
+    assert sorted(result["degraded"]) == ["boiler_stats", "devices"]
+    assert result["boiler"]["stats"] is None
+    assert result["boiler"]["status"] == BOILER_STATUS
+    assert result["devices"] == []
+
+
+def test_get_data_enforces_call_deadline(dashboard, monkeypatch):
+    monkeypatch.setattr("src.core.configs.config.settings.DASHBOARD_CALL_DEADLINE", 0.5)
+    dashboard.async_edge_server = async_edge_server(delay=2)
+
+    start = time.monotonic()
+    result = asyncio.run(dashboard.get_data())
+
+    assert time.monotonic() - start < 1
+    assert result["degraded"] == ["edge"]
+    assert result["sensors"] == {}
+    assert result["boiler"] == {"status": None, "stats": None}
+    assert result["results"]["unlock_time"] == "2025-01-01T00:00:00Z"
+
+
+def test_async_edge_server_errors():
+    edge_server = async_edge_server(fail=("/boiler_stats",))
+    with pytest.raises(EdgeServerError, match="Modbus read failed"):
+        asyncio.run(edge_server.get_data_boiler_stats())
+
+    def refuse(request):
+        raise httpx.ConnectError("connection refused")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+    with pytest.raises(ConnectToEdgeServerError):
+        asyncio.run(AsyncEdgeServer(client=client).get_snapshot())
+
+
+def test_get_data_serves_stale_snapshot_on_error(dashboard, monkeypatch):
+    dashboard.async_edge_server = async_edge_server()
+    asyncio.run(dashboard.get_data())
+
+    monkeypatch.setattr("src.core.configs.config.settings.EDGE_CACHE_SNAPSHOT_TTL", 0)
+    dashboard.async_edge_server = async_edge_server(fail=("/snapshot",))
+    result = asyncio.run(dashboard.get_data())
+
+    assert result["degraded"] == ["edge"]
+    assert result["sensors"] == SNAPSHOT["sensors"]["data"]
+
+
+def test_history_skips_stale_edge_data(monkeypatch):
+    monkeypatch.setattr("src.core.configs.config.settings.EDGE_CACHE_DATA_TTL", 0)
+    chronos = MagicMock(spec=Chronos, mode=Mode.WINTER.value, outside_temp=50.0)
+    chronos.edge_server = EdgeServer()
+    chronos.rollup_repository = MagicMock()
+    reply = MagicMock()
+    reply.json.return_value = {
+        "sensors": {"water_out_temp": 150.0, "return_temp": 140.0}
+    }
+
+    with patch("src.core.services.chronos.session_scope") as scope:
+        with patch.object(EdgeServer, "_get", return_value=reply):
+            Chronos.create_update_history(chronos)
+        with patch.object(
+            EdgeServer, "_get", side_effect=requests.exceptions.ConnectionError
+        ):
+            Chronos.create_update_history(chronos)
+
+    # Only the live reading is written, not the cached one served while down
+    session = scope.return_value.__enter__.return_value
+    session.add.assert_called_once()
+    chronos.rollup_repository.refresh.assert_called_once()
+
+
+def test_chart_data_passes_cursor_and_window(client, monkeypatch):
+    service = AsyncMock(spec=DashboardService)
+    service.get_chart_data.return_value = [
+        {"id": 7, "column-1": 150.0, "column-2": 140.0, "date": "2025-01-01T00:00Z"}
+    ]
+    monkeypatch.setattr("src.api.routers.dashboard_router.dashboard_service", service)
+
+    response = client.get(
+        "/api/chart_data", params={"since": "6", "window": "24h", "points": 500}
+    )
+
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == 7
+    service.get_chart_data.assert_called_once_with(since="6", window="24h", points=500)
+
+    response = client.get("/api/chart_data", params={"points": 5})
+    assert response.status_code == 422
+
+
+def test_parse_chart_window_and_cursor():
+    assert parse_chart_window("90m") == timedelta(minutes=90)
+    assert parse_chart_window("24h") == timedelta(hours=24)
+    assert parse_chart_window("30d") == timedelta(days=7)
+    with pytest.raises(HTTPException) as error:
+        parse_chart_window("1w")
+    assert error.value.status_code == 422
+
+    assert parse_chart_cursor(None) == (None, None)
+    assert parse_chart_cursor("42") == (42, None)
+    assert parse_chart_cursor("2025-01-01T00:00:00") == (
+        None,
+        datetime(2025, 1, 1),
+    )
+    with pytest.raises(HTTPException):
+        parse_chart_cursor("yesterday")
+
+
+def test_get_chart_data_returns_points_oldest_first(dashboard):
+    Row = namedtuple("Row", "id timestamp water_out_temp return_temp")
+    dashboard.history_repository.get_chart_points = AsyncMock(
+        return_value=[
+            Row(1, datetime(2025, 1, 1, 0, 0), 150.0, 140.0),
+            Row(2, datetime(2025, 1, 1, 0, 1), 151.0, 141.0),
+        ]
+    )
+
+    points = asyncio.run(
+        dashboard.get_chart_data(since="2025-01-01T00:00:00", window="1h")
+    )
+
+    assert [point["id"] for point in points] == [1, 2]
+    assert points[1] == {
+        "id": 2,
+        "column-1": 151.0,
+        "column-2": 141.0,
+        "date": "2025-01-01T00:01Z",
+    }
+    dashboard.history_repository.get_chart_points.assert_called_once_with(
+        timedelta(hours=1), since_id=None, since_time=datetime(2025, 1, 1)
+    )
+
+
+def test_get_chart_data_downsamples_long_windows(dashboard):
+    Bucket = namedtuple(
+        "Bucket",
+        "id timestamp water_out_temp water_out_temp_min water_out_temp_max "
+        "return_temp return_temp_min return_temp_max",
+    )
+    dashboard.history_repository.get_chart_buckets = AsyncMock(
+        return_value=[
+            Bucket(10, datetime(2025, 1, 1), 150.04, 149.0, 151.0, 140.0, 139.0, 141.0)
+        ]
+    )
+
+    points = asyncio.run(dashboard.get_chart_data(window="7d", points=1000))
+
+    dashboard.history_repository.get_chart_buckets.assert_called_once_with(
+        timedelta(days=7), 605, since_id=None, since_time=None
+    )
+    assert points == [
+        {
+            "id": 10,
+            "column-1": 150.0,
+            "column-1-min": 149.0,
+            "column-1-max": 151.0,
+            "column-2": 140.0,
+            "column-2-min": 139.0,
+            "column-2-max": 141.0,
+            "date": "2025-01-01T00:00Z",
+        }
+    ]
+
+
+def test_get_chart_data_keeps_raw_rows_when_window_is_small(dashboard):
+    dashboard.history_repository = AsyncMock()
+    dashboard.history_repository.get_chart_points.return_value = []
+
+    asyncio.run(dashboard.get_chart_data(window="1h", points=100))
+
+    dashboard.history_repository.get_chart_points.assert_called_once()
+    dashboard.history_repository.get_chart_buckets.assert_not_called()
+
+
+def test_calculate_efficiency_reads_rollups():
+    service = DashboardService()
+    service.rollup_repository = AsyncMock()
+    overall = MagicMock(return_temp_avg=142.0, effective_setpoint_avg=140.04)
+    summer = MagicMock(chiller_on_minutes=144 * EFFICIENCY_HOUR)
+    service.rollup_repository.asummarize.side_effect = [overall, summer]
+
+    efficiency = asyncio.run(service.calculate_efficiency())
+
+    assert efficiency == {
+        "average_temperature_difference": 2.0,
+        "chillers_efficiency": 0.6,
+    }
+    assert service.rollup_repository.asummarize.call_args_list[1].kwargs == {
+        "mode": Mode.SUMMER.value
+    }
+
+
+def test_get_all_devices_state_reads_states_once():
+    service = DashboardService()
+    service.device_state_repository = AsyncMock()
+    service.device_state_repository.get_states.return_value = {
+        device_id: DeviceState(
+            device_id=device_id,
+            status=int(device_id == 2),
+            manual_override=0,
+            switched_timestamp=datetime(2025, 1, 1) if device_id < 5 else None,
+        )
+        for device_id in range(7)
+    }
+
+    devices = asyncio.run(service.get_all_devices_state())
+
+    service.device_state_repository.get_states.assert_awaited_once_with()
+    assert [device["id"] for device in devices] == list(range(7))
+    assert devices[2] == {
+        "id": 2,
+        "state": 1,
+        "switched_timestamp": "2025-01-01T00:00:00",
+    }
+    assert devices[Relay.WINTER_VALVE.value]["switched_timestamp"] is None
+
+
+def test_update_device_state_in_db_writes_once():
+    service = DashboardService()
+    service.device_state_repository = AsyncMock()
+
+    asyncio.run(service.update_device_state_in_db(id=3, state=True))
+    asyncio.run(
+        service.update_device_state_in_db(id=Relay.WINTER_VALVE.value, state=True)
+    )
+
+    calls = service.device_state_repository.update_state.await_args_list
+    assert [call.args for call in calls] == [(3,), (Relay.WINTER_VALVE.value,)]
+    assert all(call.kwargs["status"] == 1 for call in calls)
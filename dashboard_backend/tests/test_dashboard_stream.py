@@ -0,0 +1,133 @@
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.testclient import TestClient
+from main import app
+from src.features.auth.jwt_handler import (
+    UserToken,
+    create_access_token,
+    get_current_user_from_query_token,
+)
+from src.features.dashboard.dashboard_stream import DashboardStream, merge_patch
+
+
+def parse(frame):
+    lines = frame.decode().strip().split("\n")
+    fields = dict(line.split(": ", 1) for line in lines)
+    return fields["event"], json.loads(fields["data"])
+
+
+class Producer:
+    def __init__(self, *states):
+        self.states = list(states)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.states[min(self.calls, len(self.states)) - 1]
+
+
+def test_merge_patch():
+    old = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1], "gone": True}
+    new = {"a": 1, "b": {"c": 2, "d": 4}, "e": [1, 2], "f": None}
+
+    assert merge_patch(old, new) == {
+        "b": {"d": 4},
+        "e": [1, 2],
+        "f": None,
+        "gone": None,
+    }
+    assert merge_patch(new, new) == {}
+
+
+def test_subscribers_share_one_producer_and_receive_deltas():
+    producer = Producer({"temp": 70, "mode": 1}, {"temp": 71, "mode": 1})
+    stream = DashboardStream(producer, interval=0.05)
+
+    async def read(count):
+        frames = stream.frames()
+        events = [parse(await frames.__anext__()) for _ in range(count)]
+        await frames.aclose()
+        return events
+
+    async def scenario():
+        return await asyncio.gather(read(2), read(2))
+
+    first, second = asyncio.run(scenario())
+
+    expected = [("snapshot", {"temp": 70, "mode": 1}), ("delta", {"temp": 71})]
+    assert first == expected
+    assert second == expected
+    assert producer.calls <= 3
+    assert stream.subscribers == 0
+
+
+def test_unchanged_ticks_are_not_sent():
+    stream = DashboardStream(Producer({"temp": 70}), interval=0.01)
+    stream.publish({"temp": 70})
+    stream.publish({"temp": 70})
+    assert stream.version == 1
+
+
+def test_lagging_subscriber_gets_snapshot():
+    stream = DashboardStream(Producer({"temp": 70}), interval=10)
+
+    async def scenario():
+        frames = stream.frames()
+        first = parse(await frames.__anext__())
+        stream.publish({"temp": 71})
+        stream.publish({"temp": 72})
+        second = parse(await frames.__anext__())
+        await frames.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == ("snapshot", {"temp": 70})
+    assert second == ("snapshot", {"temp": 72})
+
+
+def test_poke_runs_next_tick_immediately():
+    producer = Producer({"temp": 70}, {"temp": 75})
+    stream = DashboardStream(producer, interval=10)
+
+    async def scenario():
+        frames = stream.frames()
+        await frames.__anext__()
+        stream.poke()
+        event = parse(await asyncio.wait_for(frames.__anext__(), 1))
+        await frames.aclose()
+        return event
+
+    assert asyncio.run(scenario()) == ("delta", {"temp": 75})
+
+
+def test_heartbeat_while_idle():
+    stream = DashboardStream(Producer({"temp": 70}), interval=10, heartbeat=0.01)
+
+    async def scenario():
+        frames = stream.frames()
+        await frames.__anext__()
+        frame = await frames.__anext__()
+        await frames.aclose()
+        return frame
+
+    assert asyncio.run(scenario()) == b": keep-alive\n\n"
+
+
+def test_stream_takes_the_access_token_from_the_query():
+    client = TestClient(app)
+
+    assert client.get("/api/stream").status_code == 422
+    response = client.get("/api/stream", params={"access_token": "invalid"})
+    assert response.status_code == 401
+
+
+def test_query_token_identifies_the_user():
+    token = create_access_token(UserToken(user_id="7"))
+
+    user = asyncio.run(get_current_user_from_query_token(token))
+    assert user.user_id == "7"
@@ -0,0 +1,83 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.configs import database
+from src.core.utils.pool_metrics import MeteredQueuePool, PoolMetrics
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_engines_use_configured_pool():
+    pool = database.engine.pool
+
+    assert isinstance(pool, MeteredQueuePool)
+    assert pool.size() == database.config.settings.DB_POOL_SIZE
+    assert pool._max_overflow == database.config.settings.DB_MAX_OVERFLOW
+    assert pool._pre_ping is database.config.settings.DB_POOL_PRE_PING
+    assert set(database.pool_metrics()) == {"sync", "async"}
+
+
+def test_pool_metrics_count_checkouts_and_overflow(sqlite_engine):
+    metrics = PoolMetrics.attach(sqlite_engine)
+
+    with sqlite_engine.connect() as first, sqlite_engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        during = metrics.snapshot()
+
+    after = metrics.snapshot()
+    assert during["checked_out"] == 2
+    assert during["overflow"] == 1
+    assert after["checkouts"] == after["checkins"] == 2
+    assert after["in_use_peak"] == 2
+    assert after["wait_avg"] is not None
+
+
+def test_pool_metrics_count_timeouts(sqlite_engine):
+    metrics = PoolMetrics.attach(sqlite_engine)
+
+    with sqlite_engine.connect(), sqlite_engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            sqlite_engine.connect()
+
+    assert metrics.snapshot()["timeouts"] == 1
+
+
+def test_pool_metrics_follow_a_recreated_pool(sqlite_engine):
+    metrics = PoolMetrics.attach(sqlite_engine)
+
+    sqlite_engine.dispose()
+    with sqlite_engine.connect():
+        pass
+
+    assert sqlite_engine.pool.metrics is metrics
+    assert metrics.snapshot()["checkouts"] == 1
+
+
+def test_nested_session_scope_joins_the_outer_session():
+    with patch.object(database, "Session") as session:
+        session.registry.has.side_effect = [False, True]
+        with database.session_scope() as outer:
+            with database.session_scope() as inner:
+                assert inner is outer
+
+    session.commit.assert_called_once()
+    session.remove.assert_called_once()
@@ -4,6 +4,8 @@ import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import requests
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.core.common.exceptions import (
@@ -11,7 +13,8 @@ from src.core.common.exceptions import (
     EdgeServerError,
     ErrorReadDataEdgeServer,
 )
-from src.core.services.edge_server import EdgeServer
+from src.core.configs.config import settings
+from src.core.services.edge_server import EdgeServer, close_session, get_session
 
 
 class TestEdgeServer(unittest.TestCase):
@@ -69,7 +72,7 @@ class TestEdgeServer(unittest.TestCase):
         assert response["id"] == device["id"]
         assert response["state"] == device["state"]
 
-    @patch("src.core.services.edge_server.requests.get")
+    @patch("src.core.services.edge_server.requests.Session.get")
     def test_download_log_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
@@ -79,9 +82,12 @@ class TestEdgeServer(unittest.TestCase):
         response = self.edge_server.download_log()
 
         self.assertEqual(response, {"log": "data"})
-        mock_get.assert_called_once_with(f"{self.edge_server.url}/download_log")
+        mock_get.assert_called_once_with(
+            f"{self.edge_server.url}/download_log",
+            timeout=self.edge_server.download_timeout,
+        )
 
-    @patch("src.core.services.edge_server.requests.get")
+    @patch("src.core.services.edge_server.requests.Session.get")
     def test_download_log_general_error(self, mock_get):
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = Exception("Unexpected error!")
@@ -90,6 +96,27 @@ class TestEdgeServer(unittest.TestCase):
         with self.assertRaises(ErrorReadDataEdgeServer):
             self.edge_server.download_log()
 
+    @patch("src.core.services.edge_server.requests.Session.get")
+    def test_read_timeout_raises_connect_error(self, mock_get):
+        mock_get.side_effect = requests.exceptions.ReadTimeout()
+
+        with self.assertRaises(ConnectToEdgeServerError):
+            self.edge_server.download_log()
+
+    def test_instances_share_one_session(self):
+        self.assertIs(EdgeServer().session, EdgeServer().session)
+
+    def test_session_retries_only_idempotent_reads(self):
+        adapter = get_session().get_adapter(self.edge_server.url)
+        self.assertEqual(adapter.max_retries.total, settings.EDGE_SERVER_RETRIES)
+        self.assertFalse(adapter.max_retries.is_retry("POST", 503))
+        self.assertTrue(adapter.max_retries.is_retry("GET", 503))
+
+    def test_close_session_builds_a_new_one(self):
+        session = get_session()
+        close_session()
+        self.assertIsNot(get_session(), session)
+
 
 if __name__ == "__main__":
     unittest.main()
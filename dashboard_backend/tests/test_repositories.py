@@ -1,16 +1,29 @@
+import asyncio
+import contextlib
 import os
+import socket
 import sys
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from src.core.models import History, Settings
+from src.core.common.repositories import AsyncSQLRepository
+from src.core.models import DeviceState, History, Settings
+from src.core.repositories.device_repository import DeviceRepository
+from src.core.repositories.device_state_repository import DeviceStateRepository
 from src.core.repositories.history_repository import HistoryRepository
-from src.core.repositories.setting_repository import SettingRepository
+from src.core.repositories.rollup_repository import RollupRepository, bucket_start
+from src.core.repositories.setting_repository import (
+    SETTINGS_KEY,
+    SettingRepository,
+    SettingsListener,
+    settings_cache,
+)
 
 
 @pytest.fixture
@@ -58,10 +71,14 @@ def test_get_property_from_db_settings(mock_session):
     assert value in [0, 1, 2, 3, 4, 5]
 
 
-def test_get_last_history(mock_session):
-    repo = HistoryRepository()
-    history = repo.get_last_history()
+def test_get_last_history(async_session):
+    async_session.scalar.return_value = History(id=1)
+
+    history = asyncio.run(HistoryRepository().get_last_history())
+
     assert history.id == 1
+    statement = compiled(async_session.scalar.call_args.args[0])
+    assert statement.endswith("ORDER BY history.id DESC LIMIT %(param_1)s")
 
 
 def test_get_last_histories(mock_session):
@@ -82,6 +99,208 @@ def test_get_last_histories(mock_session):
     assert histories[1].id == 2
 
 
+def test_get_chart_points(async_session):
+    rows = [(3, datetime(2025, 1, 1), 150.0, 140.0)]
+    async_session.execute.return_value.all.return_value = rows
+
+    result = asyncio.run(
+        HistoryRepository().get_chart_points(timedelta(hours=1), since_id=2)
+    )
+
+    statement = compiled(async_session.execute.call_args.args[0])
+    # Only the charted columns are selected
+    assert statement.startswith(
+        "SELECT history.id, history.timestamp, history.water_out_temp, "
+        "history.return_temp FROM history"
+    )
+    # One condition for the window, one for the cursor
+    assert "WHERE history.timestamp > %(timestamp_1)s AND history.id > " in statement
+    assert result == rows
+
+
+def bound_datetimes(statement):
+    params = statement.compile(dialect=postgresql.dialect()).params
+    return [value for value in params.values() if isinstance(value, datetime)]
+
+
+def test_get_chart_points_binds_naive_utc(async_session):
+    since_time = datetime(2025, 1, 1, 14, tzinfo=timezone(timedelta(hours=2)))
+
+    asyncio.run(
+        HistoryRepository().get_chart_points(timedelta(hours=1), since_time=since_time)
+    )
+
+    bound = bound_datetimes(async_session.execute.call_args.args[0])
+    assert len(bound) == 2
+    assert all(value.tzinfo is None for value in bound)
+    assert datetime(2025, 1, 1, 12) in bound
+
+
+def test_get_chart_buckets(async_session):
+    async_session.execute.return_value.all.return_value = []
+
+    asyncio.run(HistoryRepository().get_chart_buckets(timedelta(days=7), 600))
+
+    statement = compiled(async_session.execute.call_args.args[0])
+    assert "GROUP BY floor(EXTRACT(epoch FROM history.timestamp) /" in statement
+
+
+def compiled(statement):
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.fixture
+def async_session():
+    """Patch AsyncSQLRepository.session to yield one mocked AsyncSession."""
+    session = AsyncMock()
+    # Awaiting execute returns a Result, whose methods are sync
+    session.execute.return_value = MagicMock()
+
+    @contextlib.asynccontextmanager
+    async def scope(self):
+        yield session
+
+    with patch.object(AsyncSQLRepository, "session", scope):
+        yield session
+
+
+@pytest.fixture
+def rollup_session():
+    with patch("src.core.repositories.rollup_repository.session_scope") as mock:
+        yield mock.return_value.__enter__.return_value
+
+
+def test_bucket_start():
+    at = datetime(2025, 1, 1, 10, 44, 59)
+    assert bucket_start(at, "15m") == datetime(2025, 1, 1, 10, 30)
+    assert bucket_start(at, "1h") == datetime(2025, 1, 1, 10)
+    assert bucket_start(at, "1d") == datetime(2025, 1, 1)
+
+
+def test_rollup_refresh(rollup_session):
+    RollupRepository().refresh(datetime(2025, 1, 1, 10, 44))
+
+    statements = [
+        compiled(call.args[0]) for call in rollup_session.execute.call_args_list
+    ]
+    # One upsert per resolution, finest first
+    assert len(statements) == 3
+    assert all("ON CONFLICT (resolution, bucket_start, mode)" in s for s in statements)
+    assert "FROM history WHERE" in statements[0]
+    assert "FROM history_rollup" in statements[1]
+    assert "FROM history_rollup" in statements[2]
+
+
+def test_rollup_summarize(rollup_session):
+    # count, chiller minutes, then sum/min/max per measure, then totals
+    rollup_session.execute.return_value.one.return_value = (
+        4,
+        3,
+        600.0,
+        140.0,
+        160.0,
+        560.0,
+        135.0,
+        145.0,
+        40.0,
+        9.0,
+        11.0,
+        580.0,
+        200.0,
+    )
+
+    summary = RollupRepository().summarize(datetime(2025, 1, 1), mode=1)
+
+    statement = compiled(rollup_session.execute.call_args.args[0])
+    assert "history_rollup.mode = " in statement
+    assert summary.count == 4
+    assert summary.chiller_on_minutes == 3
+    assert summary.water_out_temp_avg == 150.0
+    assert summary.return_temp_min == 135.0
+    assert summary.outside_temp_max == 11.0
+    assert summary.effective_setpoint_avg == 145.0
+    assert summary.cascade_fire_rate_avg == 50.0
+
+
+def test_rollup_asummarize_empty(async_session):
+    async_session.execute.return_value.one.return_value = (0, 0, *[None] * 11)
+
+    summary = asyncio.run(RollupRepository().asummarize(datetime(2025, 1, 1)))
+
+    assert summary.count == 0
+    assert summary.return_temp_avg is None
+
+
+@pytest.fixture
+def device_state_session():
+    with patch("src.core.repositories.device_state_repository.session_scope") as mock:
+        yield mock.return_value.__enter__.return_value
+
+
+def test_get_device_states_in_one_query(async_session):
+    async_session.scalars.return_value = [
+        DeviceState(device_id=0, backup=False, status=1, manual_override=0),
+        DeviceState(device_id=1, backup=False, status=0, manual_override=2),
+    ]
+
+    states = asyncio.run(DeviceStateRepository().get_states())
+
+    async_session.scalars.assert_awaited_once()
+    statement = compiled(async_session.scalars.call_args.args[0])
+    assert statement.endswith("FROM device_state WHERE device_state.backup = false")
+    assert states[0].status == 1
+    assert states[1].manual_override == 2
+
+
+def test_update_device_state_binds_naive_utc(async_session):
+    asyncio.run(
+        DeviceStateRepository().update_state(
+            3, status=1, switched_timestamp=datetime(2025, 1, 1, 12, tzinfo=UTC)
+        )
+    )
+
+    bound = bound_datetimes(async_session.execute.call_args.args[0])
+    assert bound == [datetime(2025, 1, 1, 12)]
+    async_session.commit.assert_awaited_once()
+
+
+def test_copy_device_states_in_one_statement(device_state_session):
+    DeviceStateRepository().copy_states([1, 2], to_backup=True)
+
+    device_state_session.execute.assert_called_once()
+    statement = compiled(device_state_session.execute.call_args.args[0])
+    assert statement.startswith("UPDATE device_state SET")
+    assert "status=source.status" in statement
+    assert "FROM device_state AS source" in statement
+    assert "device_state.backup = true" in statement
+    assert "source.backup = false" in statement
+
+
+def test_set_device_statuses_in_one_statement(device_state_session):
+    DeviceStateRepository().set_statuses({5: 0, 6: 1})
+
+    device_state_session.execute.assert_called_once()
+    statement = compiled(device_state_session.execute.call_args.args[0])
+    assert statement.startswith(
+        "UPDATE device_state SET status=CASE device_state.device_id"
+    )
+    assert "device_state.device_id IN" in statement
+    assert "device_state.backup = false" in statement
+
+
+def test_device_repository_filters_by_device_and_backup():
+    with patch("src.core.repositories.device_repository.session_scope") as scope:
+        session = scope.return_value.__enter__.return_value
+        query = session.query.return_value.filter.return_value
+        query.with_entities.return_value.first.return_value = (1, 2)
+
+        repo = DeviceRepository(3)
+        assert repo._get_property_from_db("status", "manual_override") == [1, 2]
+        repo._update_value_in_db(status=0, to_backup=True)
+
+    query.update.assert_called_once_with({"status": 0})
+
+
 def test_three_minute_avg_delta(mock_session):
     repo = HistoryRepository()
     mock_subquery = MagicMock()
@@ -115,3 +334,76 @@ def test_update_mode_with_timestamp(mock_session):
     repo._update_property_in_db("mode_switch_timestamp", current_time.isoformat())
     time = repo._get_property_from_db("mode_switch_timestamp")
     assert current_time == time
+
+
+@pytest.fixture
+def settings_session():
+    settings_cache.invalidate()
+    with patch("src.core.repositories.setting_repository.session_scope") as mock:
+        yield mock.return_value.__enter__.return_value
+    settings_cache.invalidate()
+
+
+def test_settings_are_loaded_once(settings_session):
+    settings_session.query.return_value.order_by.return_value.first.return_value = (
+        Settings(id=1, mode=1, mode_switch_lockout_time=5)
+    )
+    repo = SettingRepository()
+
+    assert repo._get_property_from_db("mode") == 1
+    assert repo._get_property_from_db("mode_switch_lockout_time") == 5
+    assert repo.get_last_settings().id == 1
+    assert settings_session.query.call_count == 1
+
+
+def test_settings_update_invalidates_and_notifies(settings_session):
+    first = settings_session.query.return_value.order_by.return_value.first
+    first.return_value = Settings(id=1, mode=1)
+    repo = SettingRepository()
+    assert repo._get_property_from_db("mode") == 1
+
+    first.return_value = Settings(id=1, mode=0)
+    repo._update_property_in_db("mode", 0)
+
+    notify = compiled(settings_session.execute.call_args.args[0])
+    assert notify.startswith("SELECT pg_notify(")
+    params = settings_session.execute.call_args.args[0].compile().params
+    assert sorted(params.values()) == ["mode", "settings_changed"]
+    assert repo._get_property_from_db("mode") == 0
+
+
+def test_settings_listener_invalidates_on_notify():
+    reader, writer = socket.socketpair()
+    listener = SettingsListener(retry=0)
+
+    class Connection:
+        notifies = []
+
+        def fileno(self):
+            return reader.fileno()
+
+        def cursor(self):
+            return MagicMock()
+
+        def poll(self):
+            reader.recv(1)
+            self.notifies.append("mode")
+            listener._stop.set()
+
+    raw_connection = MagicMock(dbapi_connection=Connection())
+    writer.send(b"x")
+    with (
+        patch(
+            "src.core.repositories.setting_repository.engine.raw_connection",
+            return_value=raw_connection,
+        ),
+        patch.object(settings_cache, "invalidate") as invalidate,
+    ):
+        listener._listen()
+
+    # Once after LISTEN, once for the notification
+    assert invalidate.call_args_list == [((SETTINGS_KEY,),)] * 2
+    assert raw_connection.dbapi_connection.notifies == []
+    raw_connection.invalidate.assert_called_once()
+    reader.close()
+    writer.close()
@@ -0,0 +1,100 @@
+import csv
+import gzip
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.models import History, HistoryRollup
+from src.core.services.retention import Retention, RetentionPolicy, default_policies
+
+HISTORY = RetentionPolicy("history", History, "timestamp", 7)
+
+
+@pytest.fixture
+def session():
+    with patch("src.core.services.retention.session_scope") as mock:
+        yield mock.return_value.__enter__.return_value
+
+
+def compiled(statement):
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+def test_default_policies():
+    policies = {policy.name: policy for policy in default_policies()}
+
+    assert policies["history"].days == 7
+    assert policies["history_rollup_15m"].model is HistoryRollup
+    # Daily rollups are kept forever by default
+    assert policies["history_rollup_1d"].days == 0
+
+
+def test_purge_deletes_in_batches(session):
+    session.execute.side_effect = [
+        MagicMock(rowcount=100),
+        MagicMock(rowcount=100),
+        MagicMock(rowcount=40),
+    ]
+    retention = Retention(policies=[HISTORY], batch_size=100, pause=0)
+
+    assert retention.purge(HISTORY) == 240
+    assert session.execute.call_count == 3
+    statement = compiled(session.execute.call_args.args[0])
+    assert "DELETE FROM history WHERE history.id IN (SELECT history.id" in statement
+    assert "ORDER BY history.timestamp LIMIT" in statement
+
+
+def test_purge_stops_when_a_batch_fails():
+    retention = Retention(policies=[HISTORY], batch_size=100, pause=0)
+
+    with patch("src.core.services.retention.session_scope") as scope:
+        session = scope.return_value.__enter__.return_value
+        session.execute.side_effect = RuntimeError("lock timeout")
+        # Like session_scope, roll back and swallow the error
+        scope.return_value.__exit__.return_value = True
+
+        assert retention.purge(HISTORY) == 0
+    assert session.execute.call_count == 1
+
+
+def test_purge_skips_policies_that_keep_everything(session):
+    retention = Retention(policies=[], batch_size=100, pause=0)
+
+    assert retention.purge(RetentionPolicy("forever", History, "timestamp", 0)) == 0
+    session.execute.assert_not_called()
+
+
+def test_rollup_policy_filters_on_resolution(session):
+    session.execute.return_value = MagicMock(rowcount=0)
+    policy = next(p for p in default_policies() if p.name == "history_rollup_1h")
+
+    Retention(policies=[policy], batch_size=100, pause=0).run()
+
+    statement = compiled(session.execute.call_args.args[0])
+    assert "history_rollup.resolution = " in statement
+
+
+def test_purge_archives_deleted_rows(session, tmp_path):
+    result = MagicMock()
+    result.keys.return_value = ["id", "timestamp"]
+    result.all.return_value = [(1, "2025-01-01 00:00:00"), (2, "2025-01-01 00:01:00")]
+    session.execute.return_value = result
+    retention = Retention(
+        policies=[HISTORY], batch_size=100, pause=0, archive_dir=str(tmp_path)
+    )
+
+    assert retention.purge(HISTORY) == 2
+    assert "RETURNING" in compiled(session.execute.call_args.args[0])
+    (archive,) = tmp_path.iterdir()
+    assert archive.name.startswith("history-")
+    with gzip.open(archive, "rt", newline="") as f:
+        assert list(csv.reader(f)) == [
+            ["id", "timestamp"],
+            ["1", "2025-01-01 00:00:00"],
+            ["2", "2025-01-01 00:01:00"],
+        ]
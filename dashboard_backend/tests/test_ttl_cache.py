@@ -0,0 +1,127 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.utils.ttl_cache import TTLCache
+
+
+class Loader:
+    def __init__(self, value="value", delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+    async def load(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+def test_get_serves_within_ttl():
+    cache = TTLCache()
+    loader = Loader()
+
+    assert cache.get("key", 10, loader) == ("value", False)
+    assert cache.get("key", 10, loader) == ("value", False)
+    assert loader.calls == 1
+
+    assert cache.get("key", 0, loader) == ("value", False)
+    assert loader.calls == 2
+
+
+def test_concurrent_thread_misses_share_one_load():
+    cache = TTLCache()
+    loader = Loader(delay=0.1)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("key", 10, loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert results == [("value", False)] * 5
+
+
+def test_concurrent_coroutine_misses_share_one_load():
+    cache = TTLCache()
+    loader = Loader(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.aget("key", 10, loader.load) for _ in range(5))
+        )
+
+    assert asyncio.run(scenario()) == [("value", False)] * 5
+    assert loader.calls == 1
+
+
+def test_cancelled_waiter_does_not_cancel_shared_load():
+    cache = TTLCache()
+    loader = Loader(delay=0.1)
+
+    async def scenario():
+        impatient = asyncio.ensure_future(cache.aget("key", 10, loader.load))
+        patient = asyncio.ensure_future(cache.aget("key", 10, loader.load))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        return await patient
+
+    assert asyncio.run(scenario()) == ("value", False)
+    assert loader.calls == 1
+
+
+def test_error_serves_stale_value():
+    cache = TTLCache(max_stale=60)
+    cache.get("key", 10, Loader())
+
+    assert cache.get("key", 0, Loader(ValueError("down"))) == ("value", True)
+    assert asyncio.run(cache.aget("key", 0, Loader(ValueError("down")).load)) == (
+        "value",
+        True,
+    )
+
+
+def test_error_raises_without_usable_value():
+    cache = TTLCache(max_stale=0)
+    with pytest.raises(ValueError):
+        cache.get("key", 10, Loader(ValueError("down")))
+
+    cache.get("key", 10, Loader())
+    time.sleep(0.01)
+    with pytest.raises(ValueError):
+        cache.get("key", 0, Loader(ValueError("down")))
+
+
+def test_invalidate_drops_value_and_in_flight_load():
+    cache = TTLCache()
+    cache.get("key", 10, Loader("old"))
+    cache.invalidate("key")
+    assert cache.get("key", 10, Loader("new")) == ("new", False)
+
+    def load_then_invalidate():
+        cache.invalidate("key")
+        return "racing"
+
+    cache.invalidate()
+    assert cache.get("key", 10, load_then_invalidate) == ("racing", False)
+    assert cache.get("key", 10, Loader("fresh")) == ("fresh", False)
@@ -0,0 +1,31 @@
+import { API_BASE_URL } from '../utils/constant';
+import { applyMergePatch } from '../utils/mergePatch';
+
+// Subscribe to the dashboard's Server-Sent Events. The server sends a
+// "snapshot" with the full dashboard, then "delta" merge patches against it.
+// EventSource cannot send headers, so the token goes in the query string.
+export const openDashboardStream = ({ onData, onError }) => {
+  const token = localStorage.getItem('access_token');
+  const base = API_BASE_URL.replace(/\/$/, '');
+  const query = `access_token=${encodeURIComponent(token ?? '')}`;
+  const source = new EventSource(`${base}/stream?${query}`);
+  let latest = null;
+
+  source.addEventListener('snapshot', (event) => {
+    latest = JSON.parse(event.data);
+    onData(latest);
+  });
+
+  source.addEventListener('delta', (event) => {
+    latest = applyMergePatch(latest, JSON.parse(event.data));
+    onData(latest);
+  });
+
+  // The caller decides when to reconnect, e.g. after refreshing the token
+  source.onerror = () => {
+    source.close();
+    onError('Lost connection to the dashboard stream');
+  };
+
+  return source;
+};
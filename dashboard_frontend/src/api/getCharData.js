@@ -1,5 +1,7 @@
 import axiosApi from './axios';
 
-export const getCharData = async () => {
-  return await axiosApi.get('/chart_data');
+export const getCharData = async (since) => {
+  return await axiosApi.get('/chart_data', {
+    params: since === undefined ? {} : { since },
+  });
 };
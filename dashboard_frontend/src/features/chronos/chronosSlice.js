@@ -20,6 +20,31 @@ export const fetchData = createAsyncThunk('chronos/fetchData', async () => {
   return response?.data;
 });
 
+const applyDashboardData = (state, data) => {
+  state.devices = data.devices;
+  state.data = data;
+  state.season = data.results.mode;
+  state.mock_devices = data.mock_devices;
+  state.read_only_mode = data.read_only_mode;
+  state.lastUpdated = new Date().toISOString();
+  state.status = 'succeeded';
+  state.systemStatus = data.status ? 'ONLINE' : 'OFFLINE';
+  state.error = null;
+  state.unlock_time =
+    data.results?.unlock_time &&
+    new Date(data.results.unlock_time).getTime() > new Date().getTime()
+      ? new Date(data.results.unlock_time).toISOString()
+      : null;
+};
+
+const applyDashboardError = (state, message) => {
+  state.switch_override = false;
+  state.status = 'failed';
+  state.systemStatus = 'OFFLINE';
+  state.error = message;
+  state.isFirstLoad = false;
+};
+
 export const chronosSlice = createSlice({
   name: 'chronos',
   initialState,
@@ -30,6 +55,13 @@ export const chronosSlice = createSlice({
     setSwitchOverride: (state, action) => {
       state.switch_override = action.payload;
     },
+    // Dashboard pushed over the SSE stream
+    streamUpdated(state, action) {
+      applyDashboardData(state, action.payload);
+    },
+    streamFailed(state, action) {
+      applyDashboardError(state, action.payload);
+    },
   },
   extraReducers(builder) {
     builder
@@ -38,29 +70,11 @@ export const chronosSlice = createSlice({
         state.error = null;
       })
       .addCase(fetchData.fulfilled, (state, action) => {
-        const data = action.payload;
-        state.devices = data.devices;
-        state.data = data;
-        state.season = data.results.mode;
-        state.mock_devices = data.mock_devices;
-        state.read_only_mode = data.read_only_mode;
-        state.lastUpdated = new Date().toISOString();
-        state.status = 'succeeded';
-        state.systemStatus = data.status ? 'ONLINE' : 'OFFLINE';
-        state.error = null;
-        state.unlock_time =
-          data.results?.unlock_time &&
-          new Date(data.results.unlock_time).getTime() > new Date().getTime()
-            ? new Date(data.results.unlock_time).toISOString()
-            : null;
+        applyDashboardData(state, action.payload);
       })
 
       .addCase(fetchData.rejected, (state, action) => {
-        state.switch_override = false;
-        state.status = 'failed';
-        state.systemStatus = 'OFFLINE';
-        state.error = action.error.message;
-        state.isFirstLoad = false;
+        applyDashboardError(state, action.error.message);
       });
   },
 });
@@ -69,5 +83,6 @@ export const chronosSlice = createSlice({
 // export const getAllData = (state) => state.summerData.data
 // export const getDataError = (state) => state.summerData.error
 // export const getDataStatus = (state) => state.summerData.status
-export const { setSwitchOverride, setSeason } = chronosSlice.actions;
+export const { setSwitchOverride, setSeason, streamUpdated, streamFailed } =
+  chronosSlice.actions;
 export default chronosSlice.reducer;
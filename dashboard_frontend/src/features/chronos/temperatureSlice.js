@@ -8,11 +8,17 @@ const initialState = {
   error: null,
 };
 
+// Must match the backend's default chart window
+const CHART_WINDOW_MS = 60 * 60 * 1000;
+
 export const fetchCharData = createAsyncThunk(
   'temperature/fetchCharData',
-  async () => {
-    const response = await getCharData();
-    return response?.data;
+  async (_, { getState }) => {
+    // Only ask for the points newer than the last one we have
+    const points = getState().temperature.data;
+    const since = points?.length ? points[points.length - 1].id : undefined;
+    const response = await getCharData(since);
+    return { points: response?.data ?? [], incremental: since !== undefined };
   },
 );
 
@@ -26,7 +32,17 @@ export const temperatureSlice = createSlice({
         state.status = 'loading';
       })
       .addCase(fetchCharData.fulfilled, (state, action) => {
-        state.data = action.payload;
+        const { points, incremental } = action.payload;
+        if (incremental) {
+          // Trim relative to the newest point, the server's clock
+          const merged = [...state.data, ...points];
+          const newest = Date.parse(merged[merged.length - 1].date);
+          state.data = merged.filter(
+            (point) => Date.parse(point.date) > newest - CHART_WINDOW_MS,
+          );
+        } else {
+          state.data = points;
+        }
         state.status = 'succeeded';
       })
       .addCase(fetchCharData.rejected, (state, action) => {
@@ -1,6 +1,5 @@
 /* eslint-disable react-hooks/exhaustive-deps */
 import React, { useState, useEffect, useRef } from 'react';
-import { parseISO, differenceInSeconds } from 'date-fns';
 
 import {
   CContainer,
@@ -16,8 +15,13 @@ import { toast } from 'react-toastify';
 import ManualOverride from '../../components/ManualOverride/ManualOverride';
 import SystemMap from '../../components/systemMap/SystemMap';
 import TemperatureGraph from '../../components/TemperatureGraph/TemperatureGraph';
-import { fetchData } from '../../features/chronos/chronosSlice';
-import { REFRESH_TIME, RETRY_TIME } from '../../utils/constant';
+import { openDashboardStream } from '../../api/dashboardStream';
+import {
+  fetchData,
+  streamFailed,
+  streamUpdated,
+} from '../../features/chronos/chronosSlice';
+import { RETRY_TIME } from '../../utils/constant';
 import TypeMode from '../../components/TypeMode/TypeMode';
 import UserSettings from '../../components/UserSettings/UserSettings';
 import TableTemplate from '../../components/Sensor/TableTemplate';
@@ -53,20 +57,23 @@ const Home = () => {
   const [isReCallAPI, setIsReCallAPI] = useState(false);
   const intervalRef = useRef(null);
   const chartIntervalRef = useRef(null);
-  const timeoutRef = useRef(null);
-  const unlockTime = useSelector((state) => state.chronos.unlock_time);
-  const calculateDelay = () => {
-    if (unlockTime) {
-      const unlockDate = parseISO(unlockTime);
-      const now = new Date();
-      const delayInSeconds = differenceInSeconds(unlockDate, now);
-      return delayInSeconds > 0 ? delayInSeconds : 1;
-    }
-    return 1;
+  const streamRef = useRef(null);
+
+  const openStream = () => {
+    streamRef.current?.close();
+    streamRef.current = openDashboardStream({
+      onData: (dashboard) => dispatch(streamUpdated(dashboard)),
+      onError: (message) => dispatch(streamFailed(message)),
+    });
   };
 
-  const fetchHomeData = async () => {
-    dispatch(fetchData());
+  const reconnect = async () => {
+    // A plain request first, so an expired access token gets refreshed
+    const result = await dispatch(fetchData());
+    if (fetchData.fulfilled.match(result)) {
+      openStream();
+    }
+    setIsReCallAPI(false);
   };
 
   const fetchChartData = async () => {
@@ -74,7 +81,7 @@ const Home = () => {
   };
 
   useEffect(() => {
-    fetchHomeData();
+    openStream();
     fetchChartData();
 
     intervalRef.current = setInterval(() => {
@@ -86,6 +93,7 @@ const Home = () => {
     }, 1000);
 
     return () => {
+      streamRef.current?.close();
       clearInterval(intervalRef.current);
       clearInterval(chartIntervalRef.current);
     };
@@ -108,27 +116,16 @@ const Home = () => {
         toast.success('Data fetched successfully from edge server');
       }
       setIsShowPopupReload(false);
-      setRecallAPITime(REFRESH_TIME);
     }
   }, [status, temperatureStatus]);
 
+  // The stream pushes every change; only reconnect after it has failed
   useEffect(() => {
-    if (
-      recallAPITime === 0 &&
-      (status === 'succeeded' ||
-        status === 'failed' ||
-        temperatureStatus === 'succeeded' ||
-        temperatureStatus === 'failed')
-    ) {
+    if (recallAPITime === 0 && status === 'failed' && !isReCallAPI) {
       setIsReCallAPI(true);
-      timeoutRef.current = setTimeout(() => {
-        fetchHomeData();
-        setIsReCallAPI(false);
-      }, calculateDelay() * 1000);
+      reconnect();
     }
-
-    return () => clearTimeout(timeoutRef.current);
-  }, [recallAPITime, status, temperatureStatus, unlockTime]);
+  }, [recallAPITime, status]);
 
   return (
     <>
@@ -0,0 +1,16 @@
+const isObject = (value) =>
+  value !== null && typeof value === 'object' && !Array.isArray(value);
+
+// Apply a JSON merge patch (RFC 7386) and return the patched copy
+export const applyMergePatch = (target, patch) => {
+  if (!isObject(patch)) return patch;
+  const result = isObject(target) ? { ...target } : {};
+  Object.entries(patch).forEach(([key, value]) => {
+    if (value === null) {
+      delete result[key];
+    } else {
+      result[key] = applyMergePatch(result[key], value);
+    }
+  });
+  return result;
+};
@@ -1,35 +1,42 @@
+import asyncio
 import logging
 import os
 import time
 from collections import namedtuple
 from functools import wraps
-from typing import Callable
+from typing import Awaitable, Callable, Optional
 
 from chronos.config import cfg
 from chronos.data_models import (
     BoilerStats,
     DeviceModel,
+    ModbusHealth,
     OperatingStatus,
+    RelayDriftEvent,
     SetpointLimitsUpdate,
     SetpointUpdate,
+    Snapshot,
     SwitchStateRequest,
     SystemStatus,
+    TelemetrySeries,
 )
-from chronos.devices import (
-    ModbusException,
-    SerialDevice,
-    create_modbus_connection,
-    safe_read_temperature,
-)
+from chronos.devices import ModbusException, RelayBus, SerialDevice
+from chronos.executor import BusExecutor, BusTimeout
 from chronos.mock_devices.mock_data import (
     mock_boiler_stats,
     mock_operating_status,
     mock_point_update,
     mock_sensors,
 )
+from chronos.modbus_session import AsyncModbusSession, ModbusSession
+from chronos.poller import BoilerPoller
+from chronos.registers import BOILER_STATS, TEMPERATURE_LIMITS
+from chronos.relay_state import RelayReading, RelayStateCache
+from chronos.sensors import SensorSampler
+from chronos.telemetry import Telemetry
 from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
@@ -139,13 +146,88 @@ DeviceTuple = namedtuple(
     "DeviceTuple", ["boiler", "chiller1", "chiller2", "chiller3", "chiller4"]
 )
 
-# Initialize devices
+# Initialize devices; all relays share one open port to the relay board
+relay_port = RelayBus(portname=cfg.serial.portname, baudrate=cfg.serial.baudr)
 DEVICES = DeviceTuple(
     *[
-        SerialDevice(id=i, portname=cfg.serial.portname, baudrate=cfg.serial.baudr)
+        SerialDevice(
+            id=i,
+            portname=cfg.serial.portname,
+            baudrate=cfg.serial.baudr,
+            bus=relay_port,
+        )
         for i in range(5)
     ]
 )
+# Shared Modbus session; the port stays open for the life of the process
+modbus_options = dict(
+    port=cfg.modbus.portname,
+    baudrate=cfg.modbus.baudr,
+    parity=cfg.modbus.parity,
+    timeout=cfg.modbus.timeout,
+    keepalive_interval=cfg.modbus.keepalive_interval,
+)
+if cfg.io.modbus_backend == "async":
+    modbus_session = AsyncModbusSession(
+        **modbus_options, call_timeout=cfg.io.modbus_timeout
+    )
+else:
+    modbus_session = ModbusSession(**modbus_options)
+# One executor per physical bus keeps blocking I/O off the event loop
+modbus_bus = BusExecutor("modbus", timeout=cfg.io.modbus_timeout)
+relay_bus = BusExecutor("relay", timeout=cfg.io.relay_timeout)
+# The sensor bus gets one worker per sensor so they are sampled concurrently
+sensor_ids = {"return_temp": cfg.sensors.in_id, "water_out_temp": cfg.sensors.out_id}
+sensor_bus = BusExecutor(
+    "sensor", timeout=cfg.io.sensor_timeout, max_workers=len(sensor_ids)
+)
+sensor_sampler = SensorSampler(
+    sensor_ids,
+    interval=cfg.sensors.interval,
+    max_attempts=cfg.sensors.max_attempts,
+    max_age=cfg.sensors.max_age,
+    executor=sensor_bus,
+)
+boiler_poller = BoilerPoller(
+    modbus_session,
+    interval=cfg.poller.interval,
+    max_age=cfg.poller.max_age,
+    executor=modbus_bus,
+)
+
+
+# Every boiler and sensor sample is also kept in memory for /telemetry
+telemetry = Telemetry(
+    {"boiler": BOILER_STATS, "sensors": tuple(sensor_ids)},
+    capacity=cfg.telemetry.capacity,
+)
+boiler_poller.subscribe(
+    lambda snapshot: telemetry.record("boiler", snapshot.timestamp, snapshot.data)
+)
+sensor_sampler.subscribe(
+    lambda timestamp, values: telemetry.record("sensors", timestamp, values)
+)
+
+
+def read_device_states():
+    """Read the state of every relay device from the board in one batch.
+
+    Falls back to one read per relay. Errors are raised rather than read as
+    "off", so the relay cache can serve its last readings as stale.
+    """
+    try:
+        return relay_port.read_all(device.id for device in DEVICES)
+    except Exception as e:
+        logger.warning(f"Batched relay read failed, reading individually: {e}")
+        return {device.id: relay_port.read(device.id) for device in DEVICES}
+
+
+relay_states = RelayStateCache(
+    read_device_states,
+    ttl=cfg.relay_cache.ttl,
+    reconcile_interval=cfg.relay_cache.reconcile_interval,
+    executor=relay_bus,
+)
 MOCK_DEVICES = cfg.MOCK_DEVICES
 app = FastAPI()
 app.add_middleware(
@@ -157,6 +239,38 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup():
+    if not MOCK_DEVICES:
+        modbus_session.start_keepalive()
+        boiler_poller.start()
+        relay_states.start()
+        sensor_sampler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await boiler_poller.stop()
+    await relay_states.stop()
+    await sensor_sampler.stop()
+    for bus in (modbus_bus, relay_bus, sensor_bus):
+        bus.shutdown()
+    modbus_session.close()
+    relay_port.close()
+
+
+async def modbus_call(method: str, *args):
+    """Call a Modbus device method on the configured backend."""
+    if isinstance(modbus_session, AsyncModbusSession):
+        return await modbus_session.call(method, *args)
+    return await modbus_bus.run(modbus_session.call, method, *args)
+
+
+@app.exception_handler(BusTimeout)
+async def bus_timeout_handler(request, exc: BusTimeout):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
 def ensure_not_read_only():
     if cfg.READ_ONLY_MODE:
         raise HTTPException(
@@ -178,6 +292,15 @@ def get_chronos_status():
     return chronos_status
 
 
+def device_model(device: int, reading: RelayReading) -> DeviceModel:
+    return DeviceModel(
+        id=device,
+        state=reading.state,
+        timestamp=reading.timestamp,
+        stale=relay_states.is_stale(reading),
+    )
+
+
 @app.get("/get_data", response_model=SystemStatus)
 @with_circuit_breaker
 async def get_data():
@@ -201,12 +324,10 @@ async def get_data():
             )
 
     try:
-        sensors = {
-            "return_temp": safe_read_temperature(cfg.sensors.in_id),
-            "water_out_temp": safe_read_temperature(cfg.sensors.out_id),
-        }
+        sensors = await sensor_sampler.values()
         status = get_chronos_status()
-        devices = {i: DEVICES[i].state for i in range(len(DEVICES))}
+        readings = await relay_states.get_all()
+        devices = {i: reading.state for i, reading in readings.items()}
         return SystemStatus(
             sensors=sensors,
             devices=devices,
@@ -225,6 +346,97 @@ async def get_data():
         )
 
 
+def oldest(timestamps) -> Optional[float]:
+    return min((t for t in timestamps if t is not None), default=None)
+
+
+async def snapshot_section(name: str, read: Callable[[], Awaitable[dict]]) -> dict:
+    """Run one snapshot reader, turning a failure into the section's error."""
+    try:
+        return await read()
+    except Exception as e:
+        logger.error(f"Snapshot section {name} failed: {e}")
+        return {"error": str(e) or type(e).__name__}
+
+
+async def snapshot_sensors() -> dict:
+    if MOCK_DEVICES:
+        return {"data": mock_sensors(), "timestamp": time.time()}
+    values = await sensor_sampler.values()
+    readings = sensor_sampler.snapshot()
+    errors = [f"{name}: {r.error}" for name, r in readings.items() if r.error]
+    return {
+        "data": values,
+        "timestamp": oldest(r.timestamp for r in readings.values()),
+        "error": "; ".join(errors) or None,
+    }
+
+
+async def snapshot_devices() -> dict:
+    if MOCK_DEVICES:
+        devices = [DeviceModel(id=i, state=True) for i in range(5)]
+        return {"data": devices, "timestamp": time.time()}
+    readings = await relay_states.get_all()
+    return {
+        "data": [device_model(i, reading) for i, reading in sorted(readings.items())],
+        "timestamp": oldest(reading.timestamp for reading in readings.values()),
+    }
+
+
+async def snapshot_boiler() -> dict:
+    if MOCK_DEVICES:
+        data = {**mock_boiler_stats(), **mock_operating_status()}
+        return {"data": data, "timestamp": time.time()}
+    snapshot = await boiler_poller.get()
+    if not snapshot:
+        raise RuntimeError("Failed to read boiler data")
+    return {"data": dict(snapshot.data), "timestamp": snapshot.timestamp}
+
+
+def snapshot_temperature_limits(boiler: dict) -> dict:
+    """Build the limits section from the boiler section, without a bus read."""
+    if boiler.get("data") is None:
+        return {"error": boiler.get("error")}
+    data = boiler["data"]
+    soft_limits = {name: data[name] for name in TEMPERATURE_LIMITS if name in data}
+    return {
+        "data": {
+            "hard_limits": hard_temperature_limits(),
+            "soft_limits": soft_limits or hard_temperature_limits(),
+        },
+        "timestamp": boiler["timestamp"],
+    }
+
+
+@app.get("/snapshot", response_model=Snapshot)
+@with_circuit_breaker
+async def get_snapshot():
+    """Get sensors, relays, boiler data and limits in one response.
+
+    The sections are read concurrently. A section that cannot be read has
+    no data and an error instead of failing the whole snapshot. The boiler
+    stats, status and soft temperature limits come from the same poller
+    snapshot.
+    """
+    sensors, devices, boiler = await asyncio.gather(
+        snapshot_section("sensors", snapshot_sensors),
+        snapshot_section("devices", snapshot_devices),
+        snapshot_section("boiler", snapshot_boiler),
+    )
+    limits = snapshot_temperature_limits(boiler)
+    return Snapshot(
+        sensors=sensors,
+        devices=devices,
+        boiler_stats=boiler,
+        boiler_status=boiler,
+        temperature_limits=limits,
+        status=get_chronos_status(),
+        mock_devices=MOCK_DEVICES,
+        read_only_mode=cfg.READ_ONLY_MODE,
+        timestamp=time.time(),
+    )
+
+
 @app.post("/switch_state", dependencies=[Depends(ensure_not_read_only)])
 @with_circuit_breaker
 @with_rate_limit
@@ -232,7 +444,10 @@ async def switch_state(data: SwitchStateRequest):
     if MOCK_DEVICES:
         return True
     """Switch state of a device."""
-    return DEVICES[0].switch_state(data.command, data.relay_only)
+    result = await relay_bus.run(DEVICES[0].switch_state, data.command, data.relay_only)
+    # The command does not say which relays it switched, so re-read them all
+    relay_states.invalidate()
+    return result
 
 
 @app.get("/get_all_devices_state", response_model=list[DeviceModel])
@@ -241,7 +456,8 @@ async def get_all_devices_state():
     if MOCK_DEVICES:
         return [DeviceModel(id=i, state=True) for i in range(5)]
 
-    return [DeviceModel(id=i, state=DEVICES[i].state) for i in range(5)]
+    readings = await relay_states.get_all()
+    return [device_model(i, readings[i]) for i in range(5)]
 
 
 @app.get("/device_state", response_model=DeviceModel)
@@ -251,7 +467,7 @@ async def get_device_state(
 ):
     if MOCK_DEVICES:
         return DeviceModel(id=device, state=True)
-    return DeviceModel(id=device, state=DEVICES[device].state)
+    return device_model(device, await relay_states.get(device))
 
 
 @app.post("/device_state", dependencies=[Depends(ensure_not_read_only)])
@@ -261,26 +477,49 @@ async def update_device_state(data: DeviceModel):
     if MOCK_DEVICES:
         return DeviceModel(id=data.id, state=data.state)
     device_obj = DEVICES[data.id]
-    device_obj.state = data.state
-    return DeviceModel(id=device_obj.id, state=device_obj.state)
+    try:
+        await relay_bus.run(setattr, device_obj, "state", data.state)
+    except BusTimeout as e:
+        # The relay may or may not have switched, so read it back next time
+        relay_states.invalidate(device_obj.id)
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        relay_states.invalidate(device_obj.id)
+        logger.error(f"Failed to switch relay {device_obj.id}: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to switch relay {device_obj.id}"
+        )
+    relay_states.record(device_obj.id, data.state)
+    return device_model(device_obj.id, relay_states.readings[device_obj.id])
+
+
+@app.get("/relay_drift", response_model=list[RelayDriftEvent])
+async def get_relay_drift():
+    """Recent relays found in a different state than expected, oldest first."""
+    return [RelayDriftEvent(**vars(event)) for event in relay_states.events]
 
 
 # New boiler endpoints
 @app.get("/boiler_stats", response_model=BoilerStats)
 @with_circuit_breaker
-async def get_boiler_stats():
+async def get_boiler_stats(
+    max_age: Optional[float] = Query(
+        None,
+        ge=0,
+        description="Maximum snapshot age in seconds; 0 forces a fresh read",
+    ),
+):
     """Get current boiler statistics."""
     if MOCK_DEVICES:
         return BoilerStats(**mock_boiler_stats())
 
     try:
-        with create_modbus_connection() as device:
-            stats = device.read_boiler_data()
-            if not stats:
-                raise HTTPException(
-                    status_code=500, detail="Failed to read boiler data"
-                )
-            return BoilerStats(**stats)
+        snapshot = await boiler_poller.get(max_age)
+        if not snapshot:
+            raise HTTPException(status_code=500, detail="Failed to read boiler data")
+        return BoilerStats(**snapshot.data, timestamp=snapshot.timestamp)
+    except BusTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ModbusException as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -291,19 +530,30 @@ async def get_boiler_stats():
 
 @app.get("/boiler_status", response_model=OperatingStatus)
 @with_circuit_breaker
-async def get_boiler_status():
+async def get_boiler_status(
+    max_age: Optional[float] = Query(
+        None,
+        ge=0,
+        description="Maximum snapshot age in seconds; 0 forces a fresh read",
+    ),
+):
     """Get current boiler operating status."""
     if MOCK_DEVICES:
         return OperatingStatus(**mock_operating_status())
 
+    snapshot = boiler_poller.latest(max_age)
+    if snapshot:
+        return OperatingStatus(**snapshot.data, timestamp=snapshot.timestamp)
+
     try:
-        with create_modbus_connection() as device:
-            status = device.read_operating_status()
-            if not status:
-                raise HTTPException(
-                    status_code=500, detail="Failed to read operating status"
-                )
-            return OperatingStatus(**status)
+        status = await modbus_call("read_operating_status")
+        if not status:
+            raise HTTPException(
+                status_code=500, detail="Failed to read operating status"
+            )
+        return OperatingStatus(**status)
+    except BusTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ModbusException as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -323,15 +573,44 @@ async def set_setpoint(data: SetpointUpdate):
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     try:
-        with create_modbus_connection() as device:
-            success = device.set_boiler_setpoint(data.temperature)
-            if not success:
-                raise HTTPException(status_code=500, detail="Failed to set temperature")
-            return {"message": f"Temperature setpoint set to {data.temperature}°F"}
+        success = await modbus_call("set_boiler_setpoint", data.temperature)
+        if not success:
+            raise HTTPException(status_code=500, detail="Failed to set temperature")
+        boiler_poller.reset()
+        return {"message": f"Temperature setpoint set to {data.temperature}°F"}
+    except BusTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/telemetry", response_model=dict[str, TelemetrySeries])
+async def get_telemetry(
+    since: Optional[float] = Query(
+        None, description="Only return samples after this Unix time"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Return at most this many samples per source"
+    ),
+    source: Optional[list[str]] = Query(
+        None, description="Sources to include (boiler, sensors); all by default"
+    ),
+):
+    """Get recent boiler and sensor samples in columnar form."""
+    unknown = set(source or ()) - set(telemetry.buffers)
+    if unknown:
+        raise HTTPException(
+            status_code=422, detail=f"Unknown telemetry source: {sorted(unknown)}"
+        )
+    return telemetry.since(since, limit, source)
+
+
+@app.get("/modbus_health", response_model=ModbusHealth)
+async def get_modbus_health():
+    """Get the health of the shared Modbus session."""
+    return ModbusHealth(**modbus_session.health())
+
+
 @app.get("/download_log", response_class=FileResponse)
 @with_circuit_breaker
 async def download_log():
@@ -349,37 +628,32 @@ async def download_log():
         )
 
 
-@app.get("/temperature_limits")
-def get_temperature_limits():
-    """Get both hard and soft temperature limits for the boiler."""
+def hard_temperature_limits() -> dict:
+    return {
+        "min_setpoint": cfg.temperature.min_setpoint,
+        "max_setpoint": cfg.temperature.max_setpoint,
+    }
+
+
+async def read_temperature_limits() -> dict:
+    """Read the soft limits from the boiler, falling back to the hard limits."""
     if MOCK_DEVICES:
-        return {
-            "hard_limits": {
-                "min_setpoint": cfg.temperature.min_setpoint,
-                "max_setpoint": cfg.temperature.max_setpoint,
-            },
-            "soft_limits": {
-                "min_setpoint": cfg.temperature.min_setpoint,
-                "max_setpoint": cfg.temperature.max_setpoint,
-            },
-        }
+        soft_limits = None
+    else:
+        soft_limits = await modbus_call("get_temperature_limits")
+    return {
+        "hard_limits": hard_temperature_limits(),
+        "soft_limits": soft_limits or hard_temperature_limits(),
+    }
 
+
+@app.get("/temperature_limits")
+async def get_temperature_limits():
+    """Get both hard and soft temperature limits for the boiler."""
     try:
-        with create_modbus_connection() as device:
-            soft_limits = device.get_temperature_limits()
-            if not soft_limits:
-                soft_limits = {
-                    "min_setpoint": cfg.temperature.min_setpoint,
-                    "max_setpoint": cfg.temperature.max_setpoint,
-                }
-
-            return {
-                "hard_limits": {
-                    "min_setpoint": cfg.temperature.min_setpoint,
-                    "max_setpoint": cfg.temperature.max_setpoint,
-                },
-                "soft_limits": soft_limits,
-            }
+        return await read_temperature_limits()
+    except BusTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get temperature limits: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get temperature limits")
@@ -394,15 +668,19 @@ async def set_temperature_limits(limits: SetpointLimitsUpdate):
     if MOCK_DEVICES:
         return {"message": "Temperature limits updated successfully"}
     try:
-        with create_modbus_connection() as device:
-            success = device.set_temperature_limits(
-                limits.min_setpoint, limits.max_setpoint
+        success = await modbus_call(
+            "set_temperature_limits",
+            limits.min_setpoint,
+            limits.max_setpoint,
+        )
+        if not success:
+            raise HTTPException(
+                status_code=500, detail="Failed to set temperature limits"
             )
-            if not success:
-                raise HTTPException(
-                    status_code=500, detail="Failed to set temperature limits"
-                )
-            return {"message": "Temperature limits updated successfully"}
+        boiler_poller.reset()
+        return {"message": "Temperature limits updated successfully"}
+    except BusTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ModbusException as e:
         raise HTTPException(status_code=503, detail=f"Modbus Error: {str(e)}")
     except Exception as e:
@@ -4,6 +4,8 @@ MODBUS = {
         "portname": "/dev/ttyUSB0",
         "parity": "E",
         "timeout": 1,
+        "keepalive_interval": 30,  # Seconds of idle time before probing the link
+        "max_read_span": 32,  # Largest register block fetched in one transaction
         "registers": {
             "holding": {
                 "operating_mode": 0,  # 40001
@@ -46,6 +46,10 @@ config_dict = {
         "mount_point": "/sys/bus/w1/devices",
         "in_id": "28-00000677d509",
         "out_id": "28-011927cd8e7d",
+        "interval": float(os.getenv("SENSOR_POLL_INTERVAL", "5")),
+        "max_attempts": int(os.getenv("SENSOR_MAX_ATTEMPTS", "5")),
+        # Seconds a failing sensor keeps reporting its last good value
+        "max_age": float(os.getenv("SENSOR_MAX_AGE", "20")),
     },
     "files": {
         "log_path": str(ensure_log_path(Path("/opt/chronos/edge_server/chronos.log")))
@@ -63,33 +67,32 @@ config_dict = {
         "led_green": 9,
         "led_blue": 10,
     },
+    "relay_cache": {
+        "ttl": float(os.getenv("RELAY_STATE_TTL", "30")),
+        "reconcile_interval": float(os.getenv("RELAY_RECONCILE_INTERVAL", "60")),
+    },
+    "telemetry": {
+        # Samples kept per source; 17280 covers 24 hours at a 5 second poll
+        "capacity": int(os.getenv("TELEMETRY_CAPACITY", "17280")),
+    },
     "efficiency": {"hours": 12},
+    "poller": {
+        "interval": float(os.getenv("BOILER_POLL_INTERVAL", "5")),
+        "max_age": float(os.getenv("BOILER_SNAPSHOT_MAX_AGE", "15")),
+    },
+    "io": {
+        # "sync" runs ModbusDevice on the Modbus bus thread, "async" runs
+        # AsyncModbusDevice directly on the event loop
+        "modbus_backend": os.getenv("MODBUS_BACKEND", "sync").lower(),
+        "modbus_timeout": float(os.getenv("MODBUS_IO_TIMEOUT", "10")),
+        "relay_timeout": float(os.getenv("RELAY_IO_TIMEOUT", "10")),
+        "sensor_timeout": float(os.getenv("SENSOR_IO_TIMEOUT", "5")),
+    },
     "temperature": {
         "min_setpoint": float(os.getenv("MIN_SETPOINT_TEMP", "70.0")),
         "max_setpoint": float(os.getenv("MAX_SETPOINT_TEMP", "110.0")),
     },
     "MOCK_DEVICES": os.getenv("MOCK_DEVICES", "false").lower() == "true",
     "READ_ONLY_MODE": os.getenv("READ_ONLY_MODE", "false").lower() == "true",
-    "registers": {
-        "holding": {
-            "operating_mode": 0,
-            "cascade_mode": 1,
-            "setpoint": 2,
-            "min_setpoint_limit": 3,
-            "max_setpoint_limit": 4,
-            "last_lockout": 5,
-            "system_supply_temp": 6,
-        },
-        "input": {
-            "alarm": 0,
-            "pump": 1,
-            "flame": 2,
-            "cascade_current_power": 3,
-            "outlet_temp": 5,
-            "inlet_temp": 6,
-            "flue_temp": 7,
-            "lead_firing_rate": 8,
-        },
-    },
 }
 cfg = Struct(config_dict)
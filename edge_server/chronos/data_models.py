@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,21 @@ class DeviceModel(BaseModel):
     id: int = Field(..., ge=0, lt=7, description="Device ID (0-4)")
     state: bool
     is_season_switch: bool = False
+    timestamp: Optional[float] = Field(
+        None, description="Unix time the state was last confirmed with the board"
+    )
+    stale: bool = Field(
+        False, description="Whether the state is older than the relay cache TTL"
+    )
+
+
+class RelayDriftEvent(BaseModel):
+    """A relay found in a different state than the edge server expected."""
+
+    relay: int
+    expected: bool
+    actual: bool
+    timestamp: float
 
 
 # New models for boiler data
@@ -42,6 +57,9 @@ class BoilerStats(BaseModel):
     )
     pump_status: bool = Field(..., description="Pump running status")
     flame_status: bool = Field(..., description="Flame detection status")
+    timestamp: Optional[float] = Field(
+        None, description="Unix time the registers were read"
+    )
 
 
 class OperatingStatus(BaseModel):
@@ -54,6 +72,27 @@ class OperatingStatus(BaseModel):
     current_setpoint: float = Field(
         ..., description="Current temperature setpoint in °F"
     )
+    timestamp: Optional[float] = Field(
+        None, description="Unix time the registers were read"
+    )
+
+
+class ModbusHealth(BaseModel):
+    """Health of the shared Modbus session."""
+
+    state: str = Field(..., description="connected, degraded or disconnected")
+    port: str = Field(..., description="Serial port used by the session")
+    connected: bool = Field(..., description="Whether the serial port is open")
+    consecutive_failures: int = Field(
+        ..., description="Failed operations since the last success"
+    )
+    last_success: Optional[float] = Field(
+        None, description="Unix time of the last successful operation"
+    )
+    last_failure: Optional[float] = Field(
+        None, description="Unix time of the last failed operation"
+    )
+    last_error: Optional[str] = Field(None, description="Last error message")
 
 
 class SetpointUpdate(BaseModel):
@@ -93,3 +132,39 @@ class SetpointLimitsUpdate(BaseModel):
         if self.min_setpoint >= self.max_setpoint:
             raise ValueError("Minimum setpoint must be less than maximum setpoint")
         return self
+
+
+class TelemetrySeries(BaseModel):
+    """Samples from one source in columnar form, oldest first."""
+
+    timestamp: List[float] = Field(..., description="Unix time of each sample")
+    columns: Dict[str, List[Optional[float]]] = Field(
+        ..., description="One list per field, aligned with timestamp"
+    )
+
+
+T = TypeVar("T")
+
+
+class SnapshotSection(BaseModel, Generic[T]):
+    """One section of a snapshot; data is None if it could not be read."""
+
+    data: Optional[T] = None
+    timestamp: Optional[float] = Field(
+        None, description="Unix time of the oldest value in the section"
+    )
+    error: Optional[str] = Field(None, description="Why the section is missing")
+
+
+class Snapshot(BaseModel):
+    """Everything the dashboard needs from the edge server in one response."""
+
+    sensors: SnapshotSection[Dict[str, Optional[float]]]
+    devices: SnapshotSection[List[DeviceModel]]
+    boiler_stats: SnapshotSection[BoilerStats]
+    boiler_status: SnapshotSection[OperatingStatus]
+    temperature_limits: SnapshotSection[Dict[str, Dict[str, float]]]
+    status: bool
+    mock_devices: bool = False
+    read_only_mode: bool = False
+    timestamp: float = Field(..., description="Unix time the snapshot was built")
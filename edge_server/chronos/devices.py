@@ -1,25 +1,36 @@
 import asyncio
 import math
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from chronos.config import cfg
 from chronos.logging import root_logger as logger
-from pymodbus.client import ModbusSerialClient
+from chronos.registers import (
+    BOILER_REGISTERS,
+    BOILER_STATS,
+    HOLDING,
+    OPERATING_STATUS,
+    TEMPERATURE_LIMITS,
+    ReadBlock,
+    c_to_f,
+)
+from pymodbus.client import AsyncModbusSerialClient, ModbusSerialClient
 from pymodbus.exceptions import ModbusException, ModbusIOException
 from serial import Serial
 
-
-def c_to_f(celsius):
-    """Convert Celsius to Fahrenheit.
-
-    This matches the C implementation exactly:
-    return ((9.0f/5.0f)*c + 32.0f);
-    """
-    return (9.0 / 5.0) * celsius + 32.0
+# Errors after which a boiler read is retried
+RETRYABLE_ERRORS = (
+    ModbusException,
+    OSError,
+    AttributeError,
+    IndexError,
+    ValueError,
+    TimeoutError,
+    ModbusIOException,
+)
 
 
 def _ensure_event_loop():
@@ -66,51 +77,16 @@ def create_modbus_connection(port="/dev/ttyUSB0", baudrate=9600, parity="E", tim
             device.close()
 
 
-class ModbusDevice:
+class BaseModbusDevice:
     """
-    A Modbus device class that handles serial communication with proper resource management.
-    Can be used either with context manager or directly:
-
-    # Context manager usage (preferred):
-    with create_modbus_connection() as device:
-        device.read_boiler_data()
-
-    # Direct usage:
-    device = ModbusDevice()
-    try:
-        device.read_boiler_data()
-    finally:
-        device.close()
+    Register map, lookup tables and value conversions shared by the sync and
+    async Modbus devices. Subclasses own the client and the bus transactions.
     """
 
-    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, parity="E", timeout=1):
-        _ensure_event_loop()
-        self.client = ModbusSerialClient(
-            port=port, baudrate=baudrate, parity=parity, timeout=timeout
-        )
-
-        # Cleaned up by moving register mappings to cfg.registers in config.py
-        self.registers = SimpleNamespace(
-            holding=SimpleNamespace(
-                operating_mode=cfg.registers.holding.operating_mode,
-                cascade_mode=cfg.registers.holding.cascade_mode,
-                setpoint=cfg.registers.holding.setpoint,
-                min_setpoint_limit=cfg.registers.holding.min_setpoint_limit,
-                max_setpoint_limit=cfg.registers.holding.max_setpoint_limit,
-                last_lockout=cfg.registers.holding.last_lockout,
-                system_supply_temp=cfg.registers.holding.system_supply_temp,
-            ),
-            input=SimpleNamespace(
-                alarm=cfg.registers.input.alarm,
-                pump=cfg.registers.input.pump,
-                flame=cfg.registers.input.flame,
-                cascade_current_power=cfg.registers.input.cascade_current_power,
-                outlet_temp=cfg.registers.input.outlet_temp,
-                inlet_temp=cfg.registers.input.inlet_temp,
-                flue_temp=cfg.registers.input.flue_temp,
-                lead_firing_rate=cfg.registers.input.lead_firing_rate,
-            ),
-        )
+    def __init__(self):
+        # Register addresses come from the declarative map in registers.py
+        self.register_map = BOILER_REGISTERS
+        self.registers = BOILER_REGISTERS.addresses()
 
         # Updated operating modes to match working implementation
         self.operating_modes = {
@@ -143,6 +119,67 @@ class ModbusDevice:
             "8": "Fan Speed Error",
         }
 
+    def _decode_boiler_data(self, values: dict) -> dict:
+        """Add the mode descriptions to the decoded boiler registers."""
+        return {
+            **values,
+            "operating_mode_str": self.operating_modes.get(
+                str(values["operating_mode"]), f"Unknown ({values['operating_mode']})"
+            ),
+            "cascade_mode_str": self.cascade_modes.get(
+                str(values["cascade_mode"]), f"Unknown ({values['cascade_mode']})"
+            ),
+        }
+
+    def _expected_readings(self, readings: dict) -> dict:
+        """Return readings as they will read back after encoding."""
+        return {
+            name: self.register_map[name].decode(self.register_map[name].encode(value))
+            for name, value in readings.items()
+        }
+
+    @staticmethod
+    def _in_hard_limits(temperature: float) -> bool:
+        return (
+            cfg.temperature.min_setpoint <= temperature <= cfg.temperature.max_setpoint
+        )
+
+    @staticmethod
+    def _setpoint_to_percent(effective_setpoint: float) -> int:
+        # Convert temperature to percentage using the verified formula from C code
+        return math.trunc(-101.4856 + 1.7363171 * effective_setpoint)
+
+    @staticmethod
+    def _check_setpoint(written: int, actual: int):
+        if actual != written:
+            message = f"Setpoint read-back mismatch: wrote {written}%, read {actual}"
+            logger.error(message)
+            raise ModbusException(message)
+
+
+class ModbusDevice(BaseModbusDevice):
+    """
+    A Modbus device class that handles serial communication with proper resource management.
+    Can be used either with context manager or directly:
+
+    # Context manager usage (preferred):
+    with create_modbus_connection() as device:
+        device.read_boiler_data()
+
+    # Direct usage:
+    device = ModbusDevice()
+    try:
+        device.read_boiler_data()
+    finally:
+        device.close()
+    """
+
+    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, parity="E", timeout=1):
+        _ensure_event_loop()
+        self.client = ModbusSerialClient(
+            port=port, baudrate=baudrate, parity=parity, timeout=timeout
+        )
+        super().__init__()
         self._connect()
 
     def _connect(self):
@@ -197,6 +234,28 @@ class ModbusDevice:
                 f"Failed to read input register {address}: {e}"
             ) from e
 
+    def _read_block(self, block: ReadBlock):
+        if block.kind == HOLDING:
+            return self._read_holding_register(block.address, count=block.count)
+        return self._read_input_register(block.address, count=block.count)
+
+    def read_registers(self, names, max_span=None) -> dict:
+        """Read the named registers in as few transactions as possible.
+
+        Args:
+            names (Iterable[str]): Register names from the register map
+            max_span (int): Largest block to read in one transaction
+
+        Returns:
+            dict: Decoded readings keyed by register name
+        Raises:
+            ModbusException: If any block read fails
+        """
+        values = {}
+        for block in self.register_map.plan(names, max_span):
+            values.update(block.decode(self._read_block(block)))
+        return values
+
     def read_boiler_data(self, max_retries=3):
         """Read various temperature and status data from the boiler.
 
@@ -232,63 +291,17 @@ class ModbusDevice:
         last_error = None
         for attempt in range(max_retries):
             try:
-                # Read holding registers block (operating mode through supply temp)
-                h_result = self._read_holding_register(
-                    self.registers.holding.operating_mode, count=7
-                )
-
-                # Read input registers block (status through firing rate)
-                i_result = self._read_input_register(
-                    3,
-                    count=9,  # Start from address 3 to match working implementation
+                # One holding block (operating mode through supply temp) and
+                # one input block (status through firing rate)
+                boiler_stats = self._decode_boiler_data(
+                    self.read_registers(BOILER_STATS)
                 )
 
-                # Convert temperatures exactly as in C code
-                temps = {
-                    "system_supply_temp": round(c_to_f(h_result[6] / 10.0), 1),
-                    "outlet_temp": round(c_to_f(i_result[5] / 10.0), 1),
-                    "inlet_temp": round(c_to_f(i_result[6] / 10.0), 1),
-                    "flue_temp": round(c_to_f(i_result[7] / 10.0), 1),
-                }
-
-                boiler_stats = {
-                    # System Status - Verified working
-                    "operating_mode": h_result[0],
-                    "operating_mode_str": self.operating_modes.get(
-                        str(h_result[0]), f"Unknown ({h_result[0]})"
-                    ),
-                    "cascade_mode": h_result[1],
-                    "cascade_mode_str": self.cascade_modes.get(
-                        str(h_result[1]), f"Unknown ({h_result[1]})"
-                    ),
-                    # Setpoints - Unverified, read from file in C implementation
-                    "current_setpoint": round(c_to_f(h_result[2] / 10.0), 1),
-                    "min_setpoint": round(c_to_f(h_result[3] / 10.0), 1),
-                    "max_setpoint": round(c_to_f(h_result[4] / 10.0), 1),
-                    # Status Flags - Verified working (direct boolean conversion)
-                    "alarm_status": bool(i_result[0]),
-                    "pump_status": bool(i_result[1]),
-                    "flame_status": bool(i_result[2]),
-                    # Performance - Verified working (direct percentage values)
-                    "cascade_current_power": float(i_result[3]),
-                    "lead_firing_rate": float(i_result[8]),
-                    # Add verified temperatures
-                    **temps,
-                }
-
                 logger.info(f"Successfully read boiler data (attempt {attempt + 1})")
                 logger.debug(f"Boiler stats: {boiler_stats}")
                 return boiler_stats
 
-            except (
-                ModbusException,
-                OSError,
-                AttributeError,
-                IndexError,
-                ValueError,
-                TimeoutError,
-                ModbusIOException,
-            ) as e:
+            except RETRYABLE_ERRORS as e:
                 last_error = e
                 logger.error(
                     f"Failed to read boiler data (attempt {attempt + 1}): {str(e)}"
@@ -330,24 +343,25 @@ class ModbusDevice:
 
         Returns:
             bool: True if successful, False otherwise
+        Raises:
+            ModbusException: If the setpoint register does not read back the
+                percentage written
         """
         if not self.is_connected():
             raise ModbusException("Device not connected")
 
         # Validate range (70-110°F maps to 0-100%)
-        if not (
-            cfg.temperature.min_setpoint
-            <= effective_setpoint
-            <= cfg.temperature.max_setpoint
-        ):
+        if not self._in_hard_limits(effective_setpoint):
             logger.error(
                 f"Setpoint {effective_setpoint}°F is out of valid range ({cfg.temperature.min_setpoint}-{cfg.temperature.max_setpoint}°F)"
             )
             return False
 
-        # Convert temperature to percentage using the verified formula from C code
-        setpoint = math.trunc(-101.4856 + 1.7363171 * effective_setpoint)
+        setpoint = self._setpoint_to_percent(effective_setpoint)
 
+        # Registers 0 and 2 are not adjacent, and a block write would also
+        # overwrite the cascade mode in register 1, so these stay two writes
+        # followed by a read-back of the setpoint register
         for attempt in range(max_retries):
             try:
                 # Write mode (4) to operating mode register (verified from C code)
@@ -359,15 +373,12 @@ class ModbusDevice:
 
                 # Write setpoint percentage
                 result2 = self.client.write_register(
-                    self.registers.holding.setpoint, setpoint
+                    self.registers.holding.current_setpoint, setpoint
                 )
                 if result2.isError():
                     raise ModbusException("Failed to write setpoint")
 
-                logger.info(
-                    f"Successfully set boiler setpoint to {effective_setpoint}°F ({setpoint}%)"
-                )
-                return True
+                break
 
             except (ModbusException, OSError) as e:
                 logger.error(
@@ -375,9 +386,16 @@ class ModbusDevice:
                 )
                 if attempt < max_retries - 1:
                     time.sleep(1)
+        else:
+            logger.error(f"Failed to set setpoint after {max_retries} attempts")
+            return False
 
-        logger.error(f"Failed to set setpoint after {max_retries} attempts")
-        return False
+        (actual,) = self._read_holding_register(self.registers.holding.current_setpoint)
+        self._check_setpoint(setpoint, actual)
+        logger.info(
+            f"Successfully set boiler setpoint to {effective_setpoint}°F ({setpoint}%)"
+        )
+        return True
 
     def close(self):
         """Close the Modbus connection."""
@@ -387,93 +405,93 @@ class ModbusDevice:
         """Read operating mode, cascade mode, and current setpoint."""
         try:
             # Read operating mode, cascade mode, and setpoint
-            result = self._read_holding_register(
-                self.registers.holding.operating_mode, count=3
-            )
-
-            return {
-                "operating_mode": result[0],
-                "operating_mode_str": self.operating_modes.get(
-                    str(result[0]), f"Unknown ({result[0]})"
-                ),
-                "cascade_mode": result[1],
-                "cascade_mode_str": self.cascade_modes.get(
-                    str(result[1]), f"Unknown ({result[1]})"
-                ),
-                "current_setpoint": round(c_to_f(result[2] / 10.0), 1),
-            }
+            return self._decode_boiler_data(self.read_registers(OPERATING_STATUS))
         except (ModbusException, OSError, AttributeError, IndexError) as e:
             logger.error(f"Failed to read operating status: {str(e)}")
             return None
 
-    def get_temperature_limits(self) -> dict:
-        """Get the current soft temperature limits from the device."""
-        try:
-            if not self.client or not self.client.is_socket_open():
-                raise ModbusException("Device not connected")
+    def _write_registers(self, address, values) -> bool:
+        """Write consecutive holding registers with one FC16 request.
 
-            # Read min and max setpoint registers
-            min_setpoint = self.client.read_holding_registers(
-                address=self.registers.holding.min_setpoint_limit, count=1, slave=1
-            )
-            max_setpoint = self.client.read_holding_registers(
-                address=self.registers.holding.max_setpoint_limit, count=1, slave=1
-            )
+        Falls back to one write_register (FC6) per register if the device
+        rejects the multi-register write.
+        """
+        if len(values) > 1:
+            try:
+                result = self.client.write_registers(address=address, values=values)
+                if not result.isError():
+                    return True
+                logger.warning(f"Multi-register write at {address} was rejected")
+            except ModbusException as e:
+                logger.warning(f"Multi-register write at {address} failed: {e}")
+
+        results = [
+            self.client.write_register(address=address + offset, value=value)
+            for offset, value in enumerate(values)
+        ]
+        return not any(result.isError() for result in results)
+
+    def write_readings(self, readings: dict) -> bool:
+        """Write {register name: reading} and verify with a single read-back.
 
-            if min_setpoint.isError() or max_setpoint.isError():
-                logger.error("Failed to read temperature limits")
-                return None
+        Adjacent registers are written in one transaction.
+
+        Returns:
+            bool: True if every register reads back the written value
+        """
+        for address, values in self.register_map.write_runs(readings):
+            if not self._write_registers(address, values):
+                logger.error(f"Failed to write holding registers at {address}")
+                return False
+
+        expected = self._expected_readings(readings)
+        actual = self.read_registers(readings)
+        if actual != expected:
+            logger.error(f"Read-back mismatch: wrote {expected}, read {actual}")
+            return False
+        return True
+
+    def get_temperature_limits(self) -> dict:
+        """Get the current soft temperature limits from the device.
 
-            # Convert raw register values to temperature
-            min_temp = round(c_to_f(min_setpoint.registers[0] / 10.0), 1)
-            max_temp = round(c_to_f(max_setpoint.registers[0] / 10.0), 1)
+        Both limits are read in one transaction, falling back to one read per
+        register if the device rejects the block read.
+        """
+        try:
+            if not self.is_connected():
+                raise ModbusException("Device not connected")
 
-            return {
-                "min_setpoint": min_temp,
-                "max_setpoint": max_temp,
-            }
+            try:
+                return self.read_registers(TEMPERATURE_LIMITS)
+            except ModbusException as e:
+                logger.warning(f"Block read of temperature limits failed: {e}")
+                return self.read_registers(TEMPERATURE_LIMITS, max_span=1)
         except Exception as e:
             logger.error(f"Error reading temperature limits: {str(e)}")
             return None
 
     def set_temperature_limits(self, min_setpoint: float, max_setpoint: float) -> bool:
-        """Set soft temperature limits in the device."""
+        """Set soft temperature limits in the device.
+
+        Both limits are written in one transaction, so the device never holds
+        a new minimum with the old maximum, and verified by one read-back.
+        """
         try:
-            if not self.client or not self.client.is_socket_open():
+            if not self.is_connected():
                 raise ModbusException("Device not connected")
 
             # Validate against hard limits
-            if not (
-                cfg.temperature.min_setpoint
-                <= min_setpoint
-                <= cfg.temperature.max_setpoint
-            ) or not (
-                cfg.temperature.min_setpoint
-                <= max_setpoint
-                <= cfg.temperature.max_setpoint
+            if not self._in_hard_limits(min_setpoint) or not self._in_hard_limits(
+                max_setpoint
             ):
                 logger.error(
                     f"Temperature limits {min_setpoint}-{max_setpoint}°F are outside valid range ({cfg.temperature.min_setpoint}-{cfg.temperature.max_setpoint}°F)"
                 )
                 return False
 
-            # Convert temperatures to register values (reverse of c_to_f)
-            min_value = int((min_setpoint - 32.0) * 5.0 / 9.0 * 10)
-            max_value = int((max_setpoint - 32.0) * 5.0 / 9.0 * 10)
-
-            # Write min and max setpoint registers
-            min_result = self.client.write_register(
-                address=self.registers.holding.min_setpoint_limit,
-                value=min_value,
-                slave=1,
-            )
-            max_result = self.client.write_register(
-                address=self.registers.holding.max_setpoint_limit,
-                value=max_value,
-                slave=1,
-            )
-
-            if min_result.isError() or max_result.isError():
+            if not self.write_readings(
+                {"min_setpoint": min_setpoint, "max_setpoint": max_setpoint}
+            ):
                 logger.error("Failed to write temperature limits")
                 return False
 
@@ -489,11 +507,426 @@ class ModbusDevice:
         self.close()
 
 
+class AsyncModbusDevice(BaseModbusDevice):
+    """
+    An asyncio Modbus device built on pymodbus' AsyncModbusSerialClient.
+
+    It exposes the same methods as ModbusDevice as coroutines, so boiler
+    transactions run on the event loop and overlap with relay and sensor I/O
+    instead of occupying a worker thread. Retries back off with asyncio.sleep.
+
+    Usage:
+        device = AsyncModbusDevice(port="/dev/ttyUSB0")
+        await device._connect()
+        try:
+            stats = await device.read_boiler_data()
+        finally:
+            device.close()
+    """
+
+    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, parity="E", timeout=1):
+        self.client = AsyncModbusSerialClient(
+            port=port, baudrate=baudrate, parity=parity, timeout=timeout
+        )
+        super().__init__()
+
+    async def _connect(self):
+        """Attempt to connect to the device.
+
+        Returns:
+            bool: True if connection was successful, False otherwise
+        """
+        try:
+            if not await self.client.connect():
+                logger.warning("Unable to connect to Modbus device")
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Error connecting to Modbus device: {e}")
+            return False
+
+    def is_connected(self):
+        """Check if the device is connected.
+
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        try:
+            return bool(self.client.connected)
+        except Exception:
+            return False
+
+    async def _read_holding_register(self, address, count=1):
+        """Read a holding register and handle errors."""
+        try:
+            result = await self.client.read_holding_registers(
+                address=address, count=count
+            )
+            if result.isError():
+                raise ModbusException(f"Failed to read holding register {address}")
+            return result.registers
+        except Exception as e:
+            logger.error(f"Failed to read holding register {address}: {e}")
+            raise ModbusException(
+                f"Failed to read holding register {address}: {e}"
+            ) from e
+
+    async def _read_input_register(self, address, count=1):
+        """Read an input register and handle errors."""
+        try:
+            result = await self.client.read_input_registers(
+                address=address, count=count
+            )
+            if result.isError():
+                raise ModbusException(f"Failed to read input register {address}")
+            return result.registers
+        except Exception as e:
+            logger.error(f"Failed to read input register {address}: {e}")
+            raise ModbusException(
+                f"Failed to read input register {address}: {e}"
+            ) from e
+
+    async def _read_block(self, block: ReadBlock):
+        if block.kind == HOLDING:
+            return await self._read_holding_register(block.address, count=block.count)
+        return await self._read_input_register(block.address, count=block.count)
+
+    async def read_registers(self, names, max_span=None) -> dict:
+        """Read the named registers in as few transactions as possible."""
+        values = {}
+        for block in self.register_map.plan(names, max_span):
+            values.update(block.decode(await self._read_block(block)))
+        return values
+
+    async def read_boiler_data(self, max_retries=3):
+        """Read various temperature and status data from the boiler.
+
+        See ModbusDevice.read_boiler_data for the register layout.
+
+        Returns:
+            dict: Dictionary containing boiler statistics, or None if read failed
+        Raises:
+            ModbusException: If device is not connected and reconnection fails
+        """
+        if not self.is_connected():
+            raise ModbusException("Device not connected")
+
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                boiler_stats = self._decode_boiler_data(
+                    await self.read_registers(BOILER_STATS)
+                )
+
+                logger.info(f"Successfully read boiler data (attempt {attempt + 1})")
+                logger.debug(f"Boiler stats: {boiler_stats}")
+                return boiler_stats
+
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                logger.error(
+                    f"Failed to read boiler data (attempt {attempt + 1}): {str(e)}"
+                )
+
+                if not self.is_connected():
+                    logger.info(
+                        f"Device not connected, attempting reconnection (attempt {attempt + 1})"
+                    )
+                    if not await self._connect():
+                        if attempt == max_retries - 1:
+                            raise ModbusException(
+                                "Device not connected"
+                            ) from last_error
+                        await asyncio.sleep(1)
+                        continue
+                elif attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+
+        logger.error(
+            f"Failed to read boiler data after {max_retries} attempts: {last_error}"
+        )
+        return None
+
+    async def set_boiler_setpoint(self, effective_setpoint, max_retries=3):
+        """Set the boiler's temperature setpoint.
+
+        See ModbusDevice.set_boiler_setpoint for the conversion formula.
+
+        Returns:
+            bool: True if successful, False otherwise
+        Raises:
+            ModbusException: If the setpoint register does not read back the
+                percentage written
+        """
+        if not self.is_connected():
+            raise ModbusException("Device not connected")
+
+        if not self._in_hard_limits(effective_setpoint):
+            logger.error(
+                f"Setpoint {effective_setpoint}°F is out of valid range ({cfg.temperature.min_setpoint}-{cfg.temperature.max_setpoint}°F)"
+            )
+            return False
+
+        setpoint = self._setpoint_to_percent(effective_setpoint)
+
+        for attempt in range(max_retries):
+            try:
+                result1 = await self.client.write_register(
+                    self.registers.holding.operating_mode, 4
+                )
+                if result1.isError():
+                    raise ModbusException("Failed to write operating mode")
+
+                result2 = await self.client.write_register(
+                    self.registers.holding.current_setpoint, setpoint
+                )
+                if result2.isError():
+                    raise ModbusException("Failed to write setpoint")
+
+                break
+
+            except (ModbusException, OSError) as e:
+                logger.error(
+                    f"Failed to set setpoint (attempt {attempt + 1}): {str(e)}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+        else:
+            logger.error(f"Failed to set setpoint after {max_retries} attempts")
+            return False
+
+        (actual,) = await self._read_holding_register(
+            self.registers.holding.current_setpoint
+        )
+        self._check_setpoint(setpoint, actual)
+        logger.info(
+            f"Successfully set boiler setpoint to {effective_setpoint}°F ({setpoint}%)"
+        )
+        return True
+
+    def close(self):
+        """Close the Modbus connection."""
+        self.client.close()
+
+    async def read_operating_status(self):
+        """Read operating mode, cascade mode, and current setpoint."""
+        try:
+            return self._decode_boiler_data(await self.read_registers(OPERATING_STATUS))
+        except (ModbusException, OSError, AttributeError, IndexError) as e:
+            logger.error(f"Failed to read operating status: {str(e)}")
+            return None
+
+    async def _write_registers(self, address, values) -> bool:
+        """Write consecutive holding registers with one FC16 request.
+
+        Falls back to one write_register (FC6) per register if the device
+        rejects the multi-register write.
+        """
+        if len(values) > 1:
+            try:
+                result = await self.client.write_registers(
+                    address=address, values=values
+                )
+                if not result.isError():
+                    return True
+                logger.warning(f"Multi-register write at {address} was rejected")
+            except ModbusException as e:
+                logger.warning(f"Multi-register write at {address} failed: {e}")
+
+        results = [
+            await self.client.write_register(address=address + offset, value=value)
+            for offset, value in enumerate(values)
+        ]
+        return not any(result.isError() for result in results)
+
+    async def write_readings(self, readings: dict) -> bool:
+        """Write {register name: reading} and verify with a single read-back."""
+        for address, values in self.register_map.write_runs(readings):
+            if not await self._write_registers(address, values):
+                logger.error(f"Failed to write holding registers at {address}")
+                return False
+
+        expected = self._expected_readings(readings)
+        actual = await self.read_registers(readings)
+        if actual != expected:
+            logger.error(f"Read-back mismatch: wrote {expected}, read {actual}")
+            return False
+        return True
+
+    async def get_temperature_limits(self) -> dict:
+        """Get the current soft temperature limits from the device."""
+        try:
+            if not self.is_connected():
+                raise ModbusException("Device not connected")
+
+            try:
+                return await self.read_registers(TEMPERATURE_LIMITS)
+            except ModbusException as e:
+                logger.warning(f"Block read of temperature limits failed: {e}")
+                return await self.read_registers(TEMPERATURE_LIMITS, max_span=1)
+        except Exception as e:
+            logger.error(f"Error reading temperature limits: {str(e)}")
+            return None
+
+    async def set_temperature_limits(
+        self, min_setpoint: float, max_setpoint: float
+    ) -> bool:
+        """Set soft temperature limits in the device."""
+        try:
+            if not self.is_connected():
+                raise ModbusException("Device not connected")
+
+            if not self._in_hard_limits(min_setpoint) or not self._in_hard_limits(
+                max_setpoint
+            ):
+                logger.error(
+                    f"Temperature limits {min_setpoint}-{max_setpoint}°F are outside valid range ({cfg.temperature.min_setpoint}-{cfg.temperature.max_setpoint}°F)"
+                )
+                return False
+
+            if not await self.write_readings(
+                {"min_setpoint": min_setpoint, "max_setpoint": max_setpoint}
+            ):
+                logger.error("Failed to write temperature limits")
+                return False
+
+            return True
+        except Exception as e:
+            logger.error(f"Error setting temperature limits: {str(e)}")
+            return False
+
+
+# Prompt the relay board prints once it has finished answering a command
+RELAY_PROMPT = b">"
+
+
+def _parse_relay_state(response: str) -> bool:
+    """Parse the reply to 'relay read N'.
+
+    The response might look like:
+    'relay read 0 \n\n\ron\n\r>'
+    or
+    'relay read 1 \n\n\roff\n\r>'
+    """
+    lines = response.strip().split()
+    if "on" in lines:
+        return True
+    if "off" in lines:
+        return False
+    raise ValueError(f"Unable to parse device state from response: {response}")
+
+
+def _parse_relay_mask(response: str) -> Optional[int]:
+    """Parse the hex bitmask in the reply to 'relay readall', if present.
+
+    The response looks like 'relay readall\n\r001f\n\r>'.
+    """
+    for token in response.replace("relay readall", "").split():
+        token = token.strip(">")
+        if token and all(c in "0123456789abcdefABCDEF" for c in token):
+            return int(token, 16)
+    return None
+
+
+class RelayBus:
+    """
+    A persistent session with the USB relay board.
+
+    The port is opened once and kept open, and each reply is read up to the
+    board's '>' prompt instead of waiting for the serial timeout. Commands
+    are serialized with a lock; the app additionally funnels them through
+    the single-threaded relay BusExecutor, which acts as the command queue.
+
+    Usage:
+        bus = RelayBus("/dev/ttyACM0")
+        states = bus.read_all(range(5))  # {0: True, 1: False, ...}
+    """
+
+    def __init__(self, portname: str = "", baudrate: int = 19200, timeout=1):
+        self.portname = portname
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self._port: Optional[Serial] = None
+        self._lock = threading.Lock()
+
+    def _ensure_open(self) -> Serial:
+        if self._port is None or not self._port.is_open:
+            logger.info(f"Opening relay board on {self.portname}")
+            self._port = Serial(self.portname, self.baudrate, timeout=self.timeout)
+        return self._port
+
+    def command(self, command: str) -> str:
+        """Send a command and return the reply up to and including the prompt.
+
+        Raises:
+            SerialException: If the port cannot be opened or written
+            TimeoutError: If the prompt does not arrive within the timeout
+        """
+        with self._lock:
+            port = self._ensure_open()
+            try:
+                port.reset_input_buffer()
+                port.write(command.encode("utf-8"))
+                response = port.read_until(RELAY_PROMPT)
+            except Exception:
+                self._close()
+                raise
+            if not response.endswith(RELAY_PROMPT):
+                # Out of sync with the board, reopen on the next command
+                self._close()
+                raise TimeoutError(f"No prompt from relay board after {command!r}")
+            return response.decode("utf-8", errors="replace")
+
+    def read(self, relay: int) -> bool:
+        """Read the state of a single relay."""
+        return _parse_relay_state(self.command(f"relay read {relay}\n\r"))
+
+    def write(self, relay: int, state: bool):
+        """Switch a single relay on or off."""
+        self.command(f"relay {'on' if state else 'off'} {relay}\n\r")
+
+    def read_all(self, relays: Iterable[int]) -> Dict[int, bool]:
+        """Read several relays with one 'relay readall' command.
+
+        Falls back to one 'relay read' per relay if the board does not
+        return a bitmask.
+        """
+        relays = list(relays)
+        try:
+            mask = _parse_relay_mask(self.command("relay readall\n\r"))
+        except (TimeoutError, ValueError) as e:
+            logger.warning(f"relay readall failed: {e}")
+            mask = None
+        if mask is None:
+            return {relay: self.read(relay) for relay in relays}
+        return {relay: bool(mask >> relay & 1) for relay in relays}
+
+    def _close(self):
+        if self._port is not None:
+            try:
+                self._port.close()
+            except Exception as e:
+                logger.warning(f"Error closing relay board port: {e}")
+            self._port = None
+
+    def close(self):
+        """Close the serial port."""
+        with self._lock:
+            self._close()
+
+
 class SerialDevice:
-    def __init__(self, id: int, portname: str = "", baudrate: int = 19200):
+    def __init__(
+        self,
+        id: int,
+        portname: str = "",
+        baudrate: int = 19200,
+        bus: Optional[RelayBus] = None,
+    ):
         self.id = id
         self.portname = portname
         self.baudrate = baudrate
+        self.bus = bus or RelayBus(portname, baudrate)
         self._state = None
 
     @property
@@ -503,39 +936,33 @@ class SerialDevice:
 
     @state.setter
     def state(self, desired_state: bool):
-        """Set the device state by sending the appropriate command, then store it."""
-        command_str = "on" if desired_state else "off"
-        command = f"relay {command_str} {self.id}\n\r"
-        self._send_command(command)
+        """Switch the relay, then store the state.
+
+        Raises:
+            SerialException: If the port cannot be opened or written
+            TimeoutError: If the board does not answer the command
+        """
+        self.bus.write(self.id, desired_state)
         self._state = desired_state
 
     def read_state_from_device(self) -> bool:
         """Query the device over serial to read its current state."""
         command = f"relay read {self.id}\n\r"
         response = self._send_command(command)
-
-        # The response might look like:
-        # 'relay read 0 \n\n\ron\n\r>'
-        # or
-        # 'relay read 1 \n\n\roff\n\r>'
-        # We'll parse the response to determine on/off.
-        lines = response.strip().split()
-        if "on" in lines:
-            self._state = True
-        elif "off" in lines:
-            self._state = False
-        else:
-            raise ValueError(f"Unable to parse device state from response: {response}")
+        self._state = _parse_relay_state(response)
         return self._state
 
     def _send_command(self, command: str) -> str:
-        """Send a command to the device and return the raw response."""
+        """Send a command to the device and return the raw response.
+
+        A failed command is only answered with a mock "off" reply when
+        MOCK_DEVICES is set; otherwise the error is raised.
+        """
         try:
-            with Serial(self.portname, self.baudrate, timeout=1) as ser_port:
-                ser_port.write(command.encode("utf-8"))
-                response = ser_port.readall().decode("utf-8", errors="replace")
-            return response
+            return self.bus.command(command)
         except Exception as e:
+            if not cfg.MOCK_DEVICES:
+                raise
             logger.warning(
                 f"Serial port not accessible ([{e}]). Returning mock response for debugging."
             )
@@ -544,20 +971,30 @@ class SerialDevice:
             return f"relay read {device_id} \n\n\roff\n\r>"
 
 
-def read_temperature_sensor(sensor_id):
+def read_temperature_sensor(sensor_id, max_attempts=5, retry_delay=0.2):
+    """Read a DS18B20 sensor in degrees Fahrenheit.
+
+    The kernel driver reports a CRC check with each conversion; the read is
+    repeated up to max_attempts times until the check passes.
+
+    Raises:
+        IOError: If the sensor cannot be read or never passes the CRC check
+    """
     device_file = Path(cfg.sensors.mount_point, sensor_id, "w1_slave")
-    while True:
+    for attempt in range(max_attempts):
         try:
             with open(device_file) as content:
                 lines = content.readlines()
         except IOError as e:
             logger.error("Temp sensor error: {}".format(e))
             raise e
-        else:
-            if lines[0].strip()[-3:] == "YES":
-                break
-            else:
-                time.sleep(0.2)
+        if lines[0].strip()[-3:] == "YES":
+            break
+        if attempt < max_attempts - 1:
+            time.sleep(retry_delay)
+    else:
+        raise IOError(f"CRC check failed for {sensor_id} after {max_attempts} reads")
+
     equals_pos = lines[1].find("t=")
     if equals_pos != -1:
         temp_string = lines[1][equals_pos + 2 :]
@@ -0,0 +1,76 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from chronos.logging import root_logger as logger
+
+
+class BusTimeout(TimeoutError):
+    """Raised when a call on a hardware bus does not finish in time."""
+
+
+class BusExecutor:
+    """
+    Run blocking device calls for one physical bus off the event loop.
+
+    Every bus gets its own single-thread executor, so calls on the same
+    wire are queued in submission order and never overlap, while a slow
+    bus cannot stall the event loop or the other buses.
+
+    Usage:
+        modbus_bus = BusExecutor("modbus", timeout=10)
+        stats = await modbus_bus.run(device.read_boiler_data)
+
+    A call that times out or whose caller is cancelled is dropped if it is
+    still queued. A call already running on the bus thread cannot be
+    interrupted; it finishes in the background and its result is discarded.
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = None, max_workers=1):
+        self.name = name
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"{self.name}-bus"
+            )
+        return self._executor
+
+    async def run(
+        self, func: Callable, *args, timeout: Optional[float] = None, **kwargs
+    ):
+        """Run func(*args, **kwargs) on the bus thread and await its result.
+
+        Args:
+            func (Callable): Blocking callable to run
+            timeout (float): Seconds to wait, defaults to the bus timeout
+
+        Raises:
+            BusTimeout: If the call does not complete within the timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self._get_executor().submit(func, *args, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # The call itself raised TimeoutError
+                raise
+            future.cancel()
+            logger.error(f"{self.name} bus call timed out after {timeout}s")
+            raise BusTimeout(f"{self.name} bus call timed out after {timeout}s")
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def shutdown(self, wait=False):
+        """Stop the bus thread, dropping any queued calls.
+
+        The executor is recreated on the next call to run().
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
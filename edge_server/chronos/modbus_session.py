@@ -0,0 +1,310 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+from chronos.devices import AsyncModbusDevice, ModbusDevice, ModbusException
+from chronos.executor import BusTimeout
+from chronos.logging import root_logger as logger
+
+# Health states reported by ModbusSession.health()
+CONNECTED = "connected"
+DEGRADED = "degraded"
+DISCONNECTED = "disconnected"
+
+
+class ModbusSession:
+    """
+    A long-lived, process-wide Modbus session.
+
+    The serial port is opened once and shared by every caller. Access to the
+    device is serialized with a lock, so concurrent requests never interleave
+    frames on the RS-485 line. A broken connection is re-established on the
+    next borrow, and an optional keepalive thread probes the link while idle.
+
+    Usage:
+        session = ModbusSession(port="/dev/ttyUSB0")
+        with session.connection() as device:
+            device.read_boiler_data()
+    """
+
+    def __init__(
+        self,
+        port="/dev/ttyUSB0",
+        baudrate=9600,
+        parity="E",
+        timeout=1,
+        keepalive_interval=30,
+    ):
+        self.port = port
+        self.baudrate = baudrate
+        self.parity = parity
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+
+        self._lock = threading.RLock()
+        self._device: Optional[ModbusDevice] = None
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self.consecutive_failures = 0
+        self.last_success: Optional[float] = None
+        self.last_failure: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_used = 0.0
+
+    def _ensure_connected(self) -> ModbusDevice:
+        """Return a connected device, opening or reopening the port if needed."""
+        if self._device is None:
+            logger.info(f"Opening Modbus session on {self.port}")
+            self._device = ModbusDevice(
+                port=self.port,
+                baudrate=self.baudrate,
+                parity=self.parity,
+                timeout=self.timeout,
+            )
+        elif not self._device.is_connected():
+            logger.info(f"Reconnecting Modbus session on {self.port}")
+            self._device._connect()
+
+        if not self._device.is_connected():
+            raise ModbusException(f"Failed to connect to Modbus device on {self.port}")
+        return self._device
+
+    def _record_success(self):
+        self.consecutive_failures = 0
+        self.last_success = time.time()
+        self.last_error = None
+
+    def _record_failure(self, error: Exception):
+        self.consecutive_failures += 1
+        self.last_failure = time.time()
+        self.last_error = str(error)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow the shared device for the duration of the block.
+
+        Yields:
+            ModbusDevice: The connected, session-owned device. Callers must not
+            close it.
+
+        Raises:
+            ModbusException: If the port cannot be opened
+        """
+        with self._lock:
+            try:
+                device = self._ensure_connected()
+            except Exception as e:
+                self._record_failure(e)
+                raise
+
+            try:
+                yield device
+            except Exception as e:
+                self._record_failure(e)
+                if not device.is_connected():
+                    # Force a clean reopen on the next borrow
+                    device.close()
+                raise
+            else:
+                self._record_success()
+            finally:
+                self.last_used = time.time()
+
+    def call(self, method: str, *args, **kwargs):
+        """Borrow the device and call one of its methods by name.
+
+        Usage:
+            stats = session.call("read_boiler_data")
+        """
+        with self.connection() as device:
+            return getattr(device, method)(*args, **kwargs)
+
+    def keepalive(self) -> bool:
+        """Probe the link with a single register read if the session is idle.
+
+        Returns:
+            bool: True if the link is healthy (or was recently used), False otherwise
+        """
+        with self._lock:
+            if time.time() - self.last_used < self.keepalive_interval:
+                return True
+            try:
+                with self.connection() as device:
+                    device._read_holding_register(
+                        device.registers.holding.operating_mode, count=1
+                    )
+                return True
+            except Exception as e:
+                logger.warning(f"Modbus keepalive failed: {e}")
+                return False
+
+    def _keepalive_loop(self):
+        while not self._stop_event.wait(self.keepalive_interval):
+            self.keepalive()
+
+    def start_keepalive(self):
+        """Start the background keepalive thread."""
+        if self._keepalive_thread and self._keepalive_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="modbus-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def close(self):
+        """Stop the keepalive thread and close the serial port."""
+        self._stop_event.set()
+        if self._keepalive_thread:
+            self._keepalive_thread.join(timeout=self.timeout + 1)
+            self._keepalive_thread = None
+        with self._lock:
+            if self._device:
+                self._device.close()
+                self._device = None
+
+    def health(self) -> dict:
+        """Return the current health state of the session."""
+        connected = self._device is not None and self._device.is_connected()
+        if not connected:
+            state = DISCONNECTED
+        elif self.consecutive_failures:
+            state = DEGRADED
+        else:
+            state = CONNECTED
+        return {
+            "state": state,
+            "port": self.port,
+            "connected": connected,
+            "consecutive_failures": self.consecutive_failures,
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+            "last_error": self.last_error,
+        }
+
+
+class AsyncModbusSession(ModbusSession):
+    """
+    The asyncio counterpart of ModbusSession, backed by an AsyncModbusDevice.
+
+    Borrowing is serialized with an asyncio.Lock and every call is bounded by
+    call_timeout, so a stalled transaction is cancelled instead of pinning a
+    worker thread. Health reporting is shared with ModbusSession.
+
+    Usage:
+        session = AsyncModbusSession(port="/dev/ttyUSB0", call_timeout=10)
+        stats = await session.call("read_boiler_data")
+    """
+
+    def __init__(self, *args, call_timeout: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.call_timeout = call_timeout
+        self._async_lock = asyncio.Lock()
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    async def _ensure_connected(self) -> AsyncModbusDevice:
+        """Return a connected device, opening or reopening the port if needed."""
+        if self._device is None:
+            logger.info(f"Opening async Modbus session on {self.port}")
+            self._device = AsyncModbusDevice(
+                port=self.port,
+                baudrate=self.baudrate,
+                parity=self.parity,
+                timeout=self.timeout,
+            )
+        if not self._device.is_connected():
+            await self._device._connect()
+
+        if not self._device.is_connected():
+            raise ModbusException(f"Failed to connect to Modbus device on {self.port}")
+        return self._device
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Borrow the shared device for the duration of the block.
+
+        Yields:
+            AsyncModbusDevice: The connected, session-owned device
+
+        Raises:
+            ModbusException: If the port cannot be opened
+        """
+        async with self._async_lock:
+            try:
+                device = await self._ensure_connected()
+            except Exception as e:
+                self._record_failure(e)
+                raise
+
+            try:
+                yield device
+            except Exception as e:
+                self._record_failure(e)
+                if not device.is_connected():
+                    device.close()
+                raise
+            else:
+                self._record_success()
+            finally:
+                self.last_used = time.time()
+
+    async def call(self, method: str, *args, **kwargs):
+        """Borrow the device and await one of its methods by name.
+
+        Raises:
+            BusTimeout: If the call does not complete within call_timeout
+        """
+        deadline = asyncio.timeout(self.call_timeout)
+        try:
+            async with deadline:
+                async with self.connection() as device:
+                    return await getattr(device, method)(*args, **kwargs)
+        except TimeoutError as e:
+            if not deadline.expired():
+                # The device call itself raised TimeoutError
+                raise
+            self._record_failure(e)
+            logger.error(f"modbus bus call timed out after {self.call_timeout}s")
+            raise BusTimeout(
+                f"modbus bus call timed out after {self.call_timeout}s"
+            ) from e
+
+    async def keepalive(self) -> bool:
+        """Probe the link with a single register read if the session is idle."""
+        if time.time() - self.last_used < self.keepalive_interval:
+            return True
+        try:
+            async with self.connection() as device:
+                await device._read_holding_register(
+                    device.registers.holding.operating_mode, count=1
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Modbus keepalive failed: {e}")
+            return False
+
+    async def _keepalive_loop(self):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            await self.keepalive()
+
+    def start_keepalive(self):
+        """Start the keepalive task on the running event loop."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.get_running_loop().create_task(
+                self._keepalive_loop()
+            )
+
+    def close(self):
+        """Stop the keepalive task and close the serial port."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        if self._device:
+            self._device.close()
+            self._device = None
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Union
+
+from chronos.executor import BusExecutor
+from chronos.logging import root_logger as logger
+from chronos.modbus_session import AsyncModbusSession, ModbusSession
+
+
+@dataclass(frozen=True)
+class BoilerSnapshot:
+    """An immutable, timestamped copy of the boiler registers."""
+
+    timestamp: float
+    data: Mapping
+
+    @property
+    def age(self) -> float:
+        """Seconds since the registers were read."""
+        return time.time() - self.timestamp
+
+
+class BoilerPoller:
+    """
+    Poll the boiler in the background and keep the latest snapshot in memory.
+
+    Each tick performs one read_boiler_data() call, i.e. one holding block
+    (7 registers) and one input block (9 registers) transaction. Readers get
+    the published snapshot without touching the serial line unless it is
+    older than the age they are willing to accept.
+
+    Usage:
+        poller = BoilerPoller(session, interval=5, max_age=15, executor=modbus_bus)
+        poller.start()  # from within the running event loop
+        snapshot = await poller.get(max_age=0)  # force a fresh read
+    """
+
+    def __init__(
+        self,
+        session: Union[ModbusSession, AsyncModbusSession],
+        interval: float = 5.0,
+        max_age: float = 15.0,
+        executor: Optional[BusExecutor] = None,
+    ):
+        self.session = session
+        self.executor = executor
+        self.interval = interval
+        self.max_age = max_age
+        self._snapshot: Optional[BoilerSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_lock = asyncio.Lock()
+        self._listeners: List[Callable[[BoilerSnapshot], None]] = []
+
+    @property
+    def snapshot(self) -> Optional[BoilerSnapshot]:
+        """The most recently published snapshot, regardless of age."""
+        return self._snapshot
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[BoilerSnapshot]:
+        """Return the snapshot if it is no older than max_age seconds, else None."""
+        max_age = self.max_age if max_age is None else max_age
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+        return None
+
+    def _read(self) -> Optional[dict]:
+        return self.session.call("read_boiler_data")
+
+    async def refresh(
+        self, max_age: Optional[float] = None
+    ) -> Optional[BoilerSnapshot]:
+        """Read the boiler and publish a new snapshot.
+
+        Concurrent callers are coalesced: a caller that waited for another
+        refresh reuses its result if it satisfies max_age.
+
+        Returns:
+            BoilerSnapshot: The published snapshot, or None if the read failed
+        """
+        async with self._refresh_lock:
+            if max_age is not None:
+                snapshot = self.latest(max_age)
+                if snapshot is not None:
+                    return snapshot
+
+            if asyncio.iscoroutinefunction(self.session.call):
+                data = await self.session.call("read_boiler_data")
+            elif self.executor is not None:
+                data = await self.executor.run(self._read)
+            else:
+                data = await asyncio.to_thread(self._read)
+            if not data:
+                return None
+
+            snapshot = BoilerSnapshot(
+                timestamp=time.time(), data=MappingProxyType(dict(data))
+            )
+            self._snapshot = snapshot
+            for listener in self._listeners:
+                try:
+                    listener(snapshot)
+                except Exception as e:
+                    logger.error(f"Boiler snapshot listener failed: {e}")
+            return snapshot
+
+    def subscribe(self, listener: Callable[[BoilerSnapshot], None]):
+        """Call listener with every newly published snapshot."""
+        self._listeners.append(listener)
+
+    async def get(self, max_age: Optional[float] = None) -> Optional[BoilerSnapshot]:
+        """Return a snapshot no older than max_age seconds, reading if needed."""
+        max_age = self.max_age if max_age is None else max_age
+        return self.latest(max_age) or await self.refresh(max_age)
+
+    async def _run(self):
+        while True:
+            try:
+                if await self.refresh() is None:
+                    logger.warning("Boiler poll returned no data")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Boiler poll failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start polling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop polling and wait for the task to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self):
+        """Drop the published snapshot."""
+        self._snapshot = None
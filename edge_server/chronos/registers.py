@@ -0,0 +1,254 @@
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from chronos.boiler_modbus import MODBUS
+
+# Register kinds, in the order their blocks are read
+HOLDING = "holding"
+INPUT = "input"
+
+# Largest number of registers fetched in one transaction (Modbus allows 125)
+DEFAULT_MAX_SPAN = MODBUS["modbus"]["max_read_span"]
+
+
+def c_to_f(celsius):
+    """Convert Celsius to Fahrenheit.
+
+    This matches the C implementation exactly:
+    return ((9.0f/5.0f)*c + 32.0f);
+    """
+    return (9.0 / 5.0) * celsius + 32.0
+
+
+@dataclass(frozen=True)
+class Register:
+    """A single boiler register and how to turn its raw value into a reading.
+
+    The device stores values in fixed point, raw = value * scale.
+
+    Types:
+        int: raw value divided by scale, as an integer
+        float: raw value divided by scale
+        bool: non-zero raw value
+        temperature: fixed point Celsius converted to Fahrenheit
+    """
+
+    name: str
+    address: int
+    kind: str
+    type: str = "int"
+    scale: float = 1
+    unit: Optional[str] = None
+
+    def decode(self, raw: int):
+        if self.type == "bool":
+            return bool(raw)
+        if self.type == "temperature":
+            return round(c_to_f(raw / self.scale), 1)
+        if self.type == "float":
+            return float(raw / self.scale)
+        return int(raw / self.scale)
+
+    def encode(self, value) -> int:
+        """Convert a reading back to the raw register value."""
+        if self.type == "temperature":
+            return int((value - 32.0) * 5.0 / 9.0 * self.scale)
+        return int(value * self.scale)
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """One contiguous read transaction covering one or more registers."""
+
+    kind: str
+    address: int
+    count: int
+    registers: Tuple[Register, ...]
+
+    def decode(self, values: Sequence[int]) -> dict:
+        """Map the raw block values to {register name: reading}."""
+        return {
+            register.name: register.decode(values[register.address - self.address])
+            for register in self.registers
+        }
+
+
+class RegisterMap:
+    """
+    A named collection of registers with a read planner.
+
+    Usage:
+        for block in BOILER_REGISTERS.plan(["outlet_temp", "fan_speed"]):
+            raw = client.read_input_registers(address=block.address, count=block.count)
+            values.update(block.decode(raw.registers))
+    """
+
+    def __init__(self, registers: Iterable[Register]):
+        self._registers: Dict[str, Register] = {}
+        for register in registers:
+            if register.name in self._registers:
+                raise ValueError(f"Duplicate register name {register.name}")
+            self._registers[register.name] = register
+
+    def __getitem__(self, name: str) -> Register:
+        return self._registers[name]
+
+    def __iter__(self):
+        return iter(self._registers.values())
+
+    def addresses(self) -> SimpleNamespace:
+        """Return the register addresses as attributes grouped by kind."""
+        return SimpleNamespace(
+            **{
+                kind: SimpleNamespace(
+                    **{r.name: r.address for r in self if r.kind == kind}
+                )
+                for kind in (HOLDING, INPUT)
+            }
+        )
+
+    def plan(
+        self, names: Iterable[str], max_span: Optional[int] = None
+    ) -> List[ReadBlock]:
+        """Plan the fewest contiguous reads that cover the named registers.
+
+        Registers of the same kind are merged into one block as long as the
+        block stays within max_span registers; unrequested registers in the
+        gaps are read and ignored.
+
+        Raises:
+            KeyError: If a name is not in the map
+            ValueError: If max_span is less than 1
+        """
+        max_span = DEFAULT_MAX_SPAN if max_span is None else max_span
+        if max_span < 1:
+            raise ValueError("max_span must be at least 1")
+
+        blocks = []
+        for kind in (HOLDING, INPUT):
+            registers = sorted(
+                {self[name] for name in names if self[name].kind == kind},
+                key=lambda r: r.address,
+            )
+            current: List[Register] = []
+            for register in registers:
+                if current and register.address - current[0].address >= max_span:
+                    blocks.append(_block(kind, current))
+                    current = []
+                current.append(register)
+            if current:
+                blocks.append(_block(kind, current))
+        return blocks
+
+    def write_runs(self, readings: Mapping[str, float]) -> List[Tuple[int, List[int]]]:
+        """Encode {register name: reading} into runs of consecutive registers.
+
+        Each run can be written with a single write_registers (FC16) request.
+
+        Returns:
+            list: (start address, raw values) per run, in address order
+        Raises:
+            ValueError: If a named register is not a holding register
+        """
+        registers = sorted((self[name] for name in readings), key=lambda r: r.address)
+        runs: List[Tuple[int, List[int]]] = []
+        for register in registers:
+            if register.kind != HOLDING:
+                raise ValueError(f"Register {register.name} is not writable")
+            raw = register.encode(readings[register.name])
+            if runs and runs[-1][0] + len(runs[-1][1]) == register.address:
+                runs[-1][1].append(raw)
+            else:
+                runs.append((register.address, [raw]))
+        return runs
+
+
+def _block(kind: str, registers: List[Register]) -> ReadBlock:
+    start = registers[0].address
+    return ReadBlock(
+        kind=kind,
+        address=start,
+        count=registers[-1].address - start + 1,
+        registers=tuple(registers),
+    )
+
+
+_holding = MODBUS["modbus"]["registers"]["holding"]
+_input = MODBUS["modbus"]["registers"]["input"]
+
+BOILER_REGISTERS = RegisterMap(
+    [
+        Register("operating_mode", _holding["operating_mode"], HOLDING),
+        Register("cascade_mode", _holding["cascade_mode"], HOLDING),
+        Register(
+            "current_setpoint", _holding["setpoint"], HOLDING, "temperature", 10, "°F"
+        ),
+        Register(
+            "min_setpoint", _holding["min_setpoint"], HOLDING, "temperature", 10, "°F"
+        ),
+        Register(
+            "max_setpoint", _holding["max_setpoint"], HOLDING, "temperature", 10, "°F"
+        ),
+        Register(
+            "system_supply_temp",
+            _holding["supply_temp"],
+            HOLDING,
+            "temperature",
+            10,
+            "°F",
+        ),
+        Register("dhw_temp", _holding["dhw_temp"], HOLDING, "temperature", 10, "°F"),
+        Register("last_lockout", _holding["last_lockout"], HOLDING),
+        Register("last_blockout", _holding["last_blockout"], HOLDING),
+        Register(
+            "min_modulation", _holding["min_modulation"], HOLDING, "float", unit="%"
+        ),
+        Register(
+            "max_modulation", _holding["max_modulation"], HOLDING, "float", unit="%"
+        ),
+        Register("model_id", _holding["model_id"], HOLDING),
+        Register("firmware_ver", _holding["firmware_ver"], HOLDING),
+        Register("hardware_ver", _holding["hardware_ver"], HOLDING),
+        Register("alarm_status", _input["alarm"], INPUT, "bool"),
+        Register("pump_status", _input["pump"], INPUT, "bool"),
+        Register("flame_status", _input["flame"], INPUT, "bool"),
+        Register(
+            "cascade_current_power", _input["cascade_power"], INPUT, "float", unit="%"
+        ),
+        Register("water_flow", _input["water_flow"], INPUT),
+        Register("outlet_temp", _input["outlet_temp"], INPUT, "temperature", 10, "°F"),
+        Register("inlet_temp", _input["inlet_temp"], INPUT, "temperature", 10, "°F"),
+        Register("flue_temp", _input["flue_temp"], INPUT, "temperature", 10, "°F"),
+        Register("lead_firing_rate", _input["firing_rate"], INPUT, "float", unit="%"),
+        Register("runtime", _input["runtime"], INPUT, unit="h"),
+        Register("ignition_count", _input["ignition_count"], INPUT),
+        Register("fault_count", _input["fault_count"], INPUT),
+        Register("fan_speed", _input["fan_speed"], INPUT, unit="rpm"),
+        Register("fan_setpoint", _input["fan_setpoint"], INPUT, unit="rpm"),
+    ]
+)
+
+# Registers returned by read_boiler_data (one holding and one input block)
+BOILER_STATS = (
+    "operating_mode",
+    "cascade_mode",
+    "current_setpoint",
+    "min_setpoint",
+    "max_setpoint",
+    "system_supply_temp",
+    "alarm_status",
+    "pump_status",
+    "flame_status",
+    "cascade_current_power",
+    "outlet_temp",
+    "inlet_temp",
+    "flue_temp",
+    "lead_firing_rate",
+)
+
+# Soft temperature limits, adjacent holding registers read and written together
+TEMPERATURE_LIMITS = ("min_setpoint", "max_setpoint")
+
+# Registers returned by read_operating_status
+OPERATING_STATUS = ("operating_mode", "cascade_mode", "current_setpoint")
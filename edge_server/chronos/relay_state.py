@@ -0,0 +1,202 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from chronos.executor import BusExecutor
+from chronos.logging import root_logger as logger
+
+
+@dataclass(frozen=True)
+class RelayReading:
+    """The state of one relay and when it was last confirmed."""
+
+    state: bool
+    timestamp: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the state was read from or written to the board."""
+        return time.time() - self.timestamp
+
+
+@dataclass(frozen=True)
+class DriftEvent:
+    """A relay found in a different state than the cache believed."""
+
+    relay: int
+    expected: bool
+    actual: bool
+    timestamp: float
+
+
+class RelayStateCache:
+    """
+    Serve relay states from memory and reconcile them with the board.
+
+    Readings younger than ttl are served without touching the serial line.
+    Writes update the cache as soon as the board accepts them, and a
+    background task re-reads every relay each reconcile_interval seconds.
+    A relay whose hardware state differs from the cache (e.g. switched by
+    hand, or the board reset) produces a DriftEvent.
+
+    Usage:
+        cache = RelayStateCache(read_all, ttl=30, executor=relay_bus)
+        cache.start()  # from within the running event loop
+        readings = await cache.get_all()
+        cache.subscribe(lambda event: ...)
+    """
+
+    def __init__(
+        self,
+        read_all: Callable[[], Dict[int, bool]],
+        ttl: float = 30.0,
+        reconcile_interval: float = 60.0,
+        executor: Optional[BusExecutor] = None,
+        max_events: int = 100,
+    ):
+        self.read_all = read_all
+        self.ttl = ttl
+        self.reconcile_interval = reconcile_interval
+        self.executor = executor
+        self._readings: Dict[int, RelayReading] = {}
+        self._listeners: List[Callable[[DriftEvent], None]] = []
+        self.events: deque = deque(maxlen=max_events)
+        self._task: Optional[asyncio.Task] = None
+        self._refresh: Optional[asyncio.Task] = None
+        self._invalidated = 0.0
+
+    @property
+    def readings(self) -> Dict[int, RelayReading]:
+        """The cached readings, regardless of age."""
+        return dict(self._readings)
+
+    def is_stale(self, reading: RelayReading) -> bool:
+        return reading.age > self.ttl
+
+    def record(self, relay: int, state: bool):
+        """Write-through: store a state the board has just accepted."""
+        self._readings[relay] = RelayReading(state=state, timestamp=time.time())
+
+    def invalidate(self, *relays: int):
+        """Drop the readings of relays (all if none are given).
+
+        For writes whose new state is not known here. A refresh already in
+        flight is not stored, since it may have read the board before the
+        write; the next read goes to the board.
+        """
+        for relay in relays or list(self._readings):
+            self._readings.pop(relay, None)
+        self._invalidated = time.time()
+        self._refresh = None
+
+    def subscribe(self, listener: Callable[[DriftEvent], None]):
+        """Call listener with every DriftEvent."""
+        self._listeners.append(listener)
+
+    def _emit(self, event: DriftEvent):
+        logger.warning(
+            f"Relay {event.relay} drifted: expected "
+            f"{'on' if event.expected else 'off'}, found "
+            f"{'on' if event.actual else 'off'}"
+        )
+        self.events.append(event)
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Relay drift listener failed: {e}")
+
+    async def _read_and_record(self) -> Dict[int, RelayReading]:
+        started = time.time()
+        try:
+            if self.executor is not None:
+                states = await self.executor.run(self.read_all)
+            else:
+                states = await asyncio.to_thread(self.read_all)
+        finally:
+            if self._refresh is asyncio.current_task():
+                self._refresh = None
+        if started < self._invalidated:
+            # The board was written while this read was in flight
+            return {
+                relay: RelayReading(state=state, timestamp=started)
+                for relay, state in states.items()
+            }
+
+        now = time.time()
+        for relay, state in states.items():
+            previous = self._readings.get(relay)
+            if previous is not None and previous.timestamp > started:
+                continue
+            if previous is not None and previous.state != state:
+                self._emit(DriftEvent(relay, previous.state, state, now))
+            self._readings[relay] = RelayReading(state=state, timestamp=now)
+        return self.readings
+
+    async def refresh(self) -> Dict[int, RelayReading]:
+        """Re-read every relay from the board and record any drift.
+
+        Concurrent callers share one board read and its result. A relay
+        written while the read was in flight keeps its newer, written state.
+        """
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._read_and_record())
+        return await asyncio.shield(self._refresh)
+
+    async def get_all(self) -> Dict[int, RelayReading]:
+        """Return every relay reading, refreshing if any is older than ttl.
+
+        If the refresh fails the cached readings are returned as they are;
+        callers can tell with is_stale(). Without any cached readings the
+        error is raised.
+        """
+        readings = self._readings
+        if readings and not any(self.is_stale(r) for r in readings.values()):
+            return self.readings
+        try:
+            return await self.refresh()
+        except Exception as e:
+            if not self._readings:
+                raise
+            logger.error(f"Relay refresh failed, serving cached states: {e}")
+            return self.readings
+
+    async def get(self, relay: int) -> RelayReading:
+        """Return the reading for one relay, refreshing if it is older than ttl."""
+        reading = self._readings.get(relay)
+        if reading is not None and not self.is_stale(reading):
+            return reading
+        return (await self.get_all())[relay]
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Relay reconciliation failed: {e}")
+
+    def start(self):
+        """Start reconciling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop reconciling and wait for the task to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self):
+        """Drop all cached readings and events."""
+        self._readings.clear()
+        self.events.clear()
+        self._refresh = None
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Mapping, Optional
+
+from chronos.devices import read_temperature_sensor
+from chronos.executor import BusExecutor
+from chronos.logging import root_logger as logger
+
+
+@dataclass(frozen=True)
+class SensorReading:
+    """The last good value of a sensor and the outcome of its latest sample."""
+
+    value: Optional[float]
+    timestamp: Optional[float]
+    error: Optional[str] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the value was read, or None if it never was."""
+        return None if self.timestamp is None else time.time() - self.timestamp
+
+
+class SensorSampler:
+    """
+    Sample every DS18B20 sensor concurrently in the background.
+
+    Each sensor is read on its own worker thread and bounded by the
+    executor timeout, so one slow or failing sensor neither delays the
+    others nor the request path. A failed sample keeps the last good value
+    and records the error; values() serves that value for up to max_age
+    seconds, then None. Readers use the in-memory snapshot.
+
+    Usage:
+        sampler = SensorSampler({"return_temp": "28-00000677d509"}, executor=bus)
+        sampler.start()  # from within the running event loop
+        temps = await sampler.values()
+    """
+
+    def __init__(
+        self,
+        sensors: Mapping[str, str],
+        interval: float = 5.0,
+        max_attempts: int = 5,
+        max_age: float = 20.0,
+        executor: Optional[BusExecutor] = None,
+        read: Callable[..., Optional[float]] = read_temperature_sensor,
+    ):
+        self.sensors = dict(sensors)
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.max_age = max_age
+        self.executor = executor
+        self.read = read
+        self._readings: Dict[str, SensorReading] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[float, Dict[str, Optional[float]]], None]] = []
+
+    def snapshot(self) -> Dict[str, SensorReading]:
+        """The latest reading of every sampled sensor."""
+        return dict(self._readings)
+
+    async def _sample_one(self, name: str, sensor_id: str) -> SensorReading:
+        read = partial(self.read, sensor_id, max_attempts=self.max_attempts)
+        try:
+            if self.executor is not None:
+                value = await self.executor.run(read)
+            else:
+                value = await asyncio.to_thread(read)
+            if value is None:
+                raise ValueError("no temperature in sensor output")
+            reading = SensorReading(value=value, timestamp=time.time())
+        except Exception as e:
+            logger.error(f"Error reading temperature sensor {sensor_id}: {e}")
+            previous = self._readings.get(name)
+            reading = SensorReading(
+                value=previous.value if previous else None,
+                timestamp=previous.timestamp if previous else None,
+                error=str(e) or type(e).__name__,
+            )
+        self._readings[name] = reading
+        return reading
+
+    def subscribe(self, listener: Callable[[float, Dict[str, Optional[float]]], None]):
+        """Call listener(timestamp, values) after every sample.
+
+        Sensors whose sample failed are passed as None, not as the last good
+        value.
+        """
+        self._listeners.append(listener)
+
+    async def sample(self) -> Dict[str, SensorReading]:
+        """Read all sensors concurrently and publish the results."""
+        readings = await asyncio.gather(
+            *(self._sample_one(name, sid) for name, sid in self.sensors.items())
+        )
+        values = {
+            name: None if reading.error else reading.value
+            for name, reading in zip(self.sensors, readings)
+        }
+        timestamp = time.time()
+        for listener in self._listeners:
+            try:
+                listener(timestamp, values)
+            except Exception as e:
+                logger.error(f"Sensor sample listener failed: {e}")
+        return self.snapshot()
+
+    def _current_value(self, reading: SensorReading) -> Optional[float]:
+        age = reading.age
+        if age is None or age > self.max_age:
+            return None
+        return reading.value
+
+    async def values(self) -> Dict[str, Optional[float]]:
+        """Return the last good value of every sensor.
+
+        A value older than max_age is returned as None. Only the very first
+        call, before any sample exists, waits for the sensors.
+        """
+        readings = self._readings or await self.sample()
+        return {
+            name: self._current_value(reading) for name, reading in readings.items()
+        }
+
+    async def _run(self):
+        while True:
+            await self.sample()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start sampling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop sampling and wait for the task to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self):
+        """Drop all readings."""
+        self._readings.clear()
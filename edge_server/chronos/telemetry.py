@@ -0,0 +1,112 @@
+import bisect
+import math
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence
+
+
+class RingBuffer:
+    """
+    A fixed-size, column-oriented buffer of timestamped samples.
+
+    Every column is a preallocated array of doubles, so appending never
+    allocates and memory stays at capacity * (columns + 1) * 8 bytes. Once
+    full, the oldest sample is overwritten. Booleans are stored as 0.0/1.0
+    and missing values as NaN.
+
+    The buffer is not thread-safe; append and read from the event loop.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self._timestamps = array("d", [math.nan]) * capacity
+        self._data = {name: array("d", [math.nan]) * capacity for name in columns}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp: float, values: Mapping):
+        """Store one sample; values for unknown columns are ignored."""
+        slot = self._count % self.capacity
+        self._timestamps[slot] = timestamp
+        for name, column in self._data.items():
+            value = values.get(name)
+            column[slot] = math.nan if value is None else float(value)
+        self._count += 1
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest retained sample) to an array slot."""
+        return (self._count - len(self) + index) % self.capacity
+
+    def since(self, since: Optional[float] = None, limit: Optional[int] = None):
+        """Return samples newer than since, oldest first, in columnar form.
+
+        Args:
+            since (float): Unix time; only samples after it are returned
+            limit (int): Return at most this many of the newest matching samples
+
+        Returns:
+            dict: {"timestamp": [...], "columns": {name: [...]}} with NaN as None
+        """
+        size = len(self)
+        start = 0
+        if since is not None:
+            start = bisect.bisect_right(
+                range(size), since, key=lambda i: self._timestamps[self._slot(i)]
+            )
+        if limit is not None:
+            start = max(start, size - limit)
+
+        slots = [self._slot(i) for i in range(start, size)]
+        return {
+            "timestamp": [self._timestamps[slot] for slot in slots],
+            "columns": {
+                name: [_none_if_nan(column[slot]) for slot in slots]
+                for name, column in self._data.items()
+            },
+        }
+
+
+def _none_if_nan(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class Telemetry:
+    """
+    High-frequency history of every polled sample, one ring buffer per source.
+
+    Usage:
+        telemetry = Telemetry({"boiler": BOILER_STATS}, capacity=17280)
+        telemetry.record("boiler", snapshot.timestamp, snapshot.data)
+        telemetry.since(time.time() - 60)
+    """
+
+    def __init__(self, sources: Mapping[str, Sequence[str]], capacity: int):
+        self.buffers: Dict[str, RingBuffer] = {
+            source: RingBuffer(columns, capacity) for source, columns in sources.items()
+        }
+
+    def record(self, source: str, timestamp: float, values: Mapping):
+        self.buffers[source].append(timestamp, values)
+
+    def since(
+        self,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+        sources: Optional[List[str]] = None,
+    ) -> dict:
+        """Return the samples of each source newer than since.
+
+        Raises:
+            KeyError: If an unknown source is requested
+        """
+        names = sources if sources is not None else list(self.buffers)
+        return {name: self.buffers[name].since(since, limit) for name in names}
+
+    def reset(self):
+        """Drop all samples."""
+        for source, buffer in self.buffers.items():
+            self.buffers[source] = RingBuffer(buffer.columns, buffer.capacity)
@@ -4,7 +4,15 @@ import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
-from chronos.app import app, circuit_breaker, rate_limiter
+from chronos.app import (
+    app,
+    boiler_poller,
+    circuit_breaker,
+    rate_limiter,
+    relay_states,
+    sensor_sampler,
+    telemetry,
+)
 from chronos.config import cfg
 from chronos.devices import ModbusDevice, SerialDevice
 from fastapi.testclient import TestClient
@@ -33,6 +41,17 @@ def reset_limiters():
     circuit_breaker.last_failure_time = 0
 
 
+# Drop any boiler snapshot published by a previous test
+@pytest.fixture(autouse=True)
+def reset_cached_state():
+    """Reset the boiler, relay, sensor and telemetry caches between tests."""
+    for cache in (boiler_poller, relay_states, sensor_sampler, telemetry):
+        cache.reset()
+    yield
+    for cache in (boiler_poller, relay_states, sensor_sampler, telemetry):
+        cache.reset()
+
+
 # State verification fixture
 @pytest.fixture(autouse=True)
 def verify_boiler_state():
@@ -145,6 +164,13 @@ def mock_modbus_device(monkeypatch):
     mock_device.client = mock_client
 
     mock_device.read_boiler_data.return_value = {
+        "operating_mode": 3,
+        "operating_mode_str": "Central Heat",
+        "cascade_mode": 0,
+        "cascade_mode_str": "Single Boiler",
+        "current_setpoint": 90.0,
+        "min_setpoint": 75.0,
+        "max_setpoint": 105.0,
         "system_supply_temp": 154.4,
         "outlet_temp": 158.0,
         "inlet_temp": 149.0,
@@ -173,8 +199,8 @@ def mock_modbus_device(monkeypatch):
     mock_context.__enter__ = lambda _: mock_device
     mock_context.__exit__ = lambda *args: None
 
-    # Patch the create_modbus_connection function to return our mock context
-    monkeypatch.setattr("chronos.app.create_modbus_connection", lambda: mock_context)
+    # Patch the shared session so borrowing returns our mock context
+    monkeypatch.setattr("chronos.app.modbus_session.connection", lambda: mock_context)
     return mock_device
 
 
@@ -187,9 +213,14 @@ def mock_serial_devices(monkeypatch):
         device = MagicMock()
         device.id = i
         device.state = True
+        device.read_state_from_device.return_value = True
         mock_devices.append(device)
 
+    # The relay cache reads the board through the shared port
+    relay_port = MagicMock()
+    relay_port.read_all.side_effect = lambda relays: {relay: True for relay in relays}
     monkeypatch.setattr("chronos.app.DEVICES", mock_devices)
+    monkeypatch.setattr("chronos.app.relay_port", relay_port)
     return mock_devices
 
 
@@ -207,7 +238,7 @@ def mock_temperature_sensor(monkeypatch):
     def mock_read_temp(*args, **kwargs):
         return 75.0
 
-    monkeypatch.setattr("chronos.app.safe_read_temperature", mock_read_temp)
+    monkeypatch.setattr("chronos.app.sensor_sampler.read", mock_read_temp)
 
 
 # Log file fixture
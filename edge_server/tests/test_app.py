@@ -306,7 +306,7 @@ def test_set_boiler_setpoint_failure(client, mock_modbus_device, monkeypatch):
     mock_modbus_device.set_boiler_setpoint.return_value = False
 
     monkeypatch.setattr(cfg, "MOCK_DEVICES", False)
-    monkeypatch.setattr("chronos.app.create_modbus_connection", lambda: mock_context)
+    monkeypatch.setattr("chronos.app.modbus_session.connection", lambda: mock_context)
 
     response = client.post("/boiler_set_setpoint", json={"temperature": 90.0})
     assert response.status_code == 500
@@ -558,7 +558,7 @@ def test_set_temperature_limits_failure(client, mock_modbus_device, monkeypatch)
     mock_modbus_device.client.is_socket_open.return_value = True
     mock_modbus_device.set_temperature_limits.return_value = False
 
-    monkeypatch.setattr("chronos.app.create_modbus_connection", lambda: mock_context)
+    monkeypatch.setattr("chronos.app.modbus_session.connection", lambda: mock_context)
 
     response = client.post(
         "/temperature_limits", json={"min_setpoint": 75.0, "max_setpoint": 105.0}
@@ -592,7 +592,7 @@ def test_set_temperature_limits_connection_error(
     )
 
     monkeypatch.setattr(cfg, "MOCK_DEVICES", False)
-    monkeypatch.setattr("chronos.app.create_modbus_connection", lambda: mock_context)
+    monkeypatch.setattr("chronos.app.modbus_session.connection", lambda: mock_context)
 
     response = client.post(
         "/temperature_limits", json={"min_setpoint": 75.0, "max_setpoint": 105.0}
@@ -641,3 +641,48 @@ def test_set_temperature_limits_read_only(client, mock_modbus_device):
     finally:
         # Reset read-only mode to its original state
         cfg.READ_ONLY_MODE = False
+
+
+def test_get_snapshot(
+    client, mock_modbus_device, mock_serial_devices, mock_temperature_sensor
+):
+    """The snapshot carries every section, each with its own timestamp."""
+    response = client.get("/snapshot")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["sensors"]["data"] == {"return_temp": 75.0, "water_out_temp": 75.0}
+    assert [d["state"] for d in data["devices"]["data"]] == [True] * 5
+    assert data["boiler_stats"]["data"]["outlet_temp"] == 158.0
+    assert data["boiler_status"]["data"]["operating_mode_str"] == "Central Heat"
+    assert data["temperature_limits"]["data"]["soft_limits"] == {
+        "min_setpoint": 75.0,
+        "max_setpoint": 105.0,
+    }
+    for section in ("sensors", "devices", "boiler_stats", "temperature_limits"):
+        assert data[section]["error"] is None
+        assert data[section]["timestamp"] <= data["timestamp"]
+    assert data["boiler_stats"]["timestamp"] == data["boiler_status"]["timestamp"]
+    assert data["temperature_limits"]["timestamp"] == data["boiler_stats"]["timestamp"]
+    mock_modbus_device.read_boiler_data.assert_called_once()
+    # The limits come from the poller snapshot, not a separate Modbus read
+    mock_modbus_device.get_temperature_limits.assert_not_called()
+
+
+def test_get_snapshot_reports_failed_sections(
+    client, mock_modbus_device, mock_serial_devices, mock_temperature_sensor
+):
+    """A failing boiler read leaves the other sections intact."""
+    mock_modbus_device.read_boiler_data.side_effect = ModbusException(
+        "Connection failed"
+    )
+
+    response = client.get("/snapshot")
+    assert response.status_code == 200
+    data = response.json()
+
+    for section in ("boiler_stats", "boiler_status", "temperature_limits"):
+        assert data[section]["data"] is None
+        assert "Connection failed" in data[section]["error"]
+    assert data["sensors"]["error"] is None
+    assert data["sensors"]["data"]["return_temp"] == 75.0
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from chronos.devices import AsyncModbusDevice, ModbusException
+from chronos.executor import BusTimeout
+from chronos.modbus_session import CONNECTED, AsyncModbusSession
+
+HOLDING = [3, 0, 322, 200, 400, 0, 680]
+INPUT = [0, 1, 1, 50, 0, 700, 650, 800, 75]
+
+
+def response(registers=None, error=False):
+    return MagicMock(isError=lambda: error, registers=registers)
+
+
+@pytest.fixture
+def mock_async_client():
+    """Fixture to provide a mocked AsyncModbusSerialClient."""
+    with patch("chronos.devices.AsyncModbusSerialClient") as mock_class:
+        mock_instance = MagicMock()
+        mock_instance.connect = AsyncMock(return_value=True)
+        mock_instance.connected = True
+        mock_instance.read_holding_registers = AsyncMock(return_value=response(HOLDING))
+        mock_instance.read_input_registers = AsyncMock(return_value=response(INPUT))
+        mock_instance.write_register = AsyncMock(return_value=response())
+        mock_class.return_value = mock_instance
+        yield mock_class
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry back-offs instead of waiting for them."""
+    calls = []
+
+    async def fake_sleep(delay):
+        calls.append(delay)
+
+    monkeypatch.setattr("chronos.devices.asyncio.sleep", fake_sleep)
+    return calls
+
+
+def test_read_boiler_data_matches_sync_decoding(mock_async_client, device):
+    client = mock_async_client.return_value
+    device.client.read_holding_registers.return_value = response(HOLDING)
+    device.client.read_input_registers.return_value = response(INPUT)
+
+    async_device = AsyncModbusDevice()
+    data = asyncio.run(async_device.read_boiler_data())
+
+    assert data == device.read_boiler_data()
+    client.read_holding_registers.assert_awaited_once_with(address=0, count=7)
+    client.read_input_registers.assert_awaited_once_with(address=3, count=9)
+
+
+def test_read_boiler_data_retries_with_asyncio_sleep(mock_async_client, sleeps):
+    client = mock_async_client.return_value
+    client.read_holding_registers.side_effect = [
+        response(error=True),
+        response(HOLDING),
+    ]
+
+    data = asyncio.run(AsyncModbusDevice().read_boiler_data())
+
+    assert data["operating_mode"] == 3
+    assert sleeps == [1]
+
+
+def test_read_boiler_data_gives_up(mock_async_client, sleeps):
+    client = mock_async_client.return_value
+    client.read_holding_registers.return_value = response(error=True)
+
+    assert asyncio.run(AsyncModbusDevice().read_boiler_data()) is None
+    assert client.read_holding_registers.await_count == 3
+    assert sleeps == [1, 1]
+
+
+def test_read_boiler_data_requires_connection(mock_async_client):
+    mock_async_client.return_value.connected = False
+    with pytest.raises(ModbusException, match="Device not connected"):
+        asyncio.run(AsyncModbusDevice().read_boiler_data())
+
+
+def test_set_boiler_setpoint(mock_async_client):
+    client = mock_async_client.return_value
+    client.read_holding_registers.return_value = response([54])
+    assert asyncio.run(AsyncModbusDevice().set_boiler_setpoint(90.0)) is True
+    assert client.write_register.await_count == 2
+    assert client.write_register.await_args_list[1].args == (2, 54)
+    client.read_holding_registers.assert_awaited_once_with(address=2, count=1)
+
+
+def test_set_boiler_setpoint_read_back_mismatch(mock_async_client):
+    client = mock_async_client.return_value
+    client.read_holding_registers.return_value = response([40])
+    with pytest.raises(ModbusException, match="wrote 54%, read 40"):
+        asyncio.run(AsyncModbusDevice().set_boiler_setpoint(90.0))
+
+
+def test_set_boiler_setpoint_rejects_out_of_range(mock_async_client):
+    client = mock_async_client.return_value
+    assert asyncio.run(AsyncModbusDevice().set_boiler_setpoint(150.0)) is False
+    client.write_register.assert_not_awaited()
+
+
+def test_temperature_limits(mock_async_client):
+    client = mock_async_client.return_value
+    client.read_holding_registers.return_value = response([200, 400])
+    client.write_registers = AsyncMock(return_value=response())
+    device = AsyncModbusDevice()
+
+    limits = asyncio.run(device.get_temperature_limits())
+    assert limits == {"min_setpoint": 68.0, "max_setpoint": 104.0}
+    client.read_holding_registers.assert_awaited_once_with(address=3, count=2)
+
+    client.read_holding_registers.return_value = response([238, 377])
+    assert asyncio.run(device.set_temperature_limits(75.0, 100.0)) is True
+    client.write_registers.assert_awaited_once_with(address=3, values=[238, 377])
+    client.write_register.assert_not_awaited()
+
+
+def test_session_call_reuses_device(mock_async_client):
+    session = AsyncModbusSession(call_timeout=1)
+
+    async def scenario():
+        first = await session.call("read_operating_status")
+        second = await session.call("read_operating_status")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    assert first["current_setpoint"] == 90.0
+    mock_async_client.assert_called_once()
+    assert session.health()["state"] == CONNECTED
+    session.close()
+    mock_async_client.return_value.close.assert_called_once()
+
+
+def test_session_call_timeout(mock_async_client):
+    async def stall(**kwargs):
+        await asyncio.sleep(1)
+
+    mock_async_client.return_value.read_holding_registers.side_effect = stall
+    session = AsyncModbusSession(call_timeout=0.05)
+
+    with pytest.raises(BusTimeout, match="modbus bus call timed out"):
+        asyncio.run(session.call("read_operating_status"))
+    assert session.health()["consecutive_failures"] == 1
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from chronos.executor import BusExecutor, BusTimeout
+
+
+@pytest.fixture
+def bus():
+    bus = BusExecutor("test", timeout=1)
+    yield bus
+    bus.shutdown()
+
+
+def test_run_returns_result(bus):
+    assert asyncio.run(bus.run(lambda a, b=0: a + b, 1, b=2)) == 3
+
+
+def test_run_uses_named_bus_thread(bus):
+    name = asyncio.run(bus.run(lambda: threading.current_thread().name))
+    assert name.startswith("test-bus")
+    assert name != threading.main_thread().name
+
+
+def test_calls_on_one_bus_are_serialized(bus):
+    active = []
+    overlaps = []
+
+    def call():
+        active.append(1)
+        overlaps.append(len(active))
+        time.sleep(0.02)
+        active.pop()
+
+    async def scenario():
+        await asyncio.gather(*(bus.run(call) for _ in range(4)))
+
+    asyncio.run(scenario())
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_timeout_raises_bus_timeout(bus):
+    with pytest.raises(BusTimeout, match="test bus call timed out"):
+        asyncio.run(bus.run(time.sleep, 0.5, timeout=0.05))
+
+
+def test_timed_out_queued_call_is_dropped(bus):
+    calls = []
+
+    async def scenario():
+        blocker = asyncio.ensure_future(bus.run(time.sleep, 0.2))
+        await asyncio.sleep(0)
+        with pytest.raises(BusTimeout):
+            await bus.run(calls.append, "queued", timeout=0.05)
+        await blocker
+
+    asyncio.run(scenario())
+    assert calls == []
+
+
+def test_exceptions_propagate(bus):
+    def fail():
+        raise ValueError("bad frame")
+
+    with pytest.raises(ValueError, match="bad frame"):
+        asyncio.run(bus.run(fail))
+
+
+def test_slow_boiler_does_not_block_other_endpoints(
+    mock_modbus_device, mock_serial_devices, monkeypatch
+):
+    """A stalled Modbus read must not hold up requests served from other buses."""
+    from chronos.app import app
+
+    monkeypatch.setattr("chronos.app.MOCK_DEVICES", False)
+    mock_modbus_device.read_operating_status.side_effect = lambda: time.sleep(0.5)
+    monkeypatch.setattr("chronos.app.sensor_sampler.read", lambda *args, **kw: 42.0)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            slow = asyncio.ensure_future(
+                ac.get("/boiler_status", params={"max_age": 0})
+            )
+            await asyncio.sleep(0.05)
+            start = time.monotonic()
+            response = await ac.get("/get_data")
+            elapsed = time.monotonic() - start
+            await slow
+        return response, elapsed
+
+    response, elapsed = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert response.json()["sensors"]["return_temp"] == 42.0
+    assert elapsed < 0.4
@@ -189,10 +189,17 @@ def test_set_boiler_setpoint_success(device, mock_modbus_client):
     mock_modbus_client.return_value.write_register.return_value = MagicMock(
         isError=lambda: False
     )
+    # The setpoint register reads back the percentage written
+    mock_modbus_client.return_value.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[54]
+    )
 
     # Test with 90°F which maps to 54%
     success = device.set_boiler_setpoint(90)
     assert success is True
+    mock_modbus_client.return_value.read_holding_registers.assert_called_once_with(
+        address=2, count=1
+    )
 
     # Verify both writes occurred:
     # 1. Write mode 4 (manual operation) to register 0
@@ -202,6 +209,17 @@ def test_set_boiler_setpoint_success(device, mock_modbus_client):
     mock_modbus_client.return_value.write_register.assert_any_call(2, 54)  # Setpoint
 
 
+def test_set_boiler_setpoint_read_back_mismatch(device, mock_modbus_client):
+    client = mock_modbus_client.return_value
+    client.write_register.return_value = MagicMock(isError=lambda: False)
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[40]
+    )
+
+    with pytest.raises(ModbusException, match="wrote 54%, read 40"):
+        device.set_boiler_setpoint(90)
+
+
 def test_set_boiler_setpoint_invalid_range(device, mock_modbus_client):
     """Test setpoint validation.
 
@@ -634,16 +652,7 @@ def test_setpoint_change_state_sequence(device, mock_modbus_client):
     # Setup mocks
     mock_modbus_client.return_value.write_register.side_effect = capture_state
     mock_modbus_client.return_value.read_holding_registers.return_value = MagicMock(
-        isError=lambda: False,
-        registers=[
-            4,
-            1,
-            expected_percentage,
-            120,
-            180,
-            0,
-            220,
-        ],  # Mode 4 = Manual Operation
+        isError=lambda: False, registers=[expected_percentage]
     )
     mock_modbus_client.return_value.read_input_registers.return_value = MagicMock(
         isError=lambda: False, registers=[1, 1, 1, 86, 0, 180, 160, 200, 66]
@@ -804,3 +813,67 @@ def test_read_boiler_data_all_retries_fail(mock_modbus_device):
     assert (
         mock_modbus_device.client.read_holding_registers.call_count == 3
     )  # Verify retry count
+
+
+def test_get_temperature_limits_single_read(device, mock_modbus_client):
+    """Both soft limits come back from one two-register read."""
+    client = mock_modbus_client.return_value
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[200, 400]
+    )
+
+    limits = device.get_temperature_limits()
+
+    assert limits == {"min_setpoint": 68.0, "max_setpoint": 104.0}
+    client.read_holding_registers.assert_called_once_with(address=3, count=2)
+
+
+def test_get_temperature_limits_falls_back_to_single_reads(device, mock_modbus_client):
+    client = mock_modbus_client.return_value
+    client.read_holding_registers.side_effect = [
+        MagicMock(isError=lambda: True),
+        MagicMock(isError=lambda: False, registers=[200]),
+        MagicMock(isError=lambda: False, registers=[400]),
+    ]
+
+    limits = device.get_temperature_limits()
+
+    assert limits == {"min_setpoint": 68.0, "max_setpoint": 104.0}
+    assert client.read_holding_registers.call_count == 3
+
+
+def test_set_temperature_limits_single_write_verified(device, mock_modbus_client):
+    """Limits are written with one FC16 request and checked with one read."""
+    client = mock_modbus_client.return_value
+    client.write_registers.return_value = MagicMock(isError=lambda: False)
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[238, 377]
+    )
+
+    assert device.set_temperature_limits(75.0, 100.0) is True
+    client.write_registers.assert_called_once_with(address=3, values=[238, 377])
+    client.write_register.assert_not_called()
+    client.read_holding_registers.assert_called_once_with(address=3, count=2)
+
+
+def test_set_temperature_limits_falls_back_to_single_writes(device, mock_modbus_client):
+    client = mock_modbus_client.return_value
+    client.write_registers.return_value = MagicMock(isError=lambda: True)
+    client.write_register.return_value = MagicMock(isError=lambda: False)
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[238, 377]
+    )
+
+    assert device.set_temperature_limits(75.0, 100.0) is True
+    client.write_register.assert_any_call(address=3, value=238)
+    client.write_register.assert_any_call(address=4, value=377)
+
+
+def test_set_temperature_limits_read_back_mismatch(device, mock_modbus_client):
+    client = mock_modbus_client.return_value
+    client.write_registers.return_value = MagicMock(isError=lambda: False)
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[200, 400]
+    )
+
+    assert device.set_temperature_limits(75.0, 100.0) is False
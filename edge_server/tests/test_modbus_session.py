@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock
+
+import pytest
+from chronos.devices import ModbusException
+from chronos.modbus_session import CONNECTED, DEGRADED, DISCONNECTED, ModbusSession
+
+
+@pytest.fixture
+def session(mock_modbus_client):
+    """Provide a ModbusSession backed by the mocked ModbusSerialClient."""
+    session = ModbusSession(port="/dev/ttyUSB0", keepalive_interval=30)
+    yield session
+    session.close()
+
+
+def test_session_is_lazy(session, mock_modbus_client):
+    """The port is not opened until the session is first borrowed."""
+    mock_modbus_client.assert_not_called()
+    assert session.health()["state"] == DISCONNECTED
+
+
+def test_connection_reuses_port(session, mock_modbus_client):
+    """Consecutive borrows share one client instead of reopening the port."""
+    with session.connection() as first:
+        pass
+    with session.connection() as second:
+        pass
+
+    assert first is second
+    mock_modbus_client.assert_called_once()
+    mock_modbus_client.return_value.connect.assert_called_once()
+    mock_modbus_client.return_value.close.assert_not_called()
+    assert session.health()["state"] == CONNECTED
+
+
+def test_connection_reconnects_after_loss(session, mock_modbus_client):
+    """A dropped port is reopened on the next borrow."""
+    client = mock_modbus_client.return_value
+    with session.connection():
+        pass
+
+    client.is_socket_open.return_value = False
+
+    def reconnect():
+        client.is_socket_open.return_value = True
+        return True
+
+    client.connect.side_effect = reconnect
+
+    with session.connection() as device:
+        assert device.is_connected()
+    assert client.connect.call_count == 2
+    mock_modbus_client.assert_called_once()
+
+
+def test_connection_failure_raises(session, mock_modbus_client):
+    """Borrowing fails with ModbusException when the port cannot be opened."""
+    client = mock_modbus_client.return_value
+    client.connect.return_value = False
+    client.is_socket_open.return_value = False
+
+    with pytest.raises(ModbusException, match="Failed to connect"):
+        with session.connection():
+            pass
+
+    health = session.health()
+    assert health["state"] == DISCONNECTED
+    assert health["consecutive_failures"] == 1
+    assert "Failed to connect" in health["last_error"]
+
+
+def test_error_in_block_marks_degraded(session, mock_modbus_client):
+    """Errors raised while borrowed are recorded and cleared by a later success."""
+    with pytest.raises(ModbusException):
+        with session.connection():
+            raise ModbusException("Timeout")
+
+    assert session.health()["state"] == DEGRADED
+    assert "Timeout" in session.health()["last_error"]
+
+    with session.connection():
+        pass
+    assert session.health()["state"] == CONNECTED
+    assert session.health()["consecutive_failures"] == 0
+
+
+def test_keepalive_probes_idle_link(session, mock_modbus_client):
+    """Keepalive issues a single register read once the session is idle."""
+    client = mock_modbus_client.return_value
+    client.read_holding_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[1]
+    )
+
+    assert session.keepalive() is True
+    client.read_holding_registers.assert_called_once_with(address=0, count=1)
+
+    # Recently used, so no additional traffic
+    assert session.keepalive() is True
+    client.read_holding_registers.assert_called_once()
+
+
+def test_keepalive_reports_failure(session, mock_modbus_client):
+    """A failing keepalive read is reported and recorded in the health state."""
+    client = mock_modbus_client.return_value
+    client.read_holding_registers.return_value = MagicMock(isError=lambda: True)
+
+    assert session.keepalive() is False
+    assert session.health()["consecutive_failures"] == 1
+
+
+def test_close_releases_port(session, mock_modbus_client):
+    with session.connection():
+        pass
+    session.close()
+    mock_modbus_client.return_value.close.assert_called_once()
+    assert session.health()["connected"] is False
+
+
+def test_modbus_health_endpoint(client):
+    response = client.get("/modbus_health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["state"] in (CONNECTED, DEGRADED, DISCONNECTED)
+    assert data["port"] == "/dev/ttyUSB0"
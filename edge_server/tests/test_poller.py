@@ -0,0 +1,149 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from chronos.poller import BoilerPoller, BoilerSnapshot
+
+BOILER_DATA = {
+    "operating_mode": 3,
+    "operating_mode_str": "DHW Demand",
+    "cascade_mode": 0,
+    "cascade_mode_str": "Single Boiler",
+    "current_setpoint": 90.0,
+    "system_supply_temp": 154.4,
+    "outlet_temp": 158.0,
+    "inlet_temp": 149.0,
+    "flue_temp": 176.0,
+    "cascade_current_power": 50.0,
+    "lead_firing_rate": 75.0,
+    "pump_status": True,
+    "flame_status": True,
+}
+
+
+@pytest.fixture
+def session():
+    """Provide a ModbusSession stand-in whose device returns BOILER_DATA."""
+    device = MagicMock()
+    device.read_boiler_data.return_value = dict(BOILER_DATA)
+    session = MagicMock()
+    session.call.side_effect = lambda method, *args: getattr(device, method)(*args)
+    session.device = device
+    return session
+
+
+def test_snapshot_is_immutable(session):
+    poller = BoilerPoller(session)
+    snapshot = asyncio.run(poller.refresh())
+
+    assert isinstance(snapshot, BoilerSnapshot)
+    assert snapshot.data["outlet_temp"] == 158.0
+    with pytest.raises(TypeError):
+        snapshot.data["outlet_temp"] = 0
+    with pytest.raises(AttributeError):
+        snapshot.timestamp = 0
+
+
+def test_get_serves_fresh_snapshot_from_memory(session):
+    poller = BoilerPoller(session, max_age=60)
+    first = asyncio.run(poller.get())
+    second = asyncio.run(poller.get())
+
+    assert first is second
+    session.device.read_boiler_data.assert_called_once()
+
+
+def test_get_max_age_zero_forces_read(session):
+    poller = BoilerPoller(session, max_age=60)
+    asyncio.run(poller.get())
+    time.sleep(0.01)
+    asyncio.run(poller.get(max_age=0))
+
+    assert session.device.read_boiler_data.call_count == 2
+
+
+def test_stale_snapshot_is_not_latest(session):
+    poller = BoilerPoller(session, max_age=60)
+    asyncio.run(poller.refresh())
+    assert poller.latest() is not None
+    assert poller.latest(max_age=-1) is None
+
+
+def test_failed_read_keeps_previous_snapshot(session):
+    poller = BoilerPoller(session)
+    previous = asyncio.run(poller.refresh())
+    session.device.read_boiler_data.return_value = None
+
+    assert asyncio.run(poller.refresh()) is None
+    assert poller.snapshot is previous
+
+
+def test_concurrent_refreshes_are_coalesced(session):
+    def slow_read():
+        time.sleep(0.05)
+        return dict(BOILER_DATA)
+
+    session.device.read_boiler_data.side_effect = slow_read
+    poller = BoilerPoller(session, max_age=60)
+
+    async def scenario():
+        return await asyncio.gather(*(poller.get() for _ in range(5)))
+
+    snapshots = asyncio.run(scenario())
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    session.device.read_boiler_data.assert_called_once()
+
+
+def test_async_session_is_awaited_directly():
+    session = MagicMock()
+    session.call = AsyncMock(return_value=dict(BOILER_DATA))
+    executor = MagicMock()
+    poller = BoilerPoller(session, executor=executor)
+
+    snapshot = asyncio.run(poller.refresh())
+    assert snapshot.data["outlet_temp"] == 158.0
+    session.call.assert_awaited_once_with("read_boiler_data")
+    executor.run.assert_not_called()
+
+
+def test_background_polling(session):
+    poller = BoilerPoller(session, interval=0.01)
+
+    async def scenario():
+        poller.start()
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+    asyncio.run(scenario())
+    assert session.device.read_boiler_data.call_count >= 2
+    assert poller.snapshot is not None
+
+
+def test_boiler_endpoints_serve_snapshot(client, mock_modbus_device, monkeypatch):
+    """Stats and status are served from the published snapshot when fresh."""
+    from chronos.app import boiler_poller
+
+    monkeypatch.setattr("chronos.app.MOCK_DEVICES", False)
+    mock_modbus_device.read_boiler_data.return_value = dict(BOILER_DATA)
+
+    response = client.get("/boiler_stats")
+    assert response.status_code == 200
+    assert response.json()["outlet_temp"] == 158.0
+    assert response.json()["timestamp"] == boiler_poller.snapshot.timestamp
+
+    response = client.get("/boiler_status")
+    assert response.status_code == 200
+    assert response.json()["operating_mode"] == 3
+    mock_modbus_device.read_operating_status.assert_not_called()
+
+    client.get("/boiler_stats")
+    mock_modbus_device.read_boiler_data.assert_called_once()
+
+    client.get("/boiler_stats", params={"max_age": 0})
+    assert mock_modbus_device.read_boiler_data.call_count == 2
+
+
+def test_boiler_stats_rejects_negative_max_age(client):
+    response = client.get("/boiler_stats", params={"max_age": -1})
+    assert response.status_code == 422
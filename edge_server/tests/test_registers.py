@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+import pytest
+from chronos.registers import (
+    BOILER_REGISTERS,
+    BOILER_STATS,
+    HOLDING,
+    INPUT,
+    Register,
+    RegisterMap,
+)
+
+REGISTERS = RegisterMap(
+    [
+        Register("a", 0, HOLDING),
+        Register("b", 1, HOLDING),
+        Register("c", 6, HOLDING),
+        Register("d", 40, HOLDING),
+        Register("e", 3, INPUT, "bool"),
+        Register("f", 8, INPUT, "temperature", 10, "°F"),
+    ]
+)
+
+
+def test_plan_coalesces_contiguous_and_gapped_registers():
+    blocks = REGISTERS.plan(["c", "a", "b", "f", "e"])
+
+    assert [(b.kind, b.address, b.count) for b in blocks] == [
+        (HOLDING, 0, 7),
+        (INPUT, 3, 6),
+    ]
+    assert [r.name for r in blocks[0].registers] == ["a", "b", "c"]
+
+
+def test_plan_respects_max_span():
+    blocks = REGISTERS.plan(["a", "b", "c", "d"], max_span=7)
+    assert [(b.address, b.count) for b in blocks] == [(0, 7), (40, 1)]
+
+    blocks = REGISTERS.plan(["a", "c"], max_span=6)
+    assert [(b.address, b.count) for b in blocks] == [(0, 1), (6, 1)]
+
+
+def test_plan_rejects_unknown_register_and_bad_span():
+    with pytest.raises(KeyError):
+        REGISTERS.plan(["missing"])
+    with pytest.raises(ValueError):
+        REGISTERS.plan(["a"], max_span=0)
+
+
+def test_block_decode():
+    block = REGISTERS.plan(["e", "f"])[0]
+    assert block.decode([1, 0, 0, 0, 0, 220]) == {"e": True, "f": 71.6}
+
+
+def test_temperature_encode_round_trips():
+    register = BOILER_REGISTERS["max_setpoint"]
+    assert register.encode(104.0) == 400
+    assert register.decode(register.encode(104.0)) == 104.0
+
+
+def test_duplicate_names_rejected():
+    with pytest.raises(ValueError, match="Duplicate"):
+        RegisterMap([Register("a", 0, HOLDING), Register("a", 1, INPUT)])
+
+
+def test_boiler_stats_take_two_transactions():
+    blocks = BOILER_REGISTERS.plan(BOILER_STATS)
+    assert [(b.kind, b.address, b.count) for b in blocks] == [
+        (HOLDING, 0, 7),
+        (INPUT, 3, 9),
+    ]
+
+
+def test_extra_registers_share_a_transaction(device, mock_modbus_client):
+    client = mock_modbus_client.return_value
+    client.read_input_registers.return_value = MagicMock(
+        isError=lambda: False, registers=[1200, 3400, 0, 2800]
+    )
+
+    values = device.read_registers(["runtime", "ignition_count", "fan_speed"])
+
+    assert values == {"runtime": 1200, "ignition_count": 3400, "fan_speed": 2800}
+    client.read_input_registers.assert_called_once_with(address=12, count=4)
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from chronos.devices import RelayBus, SerialDevice
+from chronos.relay_state import DriftEvent, RelayStateCache
+from serial import SerialException
+
+
+@pytest.fixture
+def board():
+    """A relay board stand-in whose states the tests can flip."""
+    board = MagicMock()
+    board.states = {0: True, 1: False}
+    board.read_all.side_effect = lambda: dict(board.states)
+    return board
+
+
+def test_readings_served_from_cache_within_ttl(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+
+    async def scenario():
+        await cache.get_all()
+        board.states[0] = False
+        return await cache.get(0)
+
+    reading = asyncio.run(scenario())
+    assert reading.state is True
+    board.read_all.assert_called_once()
+
+
+def test_expired_readings_are_refreshed(board):
+    cache = RelayStateCache(board.read_all, ttl=0)
+
+    async def scenario():
+        await cache.get_all()
+        await asyncio.sleep(0.01)
+        return await cache.get_all()
+
+    asyncio.run(scenario())
+    assert board.read_all.call_count == 2
+
+
+def test_write_through_updates_cache(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+    cache.record(1, True)
+
+    reading = asyncio.run(cache.get(1))
+    assert reading.state is True
+    board.read_all.assert_not_called()
+
+
+def test_reconcile_emits_drift_events(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+    received = []
+    cache.subscribe(received.append)
+
+    async def scenario():
+        await cache.refresh()
+        board.states[1] = True
+        await cache.refresh()
+
+    asyncio.run(scenario())
+    assert len(received) == 1
+    event = received[0]
+    assert (event.relay, event.expected, event.actual) == (1, False, True)
+    assert list(cache.events) == received
+
+
+def test_write_during_refresh_is_not_overwritten(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+
+    def read_then_written():
+        states = dict(board.states)
+        cache.record(1, True)  # lands while the read is in flight
+        return states
+
+    board.read_all.side_effect = read_then_written
+    readings = asyncio.run(cache.refresh())
+
+    assert readings[1].state is True
+    assert not cache.events
+
+
+def test_concurrent_refreshes_share_one_read(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+
+    def slow_read():
+        time.sleep(0.05)
+        return dict(board.states)
+
+    board.read_all.side_effect = slow_read
+
+    async def scenario():
+        return await asyncio.gather(*(cache.refresh() for _ in range(3)))
+
+    results = asyncio.run(scenario())
+    board.read_all.assert_called_once()
+    assert results[0] == results[1] == results[2]
+
+
+def test_invalidate_forces_a_board_read(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+    asyncio.run(cache.refresh())
+    board.states[0] = False
+
+    cache.invalidate()
+    reading = asyncio.run(cache.get(0))
+
+    assert reading.state is False
+    assert board.read_all.call_count == 2
+    # The switch was expected, not drift
+    assert not cache.events
+
+
+def test_refresh_in_flight_across_invalidate_is_not_stored(board):
+    cache = RelayStateCache(board.read_all, ttl=60)
+
+    def read_then_switched():
+        states = dict(board.states)
+        board.states[0] = False
+        cache.invalidate()  # a switch lands while the read is in flight
+        return states
+
+    board.read_all.side_effect = read_then_switched
+    asyncio.run(cache.refresh())
+
+    assert cache.readings == {}
+
+
+def test_switch_state_invalidates_cache(client, mock_serial_devices, monkeypatch):
+    from chronos.app import relay_states
+
+    monkeypatch.setattr("chronos.app.MOCK_DEVICES", False)
+    relay_states.record(0, True)
+
+    response = client.post("/switch_state", json={"command": "off"})
+
+    assert response.status_code == 200
+    mock_serial_devices[0].switch_state.assert_called_once_with("off", False)
+    assert relay_states.readings == {}
+
+
+def test_failed_refresh_serves_stale_readings(board):
+    cache = RelayStateCache(board.read_all, ttl=0)
+    asyncio.run(cache.refresh())
+    board.read_all.side_effect = OSError("port gone")
+
+    readings = asyncio.run(cache.get_all())
+    assert readings[0].state is True
+    assert cache.is_stale(readings[0])
+
+
+def test_failed_refresh_without_cache_raises(board):
+    board.read_all.side_effect = OSError("port gone")
+    with pytest.raises(OSError):
+        asyncio.run(RelayStateCache(board.read_all).get_all())
+
+
+def test_background_reconciliation(board):
+    cache = RelayStateCache(board.read_all, reconcile_interval=0.01)
+
+    async def scenario():
+        cache.start()
+        await asyncio.sleep(0.1)
+        await cache.stop()
+
+    asyncio.run(scenario())
+    assert board.read_all.call_count >= 2
+
+
+def test_device_endpoints_report_staleness(client, mock_serial_devices):
+    from chronos.app import relay_port
+
+    response = client.get("/get_all_devices_state")
+    assert response.status_code == 200
+    devices = response.json()
+    assert [d["state"] for d in devices] == [True] * 5
+    assert all(d["timestamp"] is not None and d["stale"] is False for d in devices)
+
+    response = client.post("/device_state", json={"id": 2, "state": False})
+    assert response.status_code == 200
+    assert response.json()["state"] is False
+
+    response = client.get("/device_state", params={"device": 2})
+    assert response.json()["state"] is False
+    relay_port.read_all.assert_called_once()
+
+
+@patch("chronos.devices.Serial")
+def test_failed_write_is_not_recorded(mock_serial, client, monkeypatch):
+    from chronos.app import relay_states
+
+    mock_serial.return_value.write.side_effect = SerialException("port gone")
+    bus = RelayBus("/dev/ttyACM0")
+    devices = [SerialDevice(id=i, bus=bus) for i in range(5)]
+    monkeypatch.setattr("chronos.app.DEVICES", devices)
+    monkeypatch.setattr("chronos.app.MOCK_DEVICES", False)
+    relay_states.record(2, True)
+
+    response = client.post("/device_state", json={"id": 2, "state": False})
+
+    assert response.status_code == 500
+    assert 2 not in relay_states.readings
+    assert devices[2]._state is None
+
+
+def test_relay_port_failure_is_not_read_as_off(mock_serial_devices):
+    from chronos.app import read_device_states, relay_port
+
+    relay_port.read_all.side_effect = OSError("port gone")
+    relay_port.read.side_effect = OSError("port gone")
+    cache = RelayStateCache(read_device_states, ttl=0)
+    cache.record(0, True)
+
+    readings = asyncio.run(cache.get_all())
+    assert readings[0].state is True
+    assert cache.is_stale(readings[0])
+    assert not cache.events
+    for device in mock_serial_devices:
+        device.read_state_from_device.assert_not_called()
+
+
+def test_relay_drift_endpoint(client):
+    from chronos.app import relay_states
+
+    relay_states._emit(DriftEvent(relay=0, expected=False, actual=True, timestamp=1.0))
+    response = client.get("/relay_drift")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"relay": 0, "expected": False, "actual": True, "timestamp": 1.0}
+    ]
@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import pytest
+from chronos.devices import read_temperature_sensor
+from chronos.executor import BusExecutor
+from chronos.sensors import SensorReading, SensorSampler
+
+SENSORS = {"return_temp": "28-a", "water_out_temp": "28-b"}
+
+
+@pytest.fixture
+def bus():
+    bus = BusExecutor("sensor-test", timeout=1, max_workers=len(SENSORS))
+    yield bus
+    bus.shutdown()
+
+
+def write_sensor(mount_point, sensor_id, crc="YES", millidegrees=25000):
+    sensor_dir = mount_point / sensor_id
+    sensor_dir.mkdir(parents=True, exist_ok=True)
+    (sensor_dir / "w1_slave").write_text(
+        f"72 01 4b 46 7f ff 0e 10 57 : crc=57 {crc}\n"
+        f"72 01 4b 46 7f ff 0e 10 57 t={millidegrees}\n"
+    )
+
+
+def test_read_temperature_sensor(tmp_path, monkeypatch):
+    monkeypatch.setattr("chronos.devices.cfg.sensors.mount_point", str(tmp_path))
+    write_sensor(tmp_path, "28-a")
+    assert read_temperature_sensor("28-a") == 77.0
+
+
+def test_read_temperature_sensor_retries_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr("chronos.devices.cfg.sensors.mount_point", str(tmp_path))
+    write_sensor(tmp_path, "28-a", crc="NO")
+
+    with pytest.raises(IOError, match="CRC check failed"):
+        read_temperature_sensor("28-a", max_attempts=3, retry_delay=0)
+
+
+def test_sensors_are_sampled_concurrently(bus):
+    def slow_read(sensor_id, **kwargs):
+        time.sleep(0.2)
+        return 70.0
+
+    sampler = SensorSampler(SENSORS, executor=bus, read=slow_read)
+    start = time.monotonic()
+    snapshot = asyncio.run(sampler.sample())
+
+    assert time.monotonic() - start < 0.35
+    assert {name: r.value for name, r in snapshot.items()} == {
+        "return_temp": 70.0,
+        "water_out_temp": 70.0,
+    }
+
+
+def test_failed_sample_keeps_last_good_value(bus):
+    values = {"28-a": [70.0, IOError("gone")], "28-b": [80.0, 81.0]}
+
+    def read(sensor_id, **kwargs):
+        value = values[sensor_id].pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    sampler = SensorSampler(SENSORS, executor=bus, read=read)
+    first = asyncio.run(sampler.sample())
+    second = asyncio.run(sampler.sample())
+
+    assert second["return_temp"].value == 70.0
+    assert second["return_temp"].timestamp == first["return_temp"].timestamp
+    assert second["return_temp"].error == "gone"
+    assert second["water_out_temp"].value == 81.0
+    assert second["water_out_temp"].error is None
+
+
+def test_slow_sensor_times_out_without_delaying_others():
+    bus = BusExecutor("sensor-test", timeout=0.1, max_workers=len(SENSORS))
+
+    def read(sensor_id, **kwargs):
+        if sensor_id == "28-a":
+            time.sleep(0.3)
+        return 72.0
+
+    sampler = SensorSampler(SENSORS, executor=bus, read=read)
+    snapshot = asyncio.run(sampler.sample())
+    bus.shutdown()
+
+    assert snapshot["return_temp"].value is None
+    assert "timed out" in snapshot["return_temp"].error
+    assert snapshot["water_out_temp"].value == 72.0
+
+
+def test_values_are_served_from_snapshot(bus):
+    calls = []
+
+    def read(sensor_id, **kwargs):
+        calls.append(sensor_id)
+        return 75.0
+
+    sampler = SensorSampler(SENSORS, executor=bus, read=read)
+    assert asyncio.run(sampler.values()) == {
+        "return_temp": 75.0,
+        "water_out_temp": 75.0,
+    }
+    asyncio.run(sampler.values())
+    assert len(calls) == 2
+
+
+def test_values_expire_after_max_age(bus):
+    values = {"28-a": [70.0, IOError("gone")], "28-b": [80.0, 81.0]}
+
+    def read(sensor_id, **kwargs):
+        value = values[sensor_id].pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    sampler = SensorSampler(SENSORS, max_age=10, executor=bus, read=read)
+    asyncio.run(sampler.sample())
+    asyncio.run(sampler.sample())
+    assert asyncio.run(sampler.values())["return_temp"] == 70.0
+
+    # Age the failing sensor's last good value past max_age
+    reading = sampler._readings["return_temp"]
+    sampler._readings["return_temp"] = SensorReading(
+        value=reading.value, timestamp=time.time() - 11, error=reading.error
+    )
+
+    assert asyncio.run(sampler.values()) == {
+        "return_temp": None,
+        "water_out_temp": 81.0,
+    }
@@ -0,0 +1,63 @@
+import pytest
+from chronos.telemetry import RingBuffer
+
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = RingBuffer(["a"], capacity=3)
+    for i in range(5):
+        buffer.append(float(i), {"a": i * 10})
+
+    assert len(buffer) == 3
+    assert buffer.since() == {
+        "timestamp": [2.0, 3.0, 4.0],
+        "columns": {"a": [20.0, 30.0, 40.0]},
+    }
+
+
+def test_since_and_limit():
+    buffer = RingBuffer(["a"], capacity=4)
+    for i in range(6):
+        buffer.append(float(i), {"a": i})
+
+    assert buffer.since(3.0)["timestamp"] == [4.0, 5.0]
+    assert buffer.since(1.5)["timestamp"] == [2.0, 3.0, 4.0, 5.0]
+    assert buffer.since(9.0)["timestamp"] == []
+    assert buffer.since(limit=1)["timestamp"] == [5.0]
+
+
+def test_missing_values_and_booleans():
+    buffer = RingBuffer(["temp", "flame"], capacity=2)
+    buffer.append(1.0, {"flame": True, "ignored": "x"})
+
+    assert buffer.since()["columns"] == {"temp": [None], "flame": [1.0]}
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(["a"], capacity=0)
+
+
+def test_telemetry_endpoint_records_polled_samples(
+    client, mock_modbus_device, monkeypatch
+):
+    from chronos.app import boiler_poller
+
+    monkeypatch.setattr("chronos.app.MOCK_DEVICES", False)
+    client.get("/boiler_stats")
+    timestamp = boiler_poller.snapshot.timestamp
+
+    response = client.get("/telemetry", params={"source": "boiler"})
+    assert response.status_code == 200
+    boiler = response.json()["boiler"]
+    assert boiler["timestamp"] == [timestamp]
+    assert boiler["columns"]["outlet_temp"] == [158.0]
+    assert boiler["columns"]["flame_status"] == [1.0]
+
+    response = client.get("/telemetry", params={"since": timestamp})
+    assert response.json()["boiler"]["timestamp"] == []
+    assert response.json()["sensors"]["timestamp"] == []
+
+
+def test_telemetry_endpoint_rejects_unknown_source(client):
+    response = client.get("/telemetry", params={"source": "chiller"})
+    assert response.status_code == 422